@@ -11,23 +11,36 @@ import json
 from pathlib import Path
 from datetime import datetime, date
 
-# Add src to path
 sentinel_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(sentinel_root / 'src'))
 
-from memory.semantic_indexer import SemanticIndexer
+from memory.semantic_indexer import PERFORMANCE_PRAGMAS, SemanticIndexer
 from memory.memory_manager import MemoryManager
+from memory.skill_daemon import get_socket_path, request, serve
 
 
-def main():
-    """Execute memory janitor skill."""
-    # Parse parameters from command line args
-    params = {}
-    for arg in sys.argv[1:]:
-        if '=' in arg:
-            key, value = arg.split('=', 1)
-            params[key.lstrip('-')] = value
+def create_manager() -> MemoryManager:
+    """Create the memory manager and its indexer."""
+    memory_dir = sentinel_root / "memory"
+    db_path = sentinel_root / "sentinel_memory.db"
+
+    indexer = SemanticIndexer(
+        db_path=str(db_path),
+        chunk_size=400,
+        chunk_overlap=80,
+        pragmas=PERFORMANCE_PRAGMAS
+    )
+
+    return MemoryManager(memory_dir, indexer)
 
+
+def run(params: dict, manager: MemoryManager = None):
+    """
+    Distill a daily log and print the JSON result.
+
+    Args:
+        params: Skill parameters
+        manager: Existing memory manager to reuse (created if None)
+    """
     # Get parameters
     date_str = params.get('date', date.today().isoformat())
     dry_run = params.get('dry_run', 'false').lower() == 'true'
@@ -43,18 +56,10 @@ def main():
         }))
         sys.exit(1)
 
-    # Initialize
-    memory_dir = sentinel_root / "memory"
-    db_path = sentinel_root / "sentinel_memory.db"
-
     try:
-        indexer = SemanticIndexer(
-            db_path=str(db_path),
-            chunk_size=400,
-            chunk_overlap=80
-        )
-
-        manager = MemoryManager(memory_dir, indexer)
+        # Initialize
+        if manager is None:
+            manager = create_manager()
 
         # Run distillation
         result = manager.distill_daily_log(
@@ -81,7 +86,11 @@ def main():
             "applied": result.applied
         }
 
-        print(json.dumps(output, indent=2))
+        # Pretty-print for humans, compact when piped to another process
+        if sys.stdout.isatty():
+            print(json.dumps(output, indent=2))
+        else:
+            print(json.dumps(output, separators=(',', ':')))
 
     except Exception as e:
         print(json.dumps({
@@ -91,5 +100,37 @@ def main():
         sys.exit(1)
 
 
+def main():
+    """Execute memory janitor skill."""
+    # Parse parameters from command line args
+    params = {}
+    flags = set()
+    for arg in sys.argv[1:]:
+        if '=' in arg:
+            key, value = arg.split('=', 1)
+            params[key.lstrip('-')] = value
+        else:
+            flags.add(arg.lstrip('-'))
+
+    socket_path = get_socket_path("memory-janitor")
+
+    if 'client' in flags:
+        # Forward to a running daemon, which keeps the model loaded
+        try:
+            sys.stdout.write(request(params, socket_path))
+        except OSError:
+            # No socket, or a stale one left by a daemon that died
+            print(json.dumps({
+                "success": False,
+                "error": f"No memory-janitor daemon running at {socket_path}"
+            }))
+            sys.exit(1)
+    elif 'daemon' in flags:
+        manager = create_manager()
+        serve(lambda daemon_params: run(daemon_params, manager), socket_path)
+    else:
+        run(params)
+
+
 if __name__ == "__main__":
     main()
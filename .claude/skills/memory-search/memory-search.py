@@ -5,28 +5,70 @@ Memory Search Skill - Semantic search across all memory files.
 Provides hybrid BM25 + Vector search with local embeddings.
 """
 
+import os
 import sys
 import json
 import time
 from pathlib import Path
 
-# Add src to path
 sentinel_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(sentinel_root / 'src'))
 
-from memory.semantic_indexer import SemanticIndexer
+from memory.semantic_indexer import PERFORMANCE_PRAGMAS, SemanticIndexer
+from memory.skill_daemon import get_socket_path, request, serve
 
 
-def main():
-    """Execute memory search skill."""
-    start_time = time.time()
+def write_output(fields: dict, results, start_time: float) -> None:
+    """
+    Stream a success payload to stdout without materializing it.
 
-    # Parse parameters from command line args
-    params = {}
-    for arg in sys.argv[1:]:
-        if '=' in arg:
-            key, value = arg.split('=', 1)
-            params[key.lstrip('-')] = value
+    Writes ``fields`` first, then each result dict as it is produced, then
+    the execution time, using compact separators. On a terminal the
+    payload is pretty-printed instead.
+
+    Args:
+        fields: Top-level fields (must be non-empty)
+        results: Iterable of result dicts
+        start_time: time.time() at skill start
+    """
+    if sys.stdout.isatty():
+        output = {**fields, "results": list(results)}
+        output["execution_time_ms"] = int((time.time() - start_time) * 1000)
+        print(json.dumps(output, indent=2))
+        return
+
+    write = sys.stdout.write
+    separators = (',', ':')
+
+    # Reopen the header object so results can be appended to it
+    write(json.dumps(fields, separators=separators)[:-1])
+    write(',"results":[')
+    for i, item in enumerate(results):
+        if i:
+            write(',')
+        json.dump(item, sys.stdout, separators=separators)
+    write('],"execution_time_ms":%d}\n' % int((time.time() - start_time) * 1000))
+
+
+def create_indexer() -> SemanticIndexer:
+    """Create the indexer over the Sentinel memory database."""
+    db_path = sentinel_root / "sentinel_memory.db"
+    return SemanticIndexer(
+        db_path=str(db_path),
+        chunk_size=400,
+        chunk_overlap=80,
+        pragmas=PERFORMANCE_PRAGMAS
+    )
+
+
+def run(params: dict, indexer: SemanticIndexer = None):
+    """
+    Execute a memory search and print the JSON result.
+
+    Args:
+        params: Skill parameters
+        indexer: Existing indexer to reuse (created if None)
+    """
+    start_time = time.time()
 
     # Get parameters
     query = params.get('query', '')
@@ -43,40 +85,35 @@ def main():
         }))
         sys.exit(1)
 
-    # Initialize indexer
-    db_path = sentinel_root / "sentinel_memory.db"
-
     try:
-        indexer = SemanticIndexer(
-            db_path=str(db_path),
-            chunk_size=400,
-            chunk_overlap=80
-        )
+        # Initialize indexer
+        if indexer is None:
+            indexer = create_indexer()
 
         # Handle recent context query
         if recent_days is not None:
             days = int(recent_days)
             chunks = indexer.get_recent_context(days=days)
 
-            output = {
-                "success": True,
-                "mode": "recent_context",
-                "days": days,
-                "results_count": len(chunks),
-                "results": [
+            write_output(
+                {
+                    "success": True,
+                    "mode": "recent_context",
+                    "days": days,
+                    "results_count": len(chunks),
+                },
+                (
                     {
-                        "file": Path(c.file_path).name,
+                        "file": os.path.basename(c.file_path),
                         "file_type": c.file_type,
                         "chunk_text": c.chunk_text[:300] + "..." if len(c.chunk_text) > 300 else c.chunk_text,
                         "created_at": c.created_at,
                         "chunk_index": c.chunk_index
                     }
                     for c in chunks
-                ],
-                "execution_time_ms": int((time.time() - start_time) * 1000)
-            }
-
-            print(json.dumps(output, indent=2))
+                ),
+                start_time
+            )
             return
 
         # Validate query
@@ -100,27 +137,27 @@ def main():
             results = [r for r in results if r.file_type == file_type]
 
         # Format output
-        output = {
-            "success": True,
-            "query": query,
-            "mode": mode,
-            "file_type_filter": file_type,
-            "results_count": len(results),
-            "results": [
+        write_output(
+            {
+                "success": True,
+                "query": query,
+                "mode": mode,
+                "file_type_filter": file_type,
+                "results_count": len(results),
+            },
+            (
                 {
                     "rank": r.rank,
                     "score": round(r.score, 3),
-                    "file": Path(r.file_path).name,
+                    "file": os.path.basename(r.file_path),
                     "file_type": r.file_type,
                     "chunk_text": r.chunk_text[:300] + "..." if len(r.chunk_text) > 300 else r.chunk_text,
                     "chunk_id": r.chunk_id
                 }
                 for r in results
-            ],
-            "execution_time_ms": int((time.time() - start_time) * 1000)
-        }
-
-        print(json.dumps(output, indent=2))
+            ),
+            start_time
+        )
 
     except Exception as e:
         print(json.dumps({
@@ -131,5 +168,37 @@ def main():
         sys.exit(1)
 
 
+def main():
+    """Execute memory search skill."""
+    # Parse parameters from command line args
+    params = {}
+    flags = set()
+    for arg in sys.argv[1:]:
+        if '=' in arg:
+            key, value = arg.split('=', 1)
+            params[key.lstrip('-')] = value
+        else:
+            flags.add(arg.lstrip('-'))
+
+    socket_path = get_socket_path("memory-search")
+
+    if 'client' in flags:
+        # Forward to a running daemon, which keeps the model loaded
+        try:
+            sys.stdout.write(request(params, socket_path))
+        except OSError:
+            # No socket, or a stale one left by a daemon that died
+            print(json.dumps({
+                "success": False,
+                "error": f"No memory-search daemon running at {socket_path}"
+            }))
+            sys.exit(1)
+    elif 'daemon' in flags:
+        indexer = create_indexer()
+        serve(lambda daemon_params: run(daemon_params, indexer), socket_path)
+    else:
+        run(params)
+
+
 if __name__ == "__main__":
     main()
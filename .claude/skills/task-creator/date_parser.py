@@ -13,6 +13,37 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 
+_WEEKDAYS = {
+    'monday': 0, 'mon': 0,
+    'tuesday': 1, 'tue': 1,
+    'wednesday': 2, 'wed': 2,
+    'thursday': 3, 'thu': 3,
+    'friday': 4, 'fri': 4,
+    'saturday': 5, 'sat': 5,
+    'sunday': 6, 'sun': 6
+}
+
+# Patterns are compiled once at import time; parse_due_date runs per task.
+_WEEKDAY_RE = re.compile(
+    r'\b(next|this)\s+(' + '|'.join(_WEEKDAYS) + r')\b'
+)
+_IN_DAYS_RE = re.compile(r'\bin\s+(\d+)\s+days?\b')
+_IN_WEEKS_RE = re.compile(r'\bin\s+(\d+)\s+weeks?\b')
+_BY_RE = re.compile(r'\bby\s+(next|this)\s+(\w+)')
+_ISO_RE = re.compile(r'\b(\d{4})-(\d{2})-(\d{2})\b')
+
+# Trailing "today"/"tomorrow", then a trailing "by/on/before [next|this] <word>"
+_TITLE_DATE_RE = re.compile(
+    r'(?:\s+(?:tomorrow|today))?(?:\s+(?:by|on|before)\s+(?:next|this)?\s*\w+)?\s*$',
+    re.IGNORECASE
+)
+
+# Every relative pattern above needs at least one of these substrings, so
+# text without any of them can only contain an ISO date.
+_DATE_KEYWORDS = ('day', 'week', 'tomorrow', 'next', 'this')
+_DIGITS = frozenset('0123456789')
+
+
 def parse_due_date(text: str) -> Optional[str]:
     """
     Parse natural language date from text.
@@ -25,74 +56,67 @@ def parse_due_date(text: str) -> Optional[str]:
     """
     text_lower = text.lower()
 
+    if not any(keyword in text_lower for keyword in _DATE_KEYWORDS):
+        return _parse_iso_date(text)
+
+    today = datetime.now().date()
+    current_day = today.weekday()
+
     # Today
     if 'today' in text_lower:
-        return datetime.now().date().isoformat()
+        return today.isoformat()
 
     # Tomorrow
     if 'tomorrow' in text_lower:
-        return (datetime.now().date() + timedelta(days=1)).isoformat()
+        return (today + timedelta(days=1)).isoformat()
 
     # Next week
     if 'next week' in text_lower:
-        return (datetime.now().date() + timedelta(weeks=1)).isoformat()
+        return (today + timedelta(weeks=1)).isoformat()
 
     # This week
     if 'this week' in text_lower:
         # End of this week (Friday)
-        days_until_friday = (4 - datetime.now().weekday()) % 7
-        return (datetime.now().date() + timedelta(days=days_until_friday)).isoformat()
+        days_until_friday = (4 - current_day) % 7
+        return (today + timedelta(days=days_until_friday)).isoformat()
 
     # Weekdays (next Monday, this Friday, etc.)
-    weekdays = {
-        'monday': 0, 'mon': 0,
-        'tuesday': 1, 'tue': 1,
-        'wednesday': 2, 'wed': 2,
-        'thursday': 3, 'thu': 3,
-        'friday': 4, 'fri': 4,
-        'saturday': 5, 'sat': 5,
-        'sunday': 6, 'sun': 6
-    }
-
-    for day_name, day_num in weekdays.items():
-        pattern = rf'\b(next|this)\s+{day_name}\b'
-        match = re.search(pattern, text_lower)
-        if match:
-            modifier = match.group(1)
-            current_day = datetime.now().weekday()
-
-            if modifier == 'next':
-                # Next occurrence of that day
-                days_ahead = (day_num - current_day + 7) % 7
-                if days_ahead == 0:
-                    days_ahead = 7  # Next week if it's the same day
-            else:  # 'this'
-                # This week's occurrence
-                days_ahead = (day_num - current_day) % 7
-
-            target_date = datetime.now().date() + timedelta(days=days_ahead)
-            return target_date.isoformat()
+    match = _WEEKDAY_RE.search(text_lower)
+    if match:
+        modifier = match.group(1)
+        day_num = _WEEKDAYS[match.group(2)]
+
+        if modifier == 'next':
+            # Next occurrence of that day
+            days_ahead = (day_num - current_day + 7) % 7
+            if days_ahead == 0:
+                days_ahead = 7  # Next week if it's the same day
+        else:  # 'this'
+            # This week's occurrence
+            days_ahead = (day_num - current_day) % 7
+
+        target_date = today + timedelta(days=days_ahead)
+        return target_date.isoformat()
 
     # "in X days/weeks"
-    in_days_match = re.search(r'\bin\s+(\d+)\s+days?\b', text_lower)
+    in_days_match = _IN_DAYS_RE.search(text_lower)
     if in_days_match:
         days = int(in_days_match.group(1))
-        return (datetime.now().date() + timedelta(days=days)).isoformat()
+        return (today + timedelta(days=days)).isoformat()
 
-    in_weeks_match = re.search(r'\bin\s+(\d+)\s+weeks?\b', text_lower)
+    in_weeks_match = _IN_WEEKS_RE.search(text_lower)
     if in_weeks_match:
         weeks = int(in_weeks_match.group(1))
-        return (datetime.now().date() + timedelta(weeks=weeks)).isoformat()
+        return (today + timedelta(weeks=weeks)).isoformat()
 
     # "by [day]" patterns
-    by_match = re.search(r'\bby\s+(next|this)\s+(\w+)', text_lower)
+    by_match = _BY_RE.search(text_lower)
     if by_match:
         modifier = by_match.group(1)
         day_candidate = by_match.group(2)
 
-        if day_candidate in weekdays:
-            day_num = weekdays[day_candidate]
-            current_day = datetime.now().weekday()
+        if day_candidate in _WEEKDAYS:
+            day_num = _WEEKDAYS[day_candidate]
 
             if modifier == 'next':
                 days_ahead = (day_num - current_day + 7) % 7
@@ -101,11 +125,20 @@ def parse_due_date(text: str) -> Optional[str]:
             else:
                 days_ahead = (day_num - current_day) % 7
 
-            target_date = datetime.now().date() + timedelta(days=days_ahead)
+            target_date = today + timedelta(days=days_ahead)
             return target_date.isoformat()
 
     # ISO date format (YYYY-MM-DD)
-    iso_match = re.search(r'\b(\d{4})-(\d{2})-(\d{2})\b', text)
+    return _parse_iso_date(text)
+
+
+def _parse_iso_date(text: str) -> Optional[str]:
+    """Return the first ISO date (YYYY-MM-DD) in text, or None."""
+    # An ISO date needs both a '-' and digits; both checks run in C
+    if '-' not in text or _DIGITS.isdisjoint(text):
+        return None
+
+    iso_match = _ISO_RE.search(text)
     if iso_match:
         return iso_match.group(0)
 
@@ -130,8 +163,7 @@ def extract_task_parts(text: str) -> dict:
 
     # Clean up title (remove date references for cleaner title)
     # Remove common date patterns from title
-    title = re.sub(r'\s+(by|on|before)\s+(next|this)?\s*\w+\s*$', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'\s+(tomorrow|today)\s*$', '', title, flags=re.IGNORECASE)
+    title = _TITLE_DATE_RE.sub('', title, count=1)
 
     # Remaining lines are description
     description = '\n'.join(lines[1:]).strip() if len(lines) > 1 else ''
@@ -5,26 +5,82 @@ Task Creator skill for Sentinel.
 Creates Asana tasks from natural language input.
 """
 
+import importlib.util
 import os
 import sys
 import json
+import time
 from pathlib import Path
 
 # Add parent directory to path for imports
 skill_dir = Path(__file__).parent
 sys.path.insert(0, str(skill_dir))
 
-from date_parser import extract_task_parts
 
-# Import Asana SDK
-try:
-    import asana
-except ImportError:
-    print(json.dumps({
-        'success': False,
-        'error': 'Asana package not installed. Run: pip install asana'
-    }))
-    sys.exit(1)
+def cython_build_is_current() -> bool:
+    """
+    Check whether the Cython build of the date parser matches date_parser.py.
+
+    The build (see scripts/setup.sh) is compiled from a copy of
+    date_parser.py, so it is stale once date_parser.py is edited after it.
+    Re-run scripts/setup.sh to rebuild it.
+
+    Returns:
+        True if date_parser_c exists and is not older than date_parser.py
+    """
+    spec = importlib.util.find_spec('date_parser_c')
+    if spec is None or spec.origin is None:
+        return False
+    return os.path.getmtime(spec.origin) >= os.path.getmtime(skill_dir / 'date_parser.py')
+
+
+# Prefer the Cython build of the date parser, unless it is older than
+# date_parser.py: a stale build would silently ignore edits to the parser
+if os.environ.get('SENTINEL_CYTHON', 'true').lower() != 'false' and cython_build_is_current():
+    try:
+        from date_parser_c import extract_task_parts
+    except ImportError:
+        from date_parser import extract_task_parts
+else:
+    from date_parser import extract_task_parts
+
+# Workspace tags and users change rarely; cache them between invocations
+CACHE_DIR = Path.home() / '.cache' / 'sentinel' / 'task-creator'
+CACHE_TTL_SECONDS = 3600
+
+
+def load_cached(kind: str, workspace_gid: str, fetch, ttl: int = CACHE_TTL_SECONDS) -> list:
+    """
+    Load a workspace listing from the on-disk cache, fetching on miss.
+
+    Args:
+        kind: Listing name used in the cache file name (e.g. 'tags')
+        workspace_gid: Asana workspace GID
+        fetch: Callable returning the listing from Asana
+        ttl: Maximum cache age in seconds
+
+    Returns:
+        List of item dicts
+    """
+    cache_file = CACHE_DIR / f'{kind}-{workspace_gid}.json'
+
+    try:
+        cached = json.loads(cache_file.read_text())
+        if time.time() - cached['ts'] < ttl:
+            return cached['items']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    items = [dict(item) for item in fetch()]
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({'ts': time.time(), 'items': items}))
+    except OSError:
+        # Cache is best-effort; the fetched listing is still valid
+        pass
+
+    return items
 
 
 def create_task(parameters: dict) -> dict:
@@ -65,6 +121,15 @@ def create_task(parameters: dict) -> dict:
             'error': 'Either ASANA_WORKSPACE_GID or project_gid parameter is required'
         }
 
+    # Import Asana SDK only once the request is known to be valid
+    try:
+        import asana
+    except ImportError:
+        return {
+            'success': False,
+            'error': 'Asana package not installed. Run: pip install asana'
+        }
+
     # Parse task components
     task_parts = extract_task_parts(text)
     task_name = task_parts['title']
@@ -110,14 +175,18 @@ def create_task(parameters: dict) -> dict:
         if priority in ['high', 'low']:
             try:
                 # Get workspace tags
-                tags = list(client.tags.find_by_workspace(workspace_gid, opt_fields=['name', 'gid']))
+                tags = load_cached(
+                    'tags', workspace_gid,
+                    lambda: client.tags.find_by_workspace(workspace_gid, opt_fields=['name', 'gid'])
+                )
+
+                tag_by_name = {t['name']: t['gid'] for t in tags}
 
                 # Find or create priority tag
-                priority_tag_name = f"{priority.capitalize()} Priority"
-                priority_tag = next((t for t in tags if t['name'] == priority_tag_name), None)
+                priority_tag_gid = tag_by_name.get(f"{priority.capitalize()} Priority")
 
-                if priority_tag:
-                    client.tasks.add_tag(task_gid, {'tag': priority_tag['gid']})
+                if priority_tag_gid:
+                    client.tasks.add_tag(task_gid, {'tag': priority_tag_gid})
             except Exception as tag_error:
                 # Non-critical error, task is still created
                 pass
@@ -126,11 +195,15 @@ def create_task(parameters: dict) -> dict:
         if assignee and assignee != 'me':
             try:
                 # Find user by email
-                users = list(client.users.find_by_workspace(workspace_gid, opt_fields=['email', 'gid']))
-                user = next((u for u in users if u.get('email') == assignee), None)
-
-                if user:
-                    client.tasks.update(task_gid, {'assignee': user['gid']})
+                users = load_cached(
+                    'users', workspace_gid,
+                    lambda: client.users.find_by_workspace(workspace_gid, opt_fields=['email', 'gid'])
+                )
+                user_by_email = {u['email']: u['gid'] for u in users if u.get('email')}
+                user_gid = user_by_email.get(assignee)
+
+                if user_gid:
+                    client.tasks.update(task_gid, {'assignee': user_gid})
             except Exception as assign_error:
                 # Non-critical error
                 pass
@@ -11,18 +11,26 @@ Creates a full arrangement with:
 Exports as MIDI file for use in Ableton or any DAW.
 """
 
-import sys
+import hashlib
+import shutil
+import struct
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
-
 from music.generators.melody_generator import MelodyGenerator, Scale
 from music.generators.chord_generator import ChordGenerator
 from music.generators.bass_generator import BassGenerator
 from music.generators.drum_generator import DrumGenerator, DrumHit
+import music.generators
 import mido
-from mido import Message, MidiFile, MidiTrack, MetaMessage
+import numpy as np
+from mido import Message, MidiTrack, MetaMessage
+
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
+END_OF_TRACK = b'\x00\xff\x2f\x00'
+
+MIN_DURATION_BEATS = 0.1  # Shortest note length written to the file
+DRUM_HIT_BEATS = 0.1  # Fixed length of every drum hit
 
 
 def create_midi_track(name: str, channel: int = 0) -> MidiTrack:
@@ -33,55 +41,151 @@ def create_midi_track(name: str, channel: int = 0) -> MidiTrack:
     return track
 
 
-def notes_to_midi_track(notes, track_name="Track", channel=0, ticks_per_beat=480):
+def event_ticks(starts, durations, ticks_per_beat):
     """
-    Convert Note objects to MIDI track.
+    Compute MIDI delta times for sequential note_on/note_off pairs.
+
+    Each event starts after the previous event's note_off, so the note_on
+    delta is the gap from the previous note's end (never negative).
+
+    Args:
+        starts: Start times in beats (sorted)
+        durations: Durations in beats, or one duration shared by all events
+        ticks_per_beat: MIDI ticks per beat
+
+    Returns:
+        Tuple of (note_on deltas, note durations) as int64 tick arrays
+    """
+    start_ticks = (np.maximum(0.0, starts) * ticks_per_beat).astype(np.int64)
+    if np.isscalar(durations):
+        # Convert a shared duration once instead of per event
+        duration_ticks = np.full(
+            len(start_ticks), int(max(MIN_DURATION_BEATS, durations) * ticks_per_beat), dtype=np.int64
+        )
+    else:
+        duration_ticks = (np.maximum(MIN_DURATION_BEATS, durations) * ticks_per_beat).astype(np.int64)
+
+    # Tick position after the previous event's note_off
+    previous_end = np.empty_like(start_ticks)
+    if len(start_ticks):
+        previous_end[0] = 0
+        previous_end[1:] = start_ticks[:-1] + duration_ticks[:-1]
+
+    delta_ticks = np.maximum(0, start_ticks - previous_end)
+    return delta_ticks, duration_ticks
+
+
+def note_events(notes, channel=0, ticks_per_beat=480):
+    """
+    Convert Note objects to MIDI channel events.
 
     Args:
         notes: List of Note objects
-        track_name: Name of track
         channel: MIDI channel (0-15)
         ticks_per_beat: MIDI ticks per beat
 
     Returns:
-        MidiTrack
+        Tuple of (delta, status, data1, data2) int64 arrays, one entry
+        per note_on/note_off event
     """
-    track = create_midi_track(track_name, channel)
-
     # Sort notes by start time
     sorted_notes = sorted(notes, key=lambda n: n.start)
+    count = len(sorted_notes)
+
+    delta_ticks, duration_ticks = event_ticks(
+        np.fromiter((n.start for n in sorted_notes), dtype=np.float64, count=count),
+        np.fromiter((n.duration for n in sorted_notes), dtype=np.float64, count=count),
+        ticks_per_beat
+    )
+    pitches = np.fromiter((n.pitch for n in sorted_notes), dtype=np.int64, count=count)
+    velocities = np.fromiter((n.velocity for n in sorted_notes), dtype=np.int64, count=count)
+
+    # Interleave note_on/note_off pairs
+    return (
+        np.column_stack((delta_ticks, duration_ticks)).ravel(),
+        np.tile(np.array([NOTE_ON | channel, NOTE_OFF | channel], dtype=np.int64), count),
+        np.repeat(pitches, 2),
+        np.column_stack((velocities, np.zeros(count, dtype=np.int64))).ravel()
+    )
+
+
+def chord_events(chords, channel=1, ticks_per_beat=480):
+    """
+    Convert Chord objects to MIDI channel events.
+
+    All notes of a chord start together and stop together, so only the
+    first note_on and first note_off of each chord carry a delta.
+
+    Args:
+        chords: List of Chord objects
+        channel: MIDI channel
+        ticks_per_beat: MIDI ticks per beat
 
-    current_time_ticks = 0
+    Returns:
+        Tuple of (delta, status, data1, data2) int64 arrays
+    """
+    delta_ticks, duration_ticks = event_ticks(
+        np.fromiter((c.start for c in chords), dtype=np.float64, count=len(chords)),
+        np.fromiter((c.duration for c in chords), dtype=np.float64, count=len(chords)),
+        ticks_per_beat
+    )
+
+    deltas, statuses, pitches, velocities = [], [], [], []
+    for chord, delta_time, chord_duration_ticks in zip(chords, delta_ticks.tolist(), duration_ticks.tolist()):
+        chord_notes = chord.get_notes()
+        rest = [0] * (len(chord_notes) - 1)
 
-    for note in sorted_notes:
-        # Calculate start time in ticks
-        note_start_ticks = int(max(0, note.start) * ticks_per_beat)
-        note_duration_ticks = int(max(0.1, note.duration) * ticks_per_beat)
+        # Note on for all chord notes, then note off for all chord notes
+        deltas += [delta_time, *rest, chord_duration_ticks, *rest]
+        statuses += [NOTE_ON | channel] * len(chord_notes) + [NOTE_OFF | channel] * len(chord_notes)
+        pitches += chord_notes * 2
+        velocities += [chord.velocity] * len(chord_notes) + [0] * len(chord_notes)
 
-        # Delta time until this note starts
-        delta_time = max(0, note_start_ticks - current_time_ticks)
+    return tuple(np.array(values, dtype=np.int64) for values in (deltas, statuses, pitches, velocities))
 
-        # Note on
-        track.append(Message(
-            'note_on',
-            note=note.pitch,
-            velocity=note.velocity,
-            time=delta_time,
-            channel=channel
-        ))
 
-        current_time_ticks = note_start_ticks
+def drum_events(drum_hits, channel=9, ticks_per_beat=480):
+    """
+    Convert DrumHit objects to MIDI channel events.
 
-        # Note off
-        track.append(Message(
-            'note_off',
-            note=note.pitch,
-            velocity=0,
-            time=note_duration_ticks,
-            channel=channel
-        ))
+    Args:
+        drum_hits: List of DrumHit objects
+        channel: MIDI channel (9 is standard drum channel)
+        ticks_per_beat: MIDI ticks per beat
 
-        current_time_ticks += note_duration_ticks
+    Returns:
+        Tuple of (delta, status, data1, data2) int64 arrays
+    """
+    # Sort by start time
+    sorted_hits = sorted(drum_hits, key=lambda h: h.start)
+    count = len(sorted_hits)
+
+    # Drums use a fixed short duration
+    delta_ticks, duration_ticks = event_ticks(
+        np.fromiter((h.start for h in sorted_hits), dtype=np.float64, count=count),
+        DRUM_HIT_BEATS,
+        ticks_per_beat
+    )
+    sounds = np.fromiter((h.sound.value for h in sorted_hits), dtype=np.int64, count=count)
+    velocities = np.fromiter((h.velocity for h in sorted_hits), dtype=np.int64, count=count)
+
+    return (
+        np.column_stack((delta_ticks, duration_ticks)).ravel(),
+        np.tile(np.array([NOTE_ON | channel, NOTE_OFF | channel], dtype=np.int64), count),
+        np.repeat(sounds, 2),
+        np.column_stack((velocities, np.zeros(count, dtype=np.int64))).ravel()
+    )
+
+
+def events_to_midi_track(events, track_name, channel):
+    """Build a mido MidiTrack from (delta, status, data1, data2) arrays."""
+    track = create_midi_track(track_name, channel)
+
+    for delta, status, data1, data2 in zip(*(a.tolist() for a in events)):
+        if status & 0xF0 == NOTE_ON:
+            track.append(Message('note_on', note=data1, velocity=data2, time=delta, channel=channel))
+        else:
+            track.append(Message('note_off', note=data1, velocity=data2, time=delta, channel=channel))
 
     # End of track
     track.append(MetaMessage('end_of_track', time=0))
@@ -89,116 +193,123 @@ def notes_to_midi_track(notes, track_name="Track", channel=0, ticks_per_beat=480
     return track
 
 
+def notes_to_midi_track(notes, track_name="Track", channel=0, ticks_per_beat=480):
+    """Convert Note objects to a mido MidiTrack."""
+    return events_to_midi_track(note_events(notes, channel, ticks_per_beat), track_name, channel)
+
+
 def chords_to_midi_track(chords, track_name="Chords", channel=1, ticks_per_beat=480):
+    """Convert Chord objects to a mido MidiTrack."""
+    return events_to_midi_track(chord_events(chords, channel, ticks_per_beat), track_name, channel)
+
+
+def drums_to_midi_track(drum_hits, track_name="Drums", channel=9, ticks_per_beat=480):
+    """Convert DrumHit objects to a mido MidiTrack."""
+    return events_to_midi_track(drum_events(drum_hits, channel, ticks_per_beat), track_name, channel)
+
+
+def encode_events(deltas, status, data1, data2) -> bytes:
     """
-    Convert Chord objects to MIDI track.
+    Encode channel events to MIDI track bytes in one vectorized pass.
+
+    Each event becomes a row of up to 7 bytes: a 4-byte variable-length
+    delta (leading zero groups dropped), the status byte (dropped when it
+    repeats, i.e. running status) and two data bytes.
 
     Args:
-        chords: List of Chord objects
-        track_name: Name of track
-        channel: MIDI channel
-        ticks_per_beat: MIDI ticks per beat
+        deltas: Delta times in ticks (< 2**28)
+        status: Status bytes
+        data1: First data bytes
+        data2: Second data bytes
 
     Returns:
-        MidiTrack
+        Encoded event bytes
     """
-    track = create_midi_track(track_name, channel)
-
-    current_time_ticks = 0
+    count = len(deltas)
+    rows = np.zeros((count, 7), dtype=np.uint8)
+    keep = np.ones((count, 7), dtype=bool)
 
-    for chord in chords:
-        chord_notes = chord.get_notes()
+    # Variable-length quantity: 7 bits per byte, high bit on all but the last
+    for column, shift in enumerate((21, 14, 7, 0)):
+        rows[:, column] = (deltas >> shift) & 0x7F
+    rows[:, :3] |= 0x80
+    vlq_length = 1 + (deltas >= 1 << 7) + (deltas >= 1 << 14) + (deltas >= 1 << 21)
+    keep[:, :4] = np.arange(4) >= (4 - vlq_length)[:, None]
 
-        # Calculate start time
-        chord_start_ticks = int(max(0, chord.start) * ticks_per_beat)
-        chord_duration_ticks = int(max(0.1, chord.duration) * ticks_per_beat)
-
-        # Delta time to chord start
-        delta_time = max(0, chord_start_ticks - current_time_ticks)
-
-        # Note on for all chord notes (simultaneously)
-        for i, note_pitch in enumerate(chord_notes):
-            track.append(Message(
-                'note_on',
-                note=note_pitch,
-                velocity=chord.velocity,
-                time=delta_time if i == 0 else 0,  # Only first note has delta
-                channel=channel
-            ))
-
-        current_time_ticks = chord_start_ticks
-
-        # Note off for all chord notes
-        for i, note_pitch in enumerate(chord_notes):
-            track.append(Message(
-                'note_off',
-                note=note_pitch,
-                velocity=0,
-                time=chord_duration_ticks if i == 0 else 0,
-                channel=channel
-            ))
-
-        current_time_ticks += chord_duration_ticks
+    rows[:, 4] = status
+    keep[1:, 4] = status[1:] != status[:-1]
+    rows[:, 5] = data1
+    rows[:, 6] = data2
 
-    # End of track
-    track.append(MetaMessage('end_of_track', time=0))
-
-    return track
+    return rows[keep].tobytes()
 
 
-def drums_to_midi_track(drum_hits, track_name="Drums", channel=9, ticks_per_beat=480):
+def encode_track(events, track_name, channel) -> bytes:
     """
-    Convert DrumHit objects to MIDI track.
+    Encode a named track of channel events as an MTrk chunk.
 
     Args:
-        drum_hits: List of DrumHit objects
+        events: Tuple of (delta, status, data1, data2) arrays
         track_name: Name of track
-        channel: MIDI channel (9 is standard drum channel)
-        ticks_per_beat: MIDI ticks per beat
+        channel: MIDI channel
 
     Returns:
-        MidiTrack
+        MTrk chunk bytes
     """
-    track = create_midi_track(track_name, channel)
+    data = b''.join((
+        b'\x00' + bytes(MetaMessage('track_name', name=track_name).bytes()),
+        b'\x00' + bytes(MetaMessage('channel_prefix', channel=channel).bytes()),
+        encode_events(*events),
+        END_OF_TRACK
+    ))
+    return b'MTrk' + struct.pack('>I', len(data)) + data
 
-    # Sort by start time
-    sorted_hits = sorted(drum_hits, key=lambda h: h.start)
 
-    current_time_ticks = 0
+def encode_tempo_track(bpm) -> bytes:
+    """Encode a tempo-only MTrk chunk."""
+    microseconds_per_beat = int(60_000_000 / bpm)
+    data = b'\x00' + bytes(MetaMessage('set_tempo', tempo=microseconds_per_beat).bytes()) + END_OF_TRACK
+    return b'MTrk' + struct.pack('>I', len(data)) + data
 
-    for hit in sorted_hits:
-        # Calculate start time
-        hit_start_ticks = int(max(0, hit.start) * ticks_per_beat)
 
-        # Delta time
-        delta_time = max(0, hit_start_ticks - current_time_ticks)
+def write_midi_file(path, track_chunks, ticks_per_beat=480):
+    """
+    Write a type 1 MIDI file from pre-encoded MTrk chunks.
 
-        # Note on
-        track.append(Message(
-            'note_on',
-            note=hit.sound.value,  # Drum MIDI note
-            velocity=hit.velocity,
-            time=delta_time,
-            channel=channel
-        ))
+    Args:
+        path: Output file path
+        track_chunks: List of MTrk chunk bytes
+        ticks_per_beat: MIDI ticks per beat
+    """
+    header = b'MThd' + struct.pack('>Ihhh', 6, 1, len(track_chunks), ticks_per_beat)
+    Path(path).write_bytes(header + b''.join(track_chunks))
 
-        current_time_ticks = hit_start_ticks
 
-        # Note off (short duration for drums)
-        track.append(Message(
-            'note_off',
-            note=hit.sound.value,
-            velocity=0,
-            time=int(0.1 * ticks_per_beat),  # 0.1 beat duration
-            channel=channel
-        ))
+def pitch_range(notes: list) -> tuple:
+    """Return the lowest and highest pitch in one pass over the notes."""
+    lo = hi = notes[0].pitch
+    for note in notes:
+        pitch = note.pitch
+        if pitch < lo:
+            lo = pitch
+        elif pitch > hi:
+            hi = pitch
+    return lo, hi
 
-        current_time_ticks += int(0.1 * ticks_per_beat)
 
-    # End of track
-    track.append(MetaMessage('end_of_track', time=0))
+def config_hash(*config) -> str:
+    """
+    Hash the track configuration together with the generator sources.
 
-    return track
+    Including the generator code means edits to the generators invalidate
+    previously cached tracks.
+    """
+    digest = hashlib.sha256(''.join(str(value) for value in config).encode())
+    script = Path(__file__)
+    generators = Path(music.generators.__file__).parent
+    for source in [script, *sorted(generators.glob('*.py'))]:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:16]
 
 
 def main():
@@ -213,11 +324,13 @@ def main():
     SCALE = Scale.MINOR_PENTATONIC
     BPM = 90
     BARS = 8
+    SEED = 42
 
     print(f"Key: F# Minor")
     print(f"Scale: Minor Pentatonic")
     print(f"BPM: {BPM}")
     print(f"Bars: {BARS}")
+    print(f"Seed: {SEED}")
     print()
 
     # Output directory
@@ -225,11 +338,19 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / '05_complete_track.mid'
 
+    # Same configuration and seed always produce the same file
+    cache_file = output_dir / f'.cache_{config_hash(KEY, SCALE, BPM, BARS, SEED)}.mid'
+    if cache_file.exists():
+        shutil.copy(cache_file, output_file)
+        print(f"✓ Unchanged configuration, reused cached track: {output_file}")
+        print()
+        return
+
     # Initialize generators
-    chord_gen = ChordGenerator(key_root=KEY, scale=Scale.MINOR)
-    melody_gen = MelodyGenerator(key_root=KEY, scale=SCALE)
-    bass_gen = BassGenerator(key_root=KEY, scale=Scale.MINOR)
-    drum_gen = DrumGenerator(bpm=BPM, swing=0.3)
+    chord_gen = ChordGenerator(key_root=KEY, scale=Scale.MINOR, seed=SEED)
+    melody_gen = MelodyGenerator(key_root=KEY, scale=SCALE, seed=SEED)
+    bass_gen = BassGenerator(key_root=KEY, scale=Scale.MINOR, seed=SEED)
+    drum_gen = DrumGenerator(bpm=BPM, swing=0.3, seed=SEED)
 
     # Generate chord progression
     print("-" * 70)
@@ -248,7 +369,8 @@ def main():
     melody = melody_gen.generate_motif_based(bars=BARS, creativity=0.7)
     melody = melody_gen.humanize(melody, amount=0.4)
     print(f"✓ Generated {len(melody)} notes (motif-based + humanized)")
-    print(f"    Note range: MIDI {min(n.pitch for n in melody)}-{max(n.pitch for n in melody)}")
+    lo, hi = pitch_range(melody)
+    print(f"    Note range: MIDI {lo}-{hi}")
     print()
 
     # Generate bass
@@ -257,7 +379,8 @@ def main():
     print("-" * 70)
     bass = bass_gen.generate_walking(chords)
     print(f"✓ Generated {len(bass)} notes (walking bass)")
-    print(f"    Note range: MIDI {min(n.pitch for n in bass)}-{max(n.pitch for n in bass)}")
+    lo, hi = pitch_range(bass)
+    print(f"    Note range: MIDI {lo}-{hi}")
     print()
 
     # Generate drums
@@ -274,24 +397,20 @@ def main():
     print("5. CREATING MIDI FILE")
     print("-" * 70)
 
-    mid = MidiFile()
-    ticks_per_beat = mid.ticks_per_beat
-
-    # Add tempo track
-    tempo_track = MidiTrack()
-    microseconds_per_beat = int(60_000_000 / BPM)
-    tempo_track.append(MetaMessage('set_tempo', tempo=microseconds_per_beat))
-    tempo_track.append(MetaMessage('end_of_track'))
-    mid.tracks.append(tempo_track)
+    ticks_per_beat = 480
 
-    # Add tracks
-    mid.tracks.append(drums_to_midi_track(drums, "Drums", channel=9, ticks_per_beat=ticks_per_beat))
-    mid.tracks.append(notes_to_midi_track(bass, "Bass", channel=1, ticks_per_beat=ticks_per_beat))
-    mid.tracks.append(chords_to_midi_track(chords, "Chords", channel=2, ticks_per_beat=ticks_per_beat))
-    mid.tracks.append(notes_to_midi_track(melody, "Melody", channel=3, ticks_per_beat=ticks_per_beat))
+    # Tempo track, then one track per part
+    track_chunks = [
+        encode_tempo_track(BPM),
+        encode_track(drum_events(drums, channel=9, ticks_per_beat=ticks_per_beat), "Drums", 9),
+        encode_track(note_events(bass, channel=1, ticks_per_beat=ticks_per_beat), "Bass", 1),
+        encode_track(chord_events(chords, channel=2, ticks_per_beat=ticks_per_beat), "Chords", 2),
+        encode_track(note_events(melody, channel=3, ticks_per_beat=ticks_per_beat), "Melody", 3),
+    ]
 
     # Save MIDI file
-    mid.save(output_file)
+    write_midi_file(output_file, track_chunks, ticks_per_beat)
+    shutil.copy(output_file, cache_file)
     print(f"✓ Saved: {output_file}")
     print()
 
@@ -302,7 +421,7 @@ def main():
     print()
     print(f"📁 File: {output_file.name}")
     print(f"📊 Stats:")
-    print(f"   • Chords: {len(chords)} ({sum(len(c.get_notes()) for c in chords)} total notes)")
+    print(f"   • Chords: {len(chords)} ({sum(c.num_notes for c in chords)} total notes)")
     print(f"   • Melody: {len(melody)} notes")
     print(f"   • Bass: {len(bass)} notes")
     print(f"   • Drums: {len(drums)} hits")
@@ -8,7 +8,9 @@ Creates 3 MIDI files demonstrating:
 3. Motif-based (high creativity)
 """
 
+import io
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add src to path
@@ -16,8 +18,69 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from music.generators.melody_generator import MelodyGenerator, Scale
 import mido
+import numpy as np
 from mido import Message, MidiFile, MidiTrack
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; compute_deltas falls back to _compute_deltas_numpy
+    njit = None
+
+# Per-note fields used when writing MIDI (float64 keeps tick rounding exact)
+NOTE_DTYPE = np.dtype([
+    ('start', np.float64),
+    ('duration', np.float64),
+    ('pitch', np.int64),
+    ('velocity', np.int64),
+])
+
+
+def _compute_deltas_numpy(starts, durations, ticks_per_beat):
+    """
+    Convert sorted note starts and durations (in beats) to MIDI ticks.
+
+    Args:
+        starts: float64 array of note starts, sorted ascending
+        durations: float64 array of note durations
+        ticks_per_beat: MIDI resolution
+
+    Returns:
+        (delta_ticks, duration_ticks) int64 arrays, where each delta is the
+        time until the note starts, measured from the previous note off
+    """
+    start_ticks = (np.maximum(0, starts) * ticks_per_beat).astype(np.int64)
+    duration_ticks = (np.maximum(0.1, durations) * ticks_per_beat).astype(np.int64)
+
+    delta_ticks = np.empty_like(start_ticks)
+    delta_ticks[:1] = start_ticks[:1]
+    delta_ticks[1:] = start_ticks[1:] - (start_ticks[:-1] + duration_ticks[:-1])
+    np.maximum(delta_ticks, 0, out=delta_ticks)
+
+    return delta_ticks, duration_ticks
+
+
+def _compute_deltas_loop(starts, durations, ticks_per_beat):
+    """Single-loop version of _compute_deltas_numpy, compiled with Numba."""
+    count = starts.shape[0]
+    delta_ticks = np.empty(count, dtype=np.int64)
+    duration_ticks = np.empty(count, dtype=np.int64)
+
+    current_time_ticks = 0
+    for i in range(count):
+        start_ticks = np.int64(max(0.0, starts[i]) * ticks_per_beat)
+        duration_ticks[i] = np.int64(max(0.1, durations[i]) * ticks_per_beat)
+        delta_ticks[i] = max(0, start_ticks - current_time_ticks)
+        current_time_ticks = start_ticks + duration_ticks[i]
+
+    return delta_ticks, duration_ticks
+
+
+if njit is not None:
+    compute_deltas = njit(cache=True)(_compute_deltas_loop)
+else:
+    compute_deltas = _compute_deltas_numpy
+
 
 def notes_to_midi(notes, output_path, tempo=90, track_name="Melody"):
     """
@@ -45,47 +108,67 @@ def notes_to_midi(notes, output_path, tempo=90, track_name="Melody"):
     # MIDI uses ticks, we need to convert beats to ticks
     ticks_per_beat = mid.ticks_per_beat  # Default: 480
 
-    # Sort notes by start time
-    sorted_notes = sorted(notes, key=lambda n: n.start)
+    # Gather note fields into one structured array, sorted by start time
+    arr = np.fromiter(
+        ((n.start, n.duration, n.pitch, n.velocity) for n in notes),
+        dtype=NOTE_DTYPE,
+        count=len(notes)
+    )
+    arr = arr[np.argsort(arr['start'], kind='stable')]
 
-    current_time_ticks = 0
+    pitches = arr['pitch']
+    velocities = arr['velocity']
+    starts = arr['start']
+    durations = arr['duration']
 
-    for note in sorted_notes:
-        # Calculate start time in ticks
-        note_start_ticks = int(max(0, note.start) * ticks_per_beat)
-        note_duration_ticks = int(max(0.1, note.duration) * ticks_per_beat)
+    delta_ticks, duration_ticks = compute_deltas(starts, durations, ticks_per_beat)
 
-        # Delta time until this note starts
-        delta_time = max(0, note_start_ticks - current_time_ticks)
+    # Bind the hot names locally for the per-note loop
+    append = track.append
+    message = Message
 
+    for pitch, velocity, delta_time, note_duration_ticks in zip(
+        pitches.tolist(), velocities.tolist(), delta_ticks.tolist(), duration_ticks.tolist()
+    ):
         # Note on
-        track.append(Message(
-            'note_on',
-            note=note.pitch,
-            velocity=note.velocity,
-            time=delta_time
-        ))
-
-        current_time_ticks = note_start_ticks
+        append(message('note_on', note=pitch, velocity=velocity, time=delta_time))
 
         # Note off
-        track.append(Message(
-            'note_off',
-            note=note.pitch,
-            velocity=0,
-            time=note_duration_ticks
-        ))
-
-        current_time_ticks += note_duration_ticks
+        append(message('note_off', note=pitch, velocity=0, time=note_duration_ticks))
 
     # End of track
     track.append(mido.MetaMessage('end_of_track', time=0))
 
-    # Save MIDI file
-    mid.save(output_path)
+    # Save MIDI file: encode in memory, then write it out in one call
+    buffer = io.BytesIO()
+    mid.save(file=buffer)
+    Path(output_path).write_bytes(buffer.getvalue())
     print(f"✅ Saved: {output_path}")
 
 
+def create_generator() -> MelodyGenerator:
+    """Create the melody generator shared by all demos (F# minor pentatonic)."""
+    return MelodyGenerator(key_root=66, scale=Scale.MINOR_PENTATONIC)
+
+
+# Module-level so they can be sent to worker processes
+def generate_basic_demo():
+    """Demo 1: basic melody."""
+    return create_generator().generate_basic(bars=8)
+
+
+def generate_varied_demo():
+    """Demo 2: varied melody."""
+    return create_generator().generate_varied(bars=8, creativity=0.6)
+
+
+def generate_motif_demo():
+    """Demos 3 and 4: motif-based melody and its humanized version."""
+    generator = create_generator()
+    motif = generator.generate_motif_based(bars=8, creativity=0.7)
+    return motif, generator.humanize(motif, amount=0.4)
+
+
 def main():
     """Generate demo melodies."""
     print("=" * 70)
@@ -97,13 +180,20 @@ def main():
     output_dir = Path(__file__).parent.parent / 'music' / 'demos'
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create generator in F# minor (lo-fi friendly key)
+    # F# minor is a lo-fi friendly key (see create_generator)
     print("Key: F# minor (Nujabes territory)")
     print("Scale: Minor Pentatonic")
     print("BPM: 90")
     print()
 
-    generator = MelodyGenerator(key_root=66, scale=Scale.MINOR_PENTATONIC)
+    # The demos are independent, so generate them in separate processes
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        basic_future = executor.submit(generate_basic_demo)
+        varied_future = executor.submit(generate_varied_demo)
+        motif_future = executor.submit(generate_motif_demo)
+        basic = basic_future.result()
+        varied = varied_future.result()
+        motif, humanized = motif_future.result()
 
     # ========================================
     # Demo 1: Basic Melody (Low Creativity)
@@ -117,7 +207,6 @@ def main():
     print("   • Constant velocity (no dynamics)")
     print()
 
-    basic = generator.generate_basic(bars=8)
     basic_path = output_dir / '01_basic_melody.mid'
     notes_to_midi(basic, basic_path, tempo=90, track_name="Basic Melody")
 
@@ -137,7 +226,6 @@ def main():
     print("   • More natural phrasing")
     print()
 
-    varied = generator.generate_varied(bars=8, creativity=0.6)
     varied_path = output_dir / '02_varied_melody.mid'
     notes_to_midi(varied, varied_path, tempo=90, track_name="Varied Melody")
 
@@ -158,7 +246,6 @@ def main():
     print("   • More coherent structure")
     print()
 
-    motif = generator.generate_motif_based(bars=8, creativity=0.7)
     motif_path = output_dir / '03_motif_based.mid'
     notes_to_midi(motif, motif_path, tempo=90, track_name="Motif Development")
 
@@ -177,7 +264,6 @@ def main():
     print("   • More 'organic' feel")
     print()
 
-    humanized = generator.humanize(motif, amount=0.4)
     humanized_path = output_dir / '04_humanized.mid'
     notes_to_midi(humanized, humanized_path, tempo=90, track_name="Humanized Melody")
 
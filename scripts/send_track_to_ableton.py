@@ -13,17 +13,13 @@ Prerequisites:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from music.ableton_controller import AbletonController
-from music.generators.melody_generator import MelodyGenerator, Scale
-from music.generators.chord_generator import ChordGenerator
-from music.generators.bass_generator import BassGenerator
-from music.generators.drum_generator import DrumGenerator
-import time
 
 
 def main():
@@ -35,8 +31,6 @@ def main():
 
     # Configuration
     KEY = 66  # F# minor
-    SCALE_MELODY = Scale.MINOR_PENTATONIC
-    SCALE_HARMONY = Scale.MINOR
     BPM = 90
     BARS = 8
     CLIP_SLOT = 0  # First scene
@@ -74,10 +68,20 @@ def main():
     print(f"✓ Tempo set to {BPM} BPM")
     print()
 
-    # Initialize generators
+    # Initialize generators (imported only once Ableton is reachable)
     print("-" * 70)
     print("STEP 3: Generate Music")
     print("-" * 70)
+    from music.generators import (
+        BassGenerator,
+        ChordGenerator,
+        DrumGenerator,
+        MelodyGenerator,
+        Scale,
+    )
+
+    SCALE_MELODY = Scale.MINOR_PENTATONIC
+    SCALE_HARMONY = Scale.MINOR
     chord_gen = ChordGenerator(key_root=KEY, scale=SCALE_HARMONY)
     melody_gen = MelodyGenerator(key_root=KEY, scale=SCALE_MELODY)
     bass_gen = BassGenerator(key_root=KEY, scale=SCALE_HARMONY)
@@ -88,134 +92,108 @@ def main():
     chords = chord_gen.generate_progression("lofi_1", bars=BARS, beats_per_chord=4.0)
     print(f"  ✓ {len(chords)} chords generated")
 
-    print("Generating melody...")
-    melody = melody_gen.generate_motif_based(bars=BARS, creativity=0.7)
-    melody = melody_gen.humanize(melody, amount=0.4)
-    print(f"  ✓ {len(melody)} notes generated")
-
-    print("Generating bass...")
-    bass = bass_gen.generate_walking(chords)
-    print(f"  ✓ {len(bass)} notes generated")
+    def generate_melody():
+        melody = melody_gen.generate_motif_based(bars=BARS, creativity=0.7)
+        return melody_gen.humanize(melody, amount=0.4)
+
+    # Melody, bass and drums only depend on the chords; each generator has
+    # its own RNG, so they can run side by side
+    print("Generating melody, bass and drums...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        melody_future = executor.submit(generate_melody)
+        bass_future = executor.submit(bass_gen.generate_walking, chords)
+        drums_future = executor.submit(
+            drum_gen.generate_lofi, bars=BARS, complexity=0.6, humanize=0.4
+        )
+        melody = melody_future.result()
+        bass = bass_future.result()
+        drums = drums_future.result()
 
-    print("Generating drums...")
-    drums = drum_gen.generate_lofi(bars=BARS, complexity=0.6, humanize=0.4)
-    print(f"  ✓ {len(drums)} hits generated")
+    print(f"  ✓ {len(melody)} melody notes generated")
+    print(f"  ✓ {len(bass)} bass notes generated")
+    print(f"  ✓ {len(drums)} drum hits generated")
     print()
 
     # Create tracks in Ableton
     print("-" * 70)
-    print("STEP 4: Create Tracks in Ableton")
+    print("STEP 4: Create Tracks and Clips in Ableton")
     print("-" * 70)
 
-    # Track 1: Drums (always use index directly, not -1)
-    print("Creating drums track...")
-    drums_track = 0  # Will be created at index 0
-    ableton.create_midi_track(drums_track)
-    time.sleep(0.1)
-    ableton.set_track_name(drums_track, "Drums")
-    print(f"  ✓ Track {drums_track}: Drums")
-
-    # Track 2: Bass
-    print("Creating bass track...")
+    # Always use track indices directly, not -1
+    drums_track = 0
     bass_track = 1
-    ableton.create_midi_track(bass_track)
-    time.sleep(0.1)
-    ableton.set_track_name(bass_track, "Bass")
-    print(f"  ✓ Track {bass_track}: Bass")
-
-    # Track 3: Chords
-    print("Creating chords track...")
     chords_track = 2
-    ableton.create_midi_track(chords_track)
-    time.sleep(0.1)
-    ableton.set_track_name(chords_track, "Chords")
-    print(f"  ✓ Track {chords_track}: Chords")
-
-    # Track 4: Melody
-    print("Creating melody track...")
     melody_track = 3
-    ableton.create_midi_track(melody_track)
-    time.sleep(0.1)
-    ableton.set_track_name(melody_track, "Melody")
-    print(f"  ✓ Track {melody_track}: Melody")
-    print()
-
-    # Create clips
-    print("-" * 70)
-    print("STEP 5: Create MIDI Clips")
-    print("-" * 70)
-
-    print(f"Creating {BARS}-bar clips in scene {CLIP_SLOT}...")
-    ableton.create_clip(drums_track, CLIP_SLOT, float(BARS))
-    time.sleep(0.1)
-    ableton.create_clip(bass_track, CLIP_SLOT, float(BARS))
-    time.sleep(0.1)
-    ableton.create_clip(chords_track, CLIP_SLOT, float(BARS))
-    time.sleep(0.1)
-    ableton.create_clip(melody_track, CLIP_SLOT, float(BARS))
-    time.sleep(0.1)
-    print("✓ All clips created")
+    track_names = {
+        drums_track: "Drums",
+        bass_track: "Bass",
+        chords_track: "Chords",
+        melody_track: "Melody",
+    }
+
+    # One bundle: AbletonOSC applies the messages in order, so no pacing is needed
+    with ableton.bundle():
+        for track_id, name in track_names.items():
+            ableton.create_midi_track(track_id)
+            ableton.set_track_name(track_id, name)
+        for track_id in track_names:
+            ableton.create_clip(track_id, CLIP_SLOT, float(BARS))
+
+    # Replies are sent in order, so this also confirms the bundle was handled
+    num_tracks = ableton.get_num_tracks()
+    for track_id, name in track_names.items():
+        print(f"  ✓ Track {track_id}: {name}")
+    print(f"✓ {BARS}-bar clips created in scene {CLIP_SLOT}")
+    if num_tracks is None:
+        print("  ⚠️  No reply from Ableton; could not confirm the track setup")
+    else:
+        print(f"  Set now has {num_tracks} tracks")
     print()
 
     # Add notes to drums
     print("-" * 70)
-    print("STEP 6: Add MIDI Notes")
+    print("STEP 5: Add MIDI Notes")
     print("-" * 70)
 
     print(f"Adding {len(drums)} drum hits...")
-    for hit in drums:
-        ableton.add_note(
-            track_id=drums_track,
-            clip_slot=CLIP_SLOT,
-            pitch=hit.sound.value,
-            start_time=hit.start,
-            duration=0.1,
-            velocity=hit.velocity
-        )
+    ableton.add_notes_batch(
+        drums_track,
+        CLIP_SLOT,
+        [(hit.sound.value, hit.start, 0.1, hit.velocity) for hit in drums]
+    )
     print("  ✓ Drums complete")
 
     print(f"Adding {len(bass)} bass notes...")
-    for note in bass:
-        ableton.add_note(
-            track_id=bass_track,
-            clip_slot=CLIP_SLOT,
-            pitch=note.pitch,
-            start_time=note.start,
-            duration=note.duration,
-            velocity=note.velocity
-        )
+    ableton.add_notes_batch(
+        bass_track,
+        CLIP_SLOT,
+        [(note.pitch, note.start, note.duration, note.velocity) for note in bass]
+    )
     print("  ✓ Bass complete")
 
+    # Realize each chord's notes once; reused for the summary count
+    chord_notes = [
+        (pitch, chord.start, chord.duration, chord.velocity)
+        for chord in chords
+        for pitch in chord.get_notes()
+    ]
+
     print(f"Adding {len(chords)} chords...")
-    for chord in chords:
-        chord_notes = chord.get_notes()
-        for pitch in chord_notes:
-            ableton.add_note(
-                track_id=chords_track,
-                clip_slot=CLIP_SLOT,
-                pitch=pitch,
-                start_time=chord.start,
-                duration=chord.duration,
-                velocity=chord.velocity
-            )
+    ableton.add_notes_batch(chords_track, CLIP_SLOT, chord_notes)
     print("  ✓ Chords complete")
 
     print(f"Adding {len(melody)} melody notes...")
-    for note in melody:
-        ableton.add_note(
-            track_id=melody_track,
-            clip_slot=CLIP_SLOT,
-            pitch=note.pitch,
-            start_time=note.start,
-            duration=note.duration,
-            velocity=note.velocity
-        )
+    ableton.add_notes_batch(
+        melody_track,
+        CLIP_SLOT,
+        [(note.pitch, note.start, note.duration, note.velocity) for note in melody]
+    )
     print("  ✓ Melody complete")
     print()
 
     # Set up basic mix
     print("-" * 70)
-    print("STEP 7: Set Up Mix")
+    print("STEP 6: Set Up Mix")
     print("-" * 70)
 
     # Drums: Louder, centered
@@ -251,7 +229,7 @@ def main():
     print(f"     • {BARS} bars at {BPM} BPM")
     print(f"     • {len(drums)} drum hits")
     print(f"     • {len(bass)} bass notes")
-    print(f"     • {len(chords)} chords ({sum(len(c.get_notes()) for c in chords)} notes)")
+    print(f"     • {len(chords)} chords ({len(chord_notes)} notes)")
     print(f"     • {len(melody)} melody notes")
     print()
     print("  🎹 Next Steps:")
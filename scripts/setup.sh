@@ -46,10 +46,32 @@ echo ""
 echo "Installing dependencies..."
 pip install --upgrade pip > /dev/null 2>&1
 pip install -r requirements.txt
+pip install -e . > /dev/null
 echo "✓ Dependencies installed"
 
 echo ""
 
+# Optionally compile the task-creator date parser with Cython
+if python -c "import Cython" > /dev/null 2>&1; then
+    echo "Compiling task-creator date parser with Cython..."
+    # Remove any previous build so a failed build cannot leave a stale one
+    rm -f .claude/skills/task-creator/date_parser_c*.so
+    build_dir=$(mktemp -d)
+    cp .claude/skills/task-creator/date_parser.py "$build_dir/date_parser_c.py"
+    # Needs a C compiler and Python headers; fall back if they are missing
+    if (cd "$build_dir" && python -m Cython.Build.Cythonize -i -3 -X boundscheck=False date_parser_c.py > /dev/null 2>&1) \
+        && cp "$build_dir"/date_parser_c*.so .claude/skills/task-creator/; then
+        echo "✓ date_parser_c compiled (set SENTINEL_CYTHON=false to disable)"
+    else
+        echo "Cython build failed, using pure Python date parser"
+    fi
+    rm -rf "$build_dir"
+else
+    echo "✓ Cython not installed, using pure Python date parser"
+fi
+
+echo ""
+
 # Create .env file if it doesn't exist
 if [ ! -f ".env" ]; then
     echo "Creating .env file from template..."
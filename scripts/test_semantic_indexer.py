@@ -10,6 +10,7 @@ This script:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
@@ -58,14 +59,28 @@ def main():
     print("TESTING SEARCH MODES")
     print("=" * 70)
 
-    for query in test_queries:
+    top_k = 3
+
+    # Embed every test query in a single batch
+    query_embeddings = indexer.embed_batch(test_queries)
+
+    for query, query_embedding in zip(test_queries, query_embeddings):
         print(f"\n🔍 Query: \"{query}\"")
         print("-" * 70)
 
+        # Run the keyword scan and the embedding search side by side. Both
+        # fetch top_k * 2 results, as search_hybrid would, so the hybrid
+        # ranking can be fused from them without searching again.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            bm25_future = executor.submit(indexer.search_bm25, query, top_k=top_k * 2)
+            vector_future = executor.submit(
+                indexer.search_vector, query, top_k=top_k * 2, query_embedding=query_embedding
+            )
+
         # Test BM25 search
         print("\n📝 BM25 Search (keyword-based):")
         try:
-            bm25_results = indexer.search_bm25(query, top_k=3)
+            bm25_results = bm25_future.result()[:top_k]
             if bm25_results:
                 for r in bm25_results:
                     print(f"  [{r.rank}] Score: {r.score:.3f} | {Path(r.file_path).name}")
@@ -78,7 +93,7 @@ def main():
         # Test Vector search
         print("\n🧠 Vector Search (semantic similarity):")
         try:
-            vector_results = indexer.search_vector(query, top_k=3)
+            vector_results = vector_future.result()[:top_k]
             if vector_results:
                 for r in vector_results:
                     print(f"  [{r.rank}] Score: {r.score:.3f} | {Path(r.file_path).name}")
@@ -91,7 +106,9 @@ def main():
         # Test Hybrid search
         print("\n🔬 Hybrid Search (BM25 + Vector):")
         try:
-            hybrid_results = indexer.search_hybrid(query, top_k=3)
+            hybrid_results = indexer.search_hybrid_from(
+                bm25_future.result(), vector_future.result(), top_k=top_k
+            )
             if hybrid_results:
                 for r in hybrid_results:
                     print(f"  [{r.rank}] Score: {r.score:.3f} | {Path(r.file_path).name}")
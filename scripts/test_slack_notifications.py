@@ -7,20 +7,78 @@ This script sends a test heartbeat notification to verify Slack integration work
 
 import asyncio
 import sys
+import traceback
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from slack_sdk.web.async_client import AsyncWebClient
+from src.adapters.http_pool import close_pools, get_session
 from src.heartbeat.notifier import Notifier
 from src.utils.config import config
 from src.utils.logging_config import init_logging, get_logger
 
 logger = get_logger(__name__)
 
+# Fixed test payload, built once; each run only adds its own timestamp
+TEST_RESULTS = MappingProxyType({
+    "alerts": [
+        {
+            "source": "gmail",
+            "title": "Test Email Alert",
+            "message": "This is a test urgent email notification from Sentinel.\n\nFrom: test@example.com\nSubject: Test Alert",
+            "priority": "urgent",
+            "metadata": {"test": True}
+        },
+        {
+            "source": "calendar",
+            "title": "Test Meeting Alert",
+            "message": "Upcoming test meeting in 30 minutes\nTime: 2:00 PM (60 min)\nAttendees: 5",
+            "priority": "normal",
+            "metadata": {"test": True}
+        },
+        {
+            "source": "asana",
+            "title": "Test Task Alert",
+            "message": "Test task due today\nProject: Testing\nPriority: High",
+            "priority": "low",
+            "metadata": {"test": True}
+        }
+    ],
+    "summary": {
+        "total_monitors": 3,
+        "successful_monitors": 3,
+        "failed_monitors": 0,
+        "total_alerts": 3,
+        "alerts_by_priority": {
+            "urgent": 1,
+            "normal": 1,
+            "low": 1
+        },
+        "alerts_by_source": {
+            "gmail": 1,
+            "calendar": 1,
+            "asana": 1
+        }
+    },
+    "analysis": """
+Your most urgent item is the test email from test@example.com that requires immediate attention.
+
+You also have a meeting coming up in 30 minutes with 5 attendees - make sure you're prepared.
+
+The task in your Testing project is due today but has lower priority compared to the email and meeting.
+
+Recommendations:
+• Address the urgent email first (5-10 min)
+• Review meeting agenda before 2:00 PM
+• Complete the testing task after the meeting
+"""
+})
+
 
 async def test_slack_notifications():
     """Test sending notifications to Slack."""
@@ -42,7 +100,7 @@ async def test_slack_notifications():
 
     # Initialize Slack client
     print(f"📱 Connecting to Slack...")
-    slack_client = AsyncWebClient(token=config.SLACK_BOT_TOKEN)
+    slack_client = AsyncWebClient(token=config.SLACK_BOT_TOKEN, session=await get_session())
 
     # Test connection
     try:
@@ -60,60 +118,7 @@ async def test_slack_notifications():
 
     # Create test heartbeat results
     print("🧪 Creating test heartbeat results...")
-    test_results = {
-        "timestamp": datetime.now().isoformat(),
-        "alerts": [
-            {
-                "source": "gmail",
-                "title": "Test Email Alert",
-                "message": "This is a test urgent email notification from Sentinel.\n\nFrom: test@example.com\nSubject: Test Alert",
-                "priority": "urgent",
-                "metadata": {"test": True}
-            },
-            {
-                "source": "calendar",
-                "title": "Test Meeting Alert",
-                "message": "Upcoming test meeting in 30 minutes\nTime: 2:00 PM (60 min)\nAttendees: 5",
-                "priority": "normal",
-                "metadata": {"test": True}
-            },
-            {
-                "source": "asana",
-                "title": "Test Task Alert",
-                "message": "Test task due today\nProject: Testing\nPriority: High",
-                "priority": "low",
-                "metadata": {"test": True}
-            }
-        ],
-        "summary": {
-            "total_monitors": 3,
-            "successful_monitors": 3,
-            "failed_monitors": 0,
-            "total_alerts": 3,
-            "alerts_by_priority": {
-                "urgent": 1,
-                "normal": 1,
-                "low": 1
-            },
-            "alerts_by_source": {
-                "gmail": 1,
-                "calendar": 1,
-                "asana": 1
-            }
-        },
-        "analysis": """
-Your most urgent item is the test email from test@example.com that requires immediate attention.
-
-You also have a meeting coming up in 30 minutes with 5 attendees - make sure you're prepared.
-
-The task in your Testing project is due today but has lower priority compared to the email and meeting.
-
-Recommendations:
-• Address the urgent email first (5-10 min)
-• Review meeting agenda before 2:00 PM
-• Complete the testing task after the meeting
-"""
-    }
+    test_results = {**TEST_RESULTS, "timestamp": datetime.now().isoformat()}
 
     # Determine target channel
     target = config.SLACK_NOTIFICATION_CHANNEL or None
@@ -143,7 +148,6 @@ Recommendations:
     except Exception as e:
         print(f"   ❌ Failed to send notification: {e}")
         print()
-        import traceback
         traceback.print_exc()
         print()
         print("=" * 60)
@@ -163,7 +167,10 @@ async def main():
     # Initialize logging
     init_logging()
 
-    success = await test_slack_notifications()
+    try:
+        success = await test_slack_notifications()
+    finally:
+        await close_pools()
     sys.exit(0 if success else 1)
 
 
@@ -8,6 +8,9 @@ initialized without errors (without requiring actual API credentials).
 
 import sys
 import asyncio
+import importlib
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -15,6 +18,20 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+def import_parallel(*modules: str) -> None:
+    """
+    Import modules on a few threads so their file reads overlap.
+
+    The from-imports that follow then just look the modules up in
+    sys.modules. Import errors are re-raised here.
+
+    Args:
+        modules: Dotted module names
+    """
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(importlib.import_module, modules))
+
+
 async def validate_imports():
     """Validate all imports work."""
     print("=" * 60)
@@ -24,6 +41,13 @@ async def validate_imports():
 
     try:
         print("📦 Importing core components...")
+        import_parallel(
+            "src.heartbeat.scheduler",
+            "src.heartbeat.orchestrator",
+            "src.heartbeat.base_monitor",
+            "src.heartbeat.notifier",
+            "src.heartbeat.reasoning_engine"
+        )
         from src.heartbeat.scheduler import HeartbeatScheduler
         from src.heartbeat.orchestrator import HeartbeatOrchestrator
         from src.heartbeat.base_monitor import BaseMonitor, Alert
@@ -32,6 +56,11 @@ async def validate_imports():
         print("   ✅ Core components imported")
 
         print("\n📦 Importing monitors...")
+        import_parallel(
+            "src.heartbeat.gmail_monitor",
+            "src.heartbeat.calendar_monitor",
+            "src.heartbeat.asana_monitor"
+        )
         from src.heartbeat.gmail_monitor import GmailMonitor
         from src.heartbeat.calendar_monitor import CalendarMonitor
         from src.heartbeat.asana_monitor import AsanaMonitor
@@ -42,6 +71,11 @@ async def validate_imports():
         print("   ✅ Main application imported")
 
         print("\n📦 Importing dependencies...")
+        import_parallel(
+            "src.memory.session_logger",
+            "src.utils.config",
+            "src.utils.logging_config"
+        )
         from src.memory.session_logger import SessionLogger
         from src.utils.config import config
         from src.utils.logging_config import get_logger
@@ -105,7 +139,6 @@ async def validate_imports():
         print("\n" + "=" * 60)
         print(f"❌ VALIDATION FAILED: {e}")
         print("=" * 60)
-        import traceback
         traceback.print_exc()
         return False
 
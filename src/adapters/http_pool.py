@@ -0,0 +1,127 @@
+"""
+Shared HTTP connection pools for Slack and Claude API calls.
+
+slack_sdk's AsyncWebClient opens (and closes) a new aiohttp session for every
+API call unless it is given one, so each message pays a fresh TCP and TLS
+handshake with slack.com. Clients built on get_session() share one pool of
+kept-alive connections instead. get_anthropic_http_client() does the same
+for Claude clients, over HTTP/2 when the h2 package is installed.
+
+When orjson is installed, the shared session also uses it to serialize
+JSON request bodies (chat.postMessage and other block-carrying calls).
+"""
+
+import asyncio
+import importlib.util
+import json
+from typing import Any, Optional
+
+import aiohttp
+import httpx
+from anthropic import DefaultAsyncHttpxClient
+
+from ..utils.logging_config import get_logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = get_logger(__name__)
+
+# Cheap unauthenticated endpoint used to open the first connection early
+WARMUP_URL = "https://slack.com/api/api.test"
+WARMUP_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# HTTP/2 multiplexes concurrent Claude requests over one connection
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connections stay open between messages instead of httpx's default 5 s
+ANTHROPIC_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=60
+)
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a request body, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+_session: Optional[aiohttp.ClientSession] = None
+_anthropic_http: Optional[httpx.AsyncClient] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session, creating it on first use.
+
+    Must be called from the event loop the session will be used on.
+
+    Returns:
+        Shared client session
+    """
+    global _session
+
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            ),
+            json_serialize=_json_dumps
+        )
+
+    return _session
+
+
+def get_anthropic_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for AsyncAnthropic, creating it on first use.
+
+    Example:
+        claude = AsyncAnthropic(api_key=key, http_client=get_anthropic_http_client())
+
+    Returns:
+        Pooled (HTTP/2 if available) httpx client with the SDK's defaults
+    """
+    global _anthropic_http
+
+    if _anthropic_http is None or _anthropic_http.is_closed:
+        _anthropic_http = DefaultAsyncHttpxClient(
+            http2=HTTP2_AVAILABLE,
+            limits=ANTHROPIC_LIMITS
+        )
+
+    return _anthropic_http
+
+
+async def warm_up() -> None:
+    """Open a connection to Slack ahead of the first API call."""
+    session = await get_session()
+
+    try:
+        async with session.get(WARMUP_URL, timeout=WARMUP_TIMEOUT) as response:
+            await response.read()
+        logger.debug("HTTP pool warmed up", status=response.status)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        # Not fatal: the first real call opens the connection instead
+        logger.debug("HTTP pool warm-up failed", error=str(e))
+
+
+async def close_pools() -> None:
+    """Close the shared clients and their pooled connections."""
+    global _session, _anthropic_http
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+
+    if _anthropic_http is not None:
+        await _anthropic_http.aclose()
+
+    _session = None
+    _anthropic_http = None
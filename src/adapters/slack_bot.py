@@ -5,9 +5,11 @@ Integrates Slack client with Claude API for intelligent responses.
 """
 
 import asyncio
-from typing import List, Dict, Optional
+import time
+from typing import Any, Awaitable, Callable, List, Dict, Optional
 from anthropic import AsyncAnthropic
 
+from .http_pool import close_pools, get_anthropic_http_client, warm_up
 from .slack_client import SlackClient
 from .slack_formatter import SlackFormatter
 from ..memory.session_logger import SessionLogger
@@ -16,6 +18,30 @@ from ..utils.config import config
 
 logger = get_logger(__name__)
 
+# Minimum seconds between partial-response updates while streaming; Slack
+# allows about one message update per second per channel
+STREAM_UPDATE_INTERVAL = 1.0
+
+_SYSTEM_PROMPT = """You are Sentinel, an AI assistant integrated with Slack.
+
+You help users by:
+- Answering questions clearly and concisely
+- Maintaining context across conversations
+- Being helpful, harmless, and honest
+
+Communication style:
+- Be conversational and friendly
+- Use Slack markdown formatting when appropriate
+- Keep responses concise (aim for 1-2 paragraphs unless more detail is requested)
+- Use emojis sparingly and only when it enhances communication
+
+You have access to conversation history and can remember previous interactions
+within the current thread. Use this context to provide more relevant and
+personalized responses.
+
+If you're unsure about something, say so. If you make a mistake, acknowledge it.
+"""
+
 
 class SlackBot:
     """
@@ -34,8 +60,17 @@ class SlackBot:
         )
         self.formatter = SlackFormatter()
 
-        # Initialize Claude client
-        self.claude = AsyncAnthropic(api_key=config.ANTHROPIC_API_KEY)
+        # Initialize Claude client on the shared connection pool
+        self.claude = AsyncAnthropic(
+            api_key=config.ANTHROPIC_API_KEY,
+            http_client=get_anthropic_http_client()
+        )
+
+        # Request settings are fixed for the bot's lifetime
+        self._system_prompt = self._build_system_prompt()
+        self._model = config.CLAUDE_MODEL
+        self._max_tokens = config.CLAUDE_MAX_TOKENS
+        self._temperature = config.CLAUDE_TEMPERATURE
 
         logger.info("Slack bot initialized")
 
@@ -43,15 +78,19 @@ class SlackBot:
         self,
         message: str,
         context: List[Dict[str, str]],
-        session_id: str
+        session_id: str,
+        on_partial: Optional[Callable[[str], Awaitable[None]]] = None
     ) -> str:
         """
         Handle incoming message and generate response.
 
         Args:
             message: User message text
-            context: Conversation context (previous messages)
+            context: Conversation context (previous messages); extended in place
             session_id: Session ID for this conversation
+            on_partial: If given, the response is streamed and this is
+                awaited with the formatted text so far, at most every
+                STREAM_UPDATE_INTERVAL seconds
 
         Returns:
             Bot response text
@@ -59,11 +98,8 @@ class SlackBot:
         try:
             logger.info("Processing message", session_id=session_id[:8], message_preview=message[:50])
 
-            # Prepare system prompt
-            system_prompt = self._build_system_prompt()
-
-            # Prepare messages for Claude
-            messages = context.copy()
+            # Prepare messages for Claude (context is ours to extend)
+            messages = context
             if not messages or messages[-1]["role"] != "user":
                 messages.append({
                     "role": "user",
@@ -71,24 +107,23 @@ class SlackBot:
                 })
 
             # Call Claude API
-            response = await self.claude.messages.create(
-                model=config.CLAUDE_MODEL,
-                max_tokens=config.CLAUDE_MAX_TOKENS,
-                temperature=config.CLAUDE_TEMPERATURE,
-                system=system_prompt,
-                messages=messages
-            )
+            request = {
+                "model": self._model,
+                "max_tokens": self._max_tokens,
+                "temperature": self._temperature,
+                "system": self._system_prompt,
+                "messages": messages
+            }
+            if on_partial is None:
+                response = await self.claude.messages.create(**request)
+            else:
+                response = await self._stream_response(request, on_partial)
 
             # Extract response text
             response_text = response.content[0].text
 
             # Format for Slack
-            formatted_response = self.formatter.markdown_to_slack(response_text)
-
-            # Truncate if too long
-            if len(formatted_response) > 3000:
-                chunks = self.formatter.split_long_message(formatted_response)
-                formatted_response = chunks[0] + "\n\n_[Response truncated - too long]_"
+            formatted_response = self._format_response(response_text)
 
             logger.info(
                 "Response generated",
@@ -103,40 +138,70 @@ class SlackBot:
             logger.error("Error generating response", error=str(e), exc_info=True)
             return "I encountered an error generating a response. Please try again."
 
-    def _build_system_prompt(self) -> str:
+    async def _stream_response(
+        self,
+        request: Dict[str, Any],
+        on_partial: Callable[[str], Awaitable[None]]
+    ) -> Any:
         """
-        Build system prompt for Claude.
+        Stream a Claude response, reporting the text as it grows.
+
+        Args:
+            request: messages.create arguments
+            on_partial: Awaited with the formatted text so far
 
         Returns:
-            System prompt text
+            The final Claude message
         """
-        return """You are Sentinel, an AI assistant integrated with Slack.
+        parts = []
+        last_update = time.monotonic()
 
-You help users by:
-- Answering questions clearly and concisely
-- Maintaining context across conversations
-- Being helpful, harmless, and honest
+        async with self.claude.messages.stream(**request) as stream:
+            async for text in stream.text_stream:
+                parts.append(text)
+                now = time.monotonic()
+                if now - last_update >= STREAM_UPDATE_INTERVAL:
+                    last_update = now
+                    await on_partial(self._format_response("".join(parts)))
 
-Communication style:
-- Be conversational and friendly
-- Use Slack markdown formatting when appropriate
-- Keep responses concise (aim for 1-2 paragraphs unless more detail is requested)
-- Use emojis sparingly and only when it enhances communication
+            return await stream.get_final_message()
 
-You have access to conversation history and can remember previous interactions
-within the current thread. Use this context to provide more relevant and
-personalized responses.
+    def _format_response(self, text: str) -> str:
+        """
+        Convert a Claude response to Slack markdown that fits in one message.
 
-If you're unsure about something, say so. If you make a mistake, acknowledge it.
-"""
+        Args:
+            text: Response text from Claude
+
+        Returns:
+            Formatted text, truncated if too long
+        """
+        formatted = self.formatter.markdown_to_slack(text)
+
+        # Truncate if too long
+        if len(formatted) > 3000:
+            chunks = self.formatter.split_long_message(formatted)
+            formatted = chunks[0] + "\n\n_[Response truncated - too long]_"
+
+        return formatted
+
+    @staticmethod
+    def _build_system_prompt() -> str:
+        """
+        Build system prompt for Claude.
+
+        Returns:
+            System prompt text
+        """
+        return _SYSTEM_PROMPT
 
     async def start(self) -> None:
         """Start the Slack bot."""
         logger.info("Starting Slack bot...")
 
         try:
-            # Initialize session logger
-            await self.session_logger.initialize()
+            # Initialize session logger and open a connection to Slack
+            await asyncio.gather(self.session_logger.initialize(), warm_up())
 
             # Start Slack client (this will block)
             await self.slack_client.start()
@@ -156,6 +221,7 @@ If you're unsure about something, say so. If you make a mistake, acknowledge it.
         try:
             await self.slack_client.stop()
             await self.session_logger.close()
+            await close_pools()
 
             logger.info("Slack bot stopped")
 
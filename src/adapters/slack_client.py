@@ -6,18 +6,143 @@ integrating with the memory system for persistent conversations.
 """
 
 import asyncio
-from typing import Optional, Dict, Any, Callable
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Callable, Coroutine, List, Set, Tuple
 from slack_bolt.async_app import AsyncApp
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
+from .http_pool import get_session
+from ..memory.models import Message
 from ..memory.session_logger import SessionLogger
 from ..utils.logging_config import get_logger
 from ..utils.config import config
 
 logger = get_logger(__name__)
 
+# Replies to the same thread within this window are posted together
+SEND_BATCH_DELAY = 0.05
+
+# Longest text posted in one chat.postMessage call
+MAX_MESSAGE_LENGTH = 3000
+
+# Queued session-log writes are flushed in batches of up to this many
+# messages, collected for at most LOG_BATCH_WAIT seconds
+LOG_BATCH_SIZE = 64
+LOG_BATCH_WAIT = 0.1
+
+# Number of recent event IDs remembered to drop Slack's retries
+_SEEN_MAX = 4096
+
+# Message subtypes that are never answered (bot posts and edits)
+_IGNORED_SUBTYPES = frozenset({"bot_message", "message_changed", "message_deleted"})
+
+# users.info / conversations.info results are reused for this long
+INFO_CACHE_TTL = 600
+INFO_CACHE_MAX = 1024
+
+# Slack markup in incoming text: user mentions, channel links, URLs and
+# the three HTML entities Slack escapes, matched in a single pass
+_SLACK_MARKUP_RE = re.compile(
+    r'<@(?P<user>[A-Z0-9]+)>'
+    r'|<#[A-Z0-9]+\|(?P<channel>[^>]*)>'
+    r'|<(?P<url>https?://[^|>]+)(?:\|(?P<label>[^>]+))?>'
+    r'|&(?P<entity>amp|lt|gt);'
+)
+_HTML_ENTITIES = {'amp': '&', 'lt': '<', 'gt': '>'}
+
+
+@dataclass
+class _PendingFlush:
+    """Texts waiting to be posted to one thread, each with its sender's future."""
+    texts: List[str] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+
+
+class _TTLCache:
+    """Bounded mapping whose entries expire after a fixed time."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Entries kept before the oldest is evicted
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._data[key]
+            return None
+        return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class _StreamingReply:
+    """A reply posted with the first partial response and edited as it grows."""
+
+    def __init__(self, slack: "SlackClient", channel: str, thread_ts: Optional[str]):
+        """
+        Initialize streaming reply.
+
+        Args:
+            slack: Client used to post and edit the reply
+            channel: Channel ID
+            thread_ts: Thread timestamp
+        """
+        self.slack = slack
+        self.channel = channel
+        self.thread_ts = thread_ts
+        self.ts: Optional[str] = None
+        self._text: Optional[str] = None
+
+    async def update(self, text: str) -> None:
+        """
+        Show the response so far, posting the reply on the first call.
+
+        Args:
+            text: Formatted response text
+        """
+        if text == self._text:
+            return
+        self._text = text
+
+        if self.ts is None:
+            response = await self.slack._post_message(self.channel, text, self.thread_ts)
+            self.ts = response["ts"]
+        else:
+            await self.slack.client.chat_update(channel=self.channel, ts=self.ts, text=text)
+
+    async def finish(self, text: str) -> None:
+        """
+        Show the final response; sent as a normal message if nothing streamed.
+
+        Args:
+            text: Formatted response text
+        """
+        if self.ts is None:
+            await self.slack._send_message(channel=self.channel, text=text, thread_ts=self.thread_ts)
+        else:
+            await self.update(text)
+
 
 class SlackClient:
     """
@@ -30,7 +155,9 @@ class SlackClient:
     def __init__(
         self,
         session_logger: Optional[SessionLogger] = None,
-        message_handler: Optional[Callable] = None
+        message_handler: Optional[Callable] = None,
+        send_batch_enabled: bool = True,
+        stream_replies: bool = True
     ):
         """
         Initialize Slack client.
@@ -38,9 +165,15 @@ class SlackClient:
         Args:
             session_logger: SessionLogger instance for memory persistence
             message_handler: Async callable to handle incoming messages
+            send_batch_enabled: Combine text replies sent to the same thread
+                within SEND_BATCH_DELAY into one API call
+            stream_replies: Pass the handler an on_partial callback that
+                posts the reply early and edits it as the response grows
         """
         self.session_logger = session_logger or SessionLogger()
         self.message_handler = message_handler
+        self.send_batch_enabled = send_batch_enabled
+        self.stream_replies = stream_replies
 
         # Initialize Slack Bolt app
         self.app = AsyncApp(
@@ -48,16 +181,37 @@ class SlackClient:
             signing_secret=config.SLACK_SIGNING_SECRET
         )
 
-        # Web client for API calls
+        # Web client for API calls (gets the shared HTTP pool in start())
         self.client: AsyncWebClient = self.app.client
 
         # Socket mode handler (will be initialized in start())
         self.socket_handler: Optional[AsyncSocketModeHandler] = None
 
+        # Bot user ID, so only its own mention is stripped (set in start())
+        self.bot_user_id: Optional[str] = None
+
         # Connection state
         self.is_connected = False
         self.is_running = False
 
+        # Background tasks handling events (kept referenced until done)
+        self._inflight: Set[asyncio.Task] = set()
+
+        # Recently handled event IDs, oldest first
+        self._seen: OrderedDict[str, None] = OrderedDict()
+
+        # Replies waiting to be posted, keyed by (channel, thread_ts)
+        self._pending: Dict[Tuple[str, Optional[str]], _PendingFlush] = {}
+
+        # users.info / conversations.info results, and the lookups in flight
+        self._user_cache = _TTLCache(INFO_CACHE_MAX, INFO_CACHE_TTL)
+        self._channel_cache = _TTLCache(INFO_CACHE_MAX, INFO_CACHE_TTL)
+        self._info_locks: Dict[str, asyncio.Lock] = {}
+
+        # Messages waiting to be logged, written by _drain_logs (started in start())
+        self._log_q: asyncio.Queue = asyncio.Queue()
+        self._log_worker: Optional[asyncio.Task] = None
+
         # Register event handlers
         self._register_handlers()
 
@@ -68,15 +222,19 @@ class SlackClient:
 
         # Handle direct messages
         @self.app.event("message")
-        async def handle_message_events(event, say, client):
+        async def handle_message_events(body, event, say, client):
             """Handle incoming message events."""
-            await self._handle_message(event, say, client)
+            if self._is_ignored(event) or self._is_duplicate(body, event):
+                return
+            self._spawn(self._handle_message(event, say, client))
 
         # Handle app mentions in channels
         @self.app.event("app_mention")
-        async def handle_app_mention(event, say, client):
+        async def handle_app_mention(body, event, say, client):
             """Handle @mentions of the bot."""
-            await self._handle_mention(event, say, client)
+            if self._is_ignored(event) or self._is_duplicate(body, event):
+                return
+            self._spawn(self._handle_mention(event, say, client))
 
         # Handle app home opened
         @self.app.event("app_home_opened")
@@ -86,6 +244,70 @@ class SlackClient:
 
         logger.debug("Slack event handlers registered")
 
+    @staticmethod
+    def _is_ignored(event: Dict[str, Any]) -> bool:
+        """
+        Check whether an event comes from a bot or is an edit/deletion.
+
+        Runs before deduplication and task creation, so the many bot
+        messages and edits in busy channels are dropped cheaply.
+
+        Args:
+            event: Slack event payload
+
+        Returns:
+            True if the event should not be answered
+        """
+        return bool(event.get("bot_id")) or event.get("subtype") in _IGNORED_SUBTYPES
+
+    def _is_duplicate(self, body: Dict[str, Any], event: Dict[str, Any]) -> bool:
+        """
+        Check whether an event was already handled, and remember it if not.
+
+        Slack redelivers an event (same event_id) when it was not acked in
+        time; handling it again would run Claude and reply twice.
+
+        Args:
+            body: Event envelope
+            event: Slack event payload
+
+        Returns:
+            True if the event was seen before
+        """
+        key = body.get("event_id") or f"{event.get('type')}:{event.get('channel')}:{event.get('ts')}"
+        if key in self._seen:
+            logger.debug("Dropping duplicate event", event_id=key)
+            return True
+
+        self._seen[key] = None
+        if len(self._seen) > _SEEN_MAX:
+            self._seen.popitem(last=False)
+        return False
+
+    def _spawn(self, coro: Coroutine) -> asyncio.Task:
+        """
+        Run an event handler in the background.
+
+        Event listeners return right away, so Bolt acknowledges the event
+        without waiting for the Claude call and Slack does not retry it.
+
+        Args:
+            coro: Handler coroutine
+
+        Returns:
+            The scheduled task
+        """
+        task = asyncio.create_task(coro)
+        self._inflight.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        """Forget a finished handler task and log its failure, if any."""
+        self._inflight.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error("Unhandled error in event handler", error=str(task.exception()))
+
     async def _handle_message(self, event: Dict[str, Any], say: Callable, client: AsyncWebClient) -> None:
         """
         Handle incoming message events.
@@ -95,19 +317,11 @@ class SlackClient:
             say: Function to send messages
             client: Slack web client
         """
-        # Ignore bot messages and message changes
-        if event.get("subtype") in ["bot_message", "message_changed", "message_deleted"]:
-            return
-
-        # Ignore messages from this bot
-        if event.get("bot_id"):
-            return
-
         # Extract message details
         user_id = event.get("user")
         channel_id = event.get("channel")
         thread_ts = event.get("thread_ts") or event.get("ts")  # Use thread_ts if in thread, else message ts
-        text = event.get("text", "").strip()
+        text = self._normalize(event.get("text", ""))
 
         logger.info(
             "Message received",
@@ -120,55 +334,27 @@ class SlackClient:
         # Get or create session for this thread
         session = await self.session_logger.get_or_create_session(
             adapter="slack",
-            channel_id=f"{channel_id}:{thread_ts}",  # Unique per thread
+            channel_id=(channel_id, thread_ts),  # Unique per thread
             user_id=user_id
         )
 
-        # Log user message
-        await self.session_logger.log_user_message(
-            content=text,
-            session_id=session.id,
-            metadata={
-                "channel_id": channel_id,
-                "thread_ts": thread_ts,
-                "ts": event.get("ts"),
-                "user_id": user_id
-            }
-        )
+        # Log user message in the background while Claude runs
+        self._queue_log("user", text, session.id, {
+            "channel_id": channel_id,
+            "thread_ts": thread_ts,
+            "ts": event.get("ts"),
+            "user_id": user_id
+        })
 
         # Process message with handler
         if self.message_handler:
             try:
-                # Show typing indicator
-                await self._send_typing_indicator(channel_id)
-
                 # Get conversation context
                 context = await self.session_logger.get_context_window(session.id)
+                self._ensure_user_turn(context, text)
 
-                # Call message handler
-                response = await self.message_handler(
-                    message=text,
-                    context=context,
-                    session_id=session.id
-                )
-
-                # Send response
-                if response:
-                    await self._send_message(
-                        channel=channel_id,
-                        text=response,
-                        thread_ts=thread_ts
-                    )
-
-                    # Log assistant response
-                    await self.session_logger.log_assistant_message(
-                        content=response,
-                        session_id=session.id,
-                        metadata={
-                            "channel_id": channel_id,
-                            "thread_ts": thread_ts
-                        }
-                    )
+                # Call message handler, then send and log its response
+                await self._respond(text, context, session.id, channel_id, thread_ts)
 
             except Exception as e:
                 logger.error("Error handling message", error=str(e), exc_info=True)
@@ -190,10 +376,7 @@ class SlackClient:
         user_id = event.get("user")
         channel_id = event.get("channel")
         thread_ts = event.get("thread_ts") or event.get("ts")
-        text = event.get("text", "").strip()
-
-        # Remove bot mention from text
-        text = self._remove_bot_mention(text)
+        text = self._normalize(event.get("text", ""))
 
         logger.info(
             "App mentioned",
@@ -206,47 +389,26 @@ class SlackClient:
         # Get or create session
         session = await self.session_logger.get_or_create_session(
             adapter="slack",
-            channel_id=f"{channel_id}:{thread_ts}",
+            channel_id=(channel_id, thread_ts),
             user_id=user_id
         )
 
-        # Log user message
-        await self.session_logger.log_user_message(
-            content=text,
-            session_id=session.id,
-            metadata={
-                "channel_id": channel_id,
-                "thread_ts": thread_ts,
-                "ts": event.get("ts"),
-                "user_id": user_id,
-                "mention": True
-            }
-        )
+        # Log user message in the background while Claude runs
+        self._queue_log("user", text, session.id, {
+            "channel_id": channel_id,
+            "thread_ts": thread_ts,
+            "ts": event.get("ts"),
+            "user_id": user_id,
+            "mention": True
+        })
 
         # Process with handler
         if self.message_handler:
             try:
-                await self._send_typing_indicator(channel_id)
-
                 context = await self.session_logger.get_context_window(session.id)
+                self._ensure_user_turn(context, text)
 
-                response = await self.message_handler(
-                    message=text,
-                    context=context,
-                    session_id=session.id
-                )
-
-                if response:
-                    await say(text=response, thread_ts=thread_ts)
-
-                    await self.session_logger.log_assistant_message(
-                        content=response,
-                        session_id=session.id,
-                        metadata={
-                            "channel_id": channel_id,
-                            "thread_ts": thread_ts
-                        }
-                    )
+                await self._respond(text, context, session.id, channel_id, thread_ts)
 
             except Exception as e:
                 logger.error("Error handling mention", error=str(e), exc_info=True)
@@ -255,19 +417,208 @@ class SlackClient:
                     thread_ts=thread_ts
                 )
 
-    def _remove_bot_mention(self, text: str) -> str:
+    async def _respond(
+        self,
+        text: str,
+        context: List[Dict[str, str]],
+        session_id: str,
+        channel_id: str,
+        thread_ts: str
+    ) -> None:
         """
-        Remove bot mention from message text.
+        Run the message handler and deliver its response.
+
+        With stream_replies, the reply appears as soon as the handler
+        reports partial text and is edited into the final response.
+        The response is queued for logging before it is sent.
 
         Args:
-            text: Message text
+            text: User message text
+            context: Conversation context
+            session_id: Session ID
+            channel_id: Channel ID
+            thread_ts: Thread timestamp
+        """
+        reply = _StreamingReply(self, channel_id, thread_ts) if self.stream_replies else None
+        kwargs = {"on_partial": reply.update} if reply else {}
+
+        response = await self.message_handler(
+            message=text,
+            context=context,
+            session_id=session_id,
+            **kwargs
+        )
+
+        if response:
+            self._queue_log("assistant", response, session_id, {
+                "channel_id": channel_id,
+                "thread_ts": thread_ts
+            })
+
+            if reply:
+                await reply.finish(response)
+            else:
+                await self._send_message(channel=channel_id, text=response, thread_ts=thread_ts)
+
+    def _ensure_user_turn(self, context: List[Dict[str, str]], text: str) -> None:
+        """
+        Make sure the context ends with the message being answered.
+
+        The message is logged in the background, so the context read may
+        not include it yet.
+
+        Args:
+            context: Context window (modified in place)
+            text: User message text
+        """
+        turn = {"role": "user", "content": text}
+        if not context or context[-1] != turn:
+            context.append(turn)
+
+    async def get_user_info(self, user_id: str) -> Dict[str, Any]:
+        """
+        Get a user's profile, cached for INFO_CACHE_TTL seconds.
+
+        Args:
+            user_id: Slack user ID
+
+        Returns:
+            The "user" object from users.info
+        """
+        return await self._cached_info(self._user_cache, user_id, self._fetch_user)
+
+    async def get_channel_info(self, channel_id: str) -> Dict[str, Any]:
+        """
+        Get a channel's metadata, cached for INFO_CACHE_TTL seconds.
+
+        Args:
+            channel_id: Slack channel ID
+
+        Returns:
+            The "channel" object from conversations.info
+        """
+        return await self._cached_info(self._channel_cache, channel_id, self._fetch_channel)
+
+    async def _fetch_user(self, user_id: str) -> Dict[str, Any]:
+        """Call users.info."""
+        return (await self.client.users_info(user=user_id))["user"]
+
+    async def _fetch_channel(self, channel_id: str) -> Dict[str, Any]:
+        """Call conversations.info."""
+        return (await self.client.conversations_info(channel=channel_id))["channel"]
+
+    async def _cached_info(
+        self,
+        cache: _TTLCache,
+        key: str,
+        fetch: Callable[[str], Coroutine]
+    ) -> Dict[str, Any]:
+        """
+        Look up a cached API result, fetching it at most once per key.
+
+        Concurrent misses for the same key wait on one lock, so only the
+        first caller hits the API.
+
+        Args:
+            cache: Cache to read and fill
+            key: User or channel ID
+            fetch: Coroutine function that calls the API
+
+        Returns:
+            Cached or fetched result
+        """
+        info = cache.get(key)
+        if info is not None:
+            return info
+
+        lock = self._info_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                info = cache.get(key)
+                if info is None:
+                    info = await fetch(key)
+                    cache.set(key, info)
+                return info
+        finally:
+            if not lock.locked():
+                self._info_locks.pop(key, None)
+
+    def _queue_log(self, role: str, content: str, session_id: str, metadata: Dict[str, Any]) -> None:
+        """
+        Queue a message for the background log writer.
+
+        The message is built (and timestamped) now, so queued messages keep
+        the order they were sent in.
+
+        Args:
+            role: Message role ('user' or 'assistant')
+            content: Message content
+            session_id: Session ID
+            metadata: Message metadata
+        """
+        self._log_q.put_nowait(Message(
+            session_id=session_id,
+            role=role,
+            content=content,
+            metadata=metadata
+        ))
+
+    async def _drain_logs(self) -> None:
+        """Write queued messages to the session logger in batches."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._log_q.get()]
+
+            # Collect whatever else arrives shortly after
+            deadline = loop.time() + LOG_BATCH_WAIT
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(await asyncio.wait_for(self._log_q.get(), deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self.session_logger.log_messages_bulk(batch)
+            except Exception as e:
+                logger.error("Failed to log messages", error=str(e), count=len(batch), exc_info=True)
+            finally:
+                for _ in batch:
+                    self._log_q.task_done()
+
+    def _normalize(self, text: str) -> str:
+        """
+        Convert Slack markup in message text to plain text.
+
+        Removes the bot's mention, turns channel links into #name and URL
+        links into their label and address, and unescapes &amp;, &lt; and
+        &gt;, all in one regex pass.
+
+        Args:
+            text: Message text as received from Slack
 
         Returns:
-            Text with bot mention removed
+            Plain message text
         """
-        # Remove <@BOTID> pattern
-        import re
-        return re.sub(r'<@[A-Z0-9]+>', '', text).strip()
+        return _SLACK_MARKUP_RE.sub(self._replace_markup, text).strip()
+
+    def _replace_markup(self, match: re.Match) -> str:
+        """Return the plain-text replacement for one _SLACK_MARKUP_RE match."""
+        kind = match.lastgroup
+        if kind == 'entity':
+            return _HTML_ENTITIES[match['entity']]
+        if kind == 'user':
+            # Until the bot's ID is known every mention is treated as its own
+            if self.bot_user_id is None or match['user'] == self.bot_user_id:
+                return ''
+            return match.group()
+        if kind == 'channel':
+            return '#' + match['channel']
+        # URL, with or without a label
+        url, label = match['url'], match['label']
+        if label is None or label in url:
+            return url
+        return f"{label} ({url})"
 
     async def _send_message(
         self,
@@ -279,6 +630,94 @@ class SlackClient:
         """
         Send a message to Slack.
 
+        With send_batch_enabled, plain text messages are buffered briefly
+        and posted together with other messages for the same thread.
+
+        Args:
+            channel: Channel ID
+            text: Message text
+            thread_ts: Thread timestamp (for threading)
+            blocks: Optional Slack blocks for rich formatting
+
+        Returns:
+            Slack API response (of the call that posted this text, for
+            batched messages)
+        """
+        if self.send_batch_enabled and blocks is None:
+            key = (channel, thread_ts)
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = _PendingFlush()
+                self._spawn(self._flush_after(SEND_BATCH_DELAY, key))
+            future = asyncio.get_running_loop().create_future()
+            # Retrieve the result even if the sender was cancelled, so a
+            # failed post is not reported as a never-retrieved exception
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            pending.texts.append(text)
+            pending.futures.append(future)
+            # Shielded so cancelling the sender leaves the future for the flush to resolve
+            return await asyncio.shield(future)
+
+        return await self._post_message(channel, text, thread_ts, blocks)
+
+    async def _flush_after(self, delay: float, key: Tuple[str, Optional[str]]) -> None:
+        """
+        Post the messages buffered for a thread once the batch window closes.
+
+        Args:
+            delay: Seconds to wait for more messages
+            key: (channel, thread_ts) of the buffer
+        """
+        await asyncio.sleep(delay)
+        pending = self._pending.pop(key)
+        channel, thread_ts = key
+
+        # Each post resolves the senders whose texts it carried; if one
+        # fails, only the senders of that post and later ones get the error,
+        # since the earlier texts were delivered and must not be resent
+        futures = iter(pending.futures)
+        for text, count in self._join_messages(pending.texts):
+            senders = [next(futures) for _ in range(count)]
+            try:
+                response = await self._post_message(channel, text, thread_ts)
+            except Exception as e:
+                for future in [*senders, *futures]:
+                    future.set_exception(e)
+                return
+            for future in senders:
+                future.set_result(response)
+
+    def _join_messages(self, texts: List[str]) -> List[Tuple[str, int]]:
+        """
+        Join messages with newlines into as few texts as fit Slack's limit.
+
+        Args:
+            texts: Messages in send order
+
+        Returns:
+            (text, count) pairs, where text joins the next count messages and
+            is at most MAX_MESSAGE_LENGTH characters, except for single
+            messages that are already longer
+        """
+        joined = [(texts[0], 1)]
+        for text in texts[1:]:
+            last, count = joined[-1]
+            if len(last) + 1 + len(text) > MAX_MESSAGE_LENGTH:
+                joined.append((text, 1))
+            else:
+                joined[-1] = (f"{last}\n{text}", count + 1)
+        return joined
+
+    async def _post_message(
+        self,
+        channel: str,
+        text: str,
+        thread_ts: Optional[str] = None,
+        blocks: Optional[list] = None
+    ) -> Dict[str, Any]:
+        """
+        Post a message with one chat.postMessage call.
+
         Args:
             channel: Channel ID
             text: Message text
@@ -303,20 +742,6 @@ class SlackClient:
             logger.error("Failed to send message", error=str(e), channel=channel)
             raise
 
-    async def _send_typing_indicator(self, channel: str) -> None:
-        """
-        Send typing indicator to show bot is processing.
-
-        Args:
-            channel: Channel ID
-        """
-        try:
-            # Note: Slack doesn't have a built-in typing indicator for bots
-            # This is a placeholder for future implementation
-            pass
-        except Exception as e:
-            logger.debug("Failed to send typing indicator", error=str(e))
-
     async def start(self) -> None:
         """Start the Slack Socket Mode connection."""
         if self.is_running:
@@ -324,8 +749,13 @@ class SlackClient:
             return
 
         try:
-            # Initialize session logger
-            await self.session_logger.initialize()
+            # Reuse pooled connections for every API call, including the
+            # per-request clients Bolt derives from app.client
+            self.client.session = await get_session()
+
+            # Database setup and the auth.test round trip are independent
+            await asyncio.gather(self.session_logger.initialize(), self._look_up_bot_user())
+            self._log_worker = asyncio.create_task(self._drain_logs())
 
             # Create socket mode handler
             self.socket_handler = AsyncSocketModeHandler(
@@ -335,23 +765,37 @@ class SlackClient:
 
             logger.info("Starting Slack Socket Mode connection...")
 
-            # Start the handler (this will block)
-            await self.socket_handler.start_async()
+            await self.socket_handler.connect_async()
 
             self.is_connected = True
             self.is_running = True
 
             logger.info("Slack Socket Mode connection established")
 
+            # Block until cancelled, as start_async() would
+            await asyncio.sleep(float("inf"))
+
         except Exception as e:
             logger.error("Failed to start Slack client", error=str(e), exc_info=True)
             self.is_connected = False
             self.is_running = False
+            if self._log_worker:
+                self._log_worker.cancel()
+                self._log_worker = None
             raise
 
+    async def _look_up_bot_user(self) -> None:
+        """Look up the bot's user ID so only its own mention is stripped."""
+        try:
+            self.bot_user_id = (await self.client.auth_test())["user_id"]
+        except SlackApiError as e:
+            logger.warning("Could not look up bot user ID", error=str(e))
+
     async def stop(self) -> None:
         """Stop the Slack Socket Mode connection."""
-        if not self.is_running:
+        # The log writer runs from before the connection is made, so it is
+        # stopped even if start() never got as far as connecting
+        if not self.is_running and self._log_worker is None:
             logger.warning("Slack client not running")
             return
 
@@ -361,6 +805,16 @@ class SlackClient:
             if self.socket_handler:
                 await self.socket_handler.close_async()
 
+            # Let handlers still running finish before closing the logger
+            if self._inflight:
+                await asyncio.gather(*self._inflight, return_exceptions=True)
+
+            # Write out queued messages, then stop the writer
+            if self._log_worker:
+                await self._log_q.join()
+                self._log_worker.cancel()
+                self._log_worker = None
+
             await self.session_logger.close()
 
             self.is_connected = False
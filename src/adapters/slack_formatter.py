@@ -5,9 +5,98 @@ Converts between Markdown and Slack's mrkdwn format,
 and provides helpers for creating Slack blocks.
 """
 
+import json
 import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Markdown -> mrkdwn patterns, applied in this order by markdown_to_slack
+_BOLD = re.compile(r'\*\*(.+?)\*\*|__(.+?)__')
+_ITALIC = re.compile(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)')
+_LINK = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+
+# Characters at least one of the patterns above needs; text without any
+# of them is returned unchanged
+_MARKUP_CHARS = ('*', '_', '[', '~')
+
+# ```language\ncode\n```
+_CODE_BLOCK = re.compile(r'```(\w+)?\n(.*?)```', re.DOTALL)
+
+# Appended by truncate_text; the result is at most max_length long
+_TRUNC_SUFFIX = "\n\n_[Truncated...]_"
+_TRUNC_SUFFIX_LEN = len(_TRUNC_SUFFIX)
+
+# Headers of format_error_message / format_success_message
+_ERROR_PREFIX = ":warning: *Error*\n"
+_SUCCESS_PREFIX = ":white_check_mark: "
+
+
+def _section(text: str) -> Dict[str, Any]:
+    """Build a mrkdwn section block."""
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+# Shared divider block; Slack blocks are never mutated after being built
+_DIVIDER = {"type": "divider"}
+
+# Serialized _section() around its JSON-escaped text
+_SECTION_JSON_HEAD = b'{"type":"section","text":{"type":"mrkdwn","text":'
+_SECTION_JSON_TAIL = b'}}'
+
+
+def _json_string(text: str) -> bytes:
+    """JSON-encode a string, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(text)
+    return json.dumps(text, ensure_ascii=False).encode()
+
+
+def _bold(match: re.Match) -> str:
+    """Replacement for _BOLD: whichever delimiter matched becomes *...*."""
+    # Bold of the other kind nested inside is converted as well
+    return f"*{_BOLD.sub(_bold, match.group(1) or match.group(2))}*"
+
+
+def _convert_markdown(text: str) -> str:
+    """Run the Markdown -> mrkdwn substitutions (see markdown_to_slack)."""
+    # Each regex runs only if a substring it needs is present; `in` is a
+    # C-level search, far cheaper than a regex pass that finds nothing
+
+    # Bold: **text** or __text__ -> *text*
+    if '**' in text or '__' in text:
+        text = _BOLD.sub(_bold, text)
+
+    # Italic: *text* or _text_ -> _text_
+    if '*' in text:
+        text = _ITALIC.sub(r'_\1_', text)
+
+    # Code: `text` -> `text` (same)
+    # Already compatible
+
+    # Code blocks: ```text``` -> ```text``` (same)
+    # Already compatible
+
+    # Links: [text](url) -> <url|text>
+    if '](' in text:
+        text = _LINK.sub(r'<\2|\1>', text)
+
+    # Strikethrough: ~~text~~ -> ~text~ (a plain replace; Slack ignores a
+    # stray unpaired ~)
+    text = text.replace('~~', '~')
+
+    return text
+
+
+# Alert texts repeat from one heartbeat to the next, so conversions are
+# cached; longer texts bypass the cache to bound its memory
+_CACHE_MAX_TEXT = 4096
+_convert_markdown_cached = lru_cache(maxsize=2048)(_convert_markdown)
+
 
 class SlackFormatter:
     """Formatter for Slack messages."""
@@ -23,26 +112,14 @@ class SlackFormatter:
         Returns:
             Slack mrkdwn formatted text
         """
-        # Bold: **text** or __text__ -> *text*
-        text = re.sub(r'\*\*(.+?)\*\*', r'*\1*', text)
-        text = re.sub(r'__(.+?)__', r'*\1*', text)
-
-        # Italic: *text* or _text_ -> _text_
-        text = re.sub(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)', r'_\1_', text)
-
-        # Code: `text` -> `text` (same)
-        # Already compatible
-
-        # Code blocks: ```text``` -> ```text``` (same)
-        # Already compatible
-
-        # Links: [text](url) -> <url|text>
-        text = re.sub(r'\[([^\]]+)\]\(([^\)]+)\)', r'<\2|\1>', text)
-
-        # Strikethrough: ~~text~~ -> ~text~
-        text = re.sub(r'~~(.+?)~~', r'~\1~', text)
+        # Plain text (most alerts) skips the regex passes; each `in` is one
+        # C-level scan
+        if not any(char in text for char in _MARKUP_CHARS):
+            return text
 
-        return text
+        if len(text) > _CACHE_MAX_TEXT:
+            return _convert_markdown(text)
+        return _convert_markdown_cached(text)
 
     @staticmethod
     def create_text_block(text: str) -> Dict[str, Any]:
@@ -55,13 +132,23 @@ class SlackFormatter:
         Returns:
             Slack block object
         """
-        return {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": text
-            }
-        }
+        return _section(text)
+
+    @staticmethod
+    def create_text_block_json(text: str) -> bytes:
+        """
+        Create a Slack text block already serialized to JSON.
+
+        For callers that write request bodies themselves (e.g. webhooks);
+        blocks passed to the Slack client should use create_text_block.
+
+        Args:
+            text: Block text
+
+        Returns:
+            UTF-8 JSON encoding of the block
+        """
+        return _SECTION_JSON_HEAD + _json_string(text) + _SECTION_JSON_TAIL
 
     @staticmethod
     def create_code_block(code: str, language: Optional[str] = None) -> Dict[str, Any]:
@@ -77,13 +164,7 @@ class SlackFormatter:
         """
         formatted_code = f"```{language}\n{code}\n```" if language else f"```\n{code}\n```"
 
-        return {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": formatted_code
-            }
-        }
+        return _section(formatted_code)
 
     @staticmethod
     def create_divider() -> Dict[str, str]:
@@ -91,9 +172,9 @@ class SlackFormatter:
         Create a divider block.
 
         Returns:
-            Slack divider block
+            Slack divider block (shared; do not mutate)
         """
-        return {"type": "divider"}
+        return _DIVIDER
 
     @staticmethod
     def create_context_block(elements: List[str]) -> Dict[str, Any]:
@@ -168,15 +249,7 @@ class SlackFormatter:
         Returns:
             List of Slack blocks
         """
-        return [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f":warning: *Error*\n{error}"
-                }
-            }
-        ]
+        return [_section(_ERROR_PREFIX + error)]
 
     @staticmethod
     def format_success_message(message: str) -> List[Dict[str, Any]]:
@@ -189,15 +262,7 @@ class SlackFormatter:
         Returns:
             List of Slack blocks
         """
-        return [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f":white_check_mark: {message}"
-                }
-            }
-        ]
+        return [_section(_SUCCESS_PREFIX + message)]
 
     @staticmethod
     def truncate_text(text: str, max_length: int = 3000) -> str:
@@ -214,7 +279,7 @@ class SlackFormatter:
         if len(text) <= max_length:
             return text
 
-        return text[:max_length - 20] + "\n\n_[Truncated...]_"
+        return f"{text[:max_length - _TRUNC_SUFFIX_LEN]}{_TRUNC_SUFFIX}"
 
     @staticmethod
     def split_long_message(text: str, max_length: int = 3000) -> List[str]:
@@ -232,37 +297,57 @@ class SlackFormatter:
             return [text]
 
         chunks = []
-        current_chunk = ""
 
-        # Split by paragraphs first
-        paragraphs = text.split('\n\n')
+        # The chunk being built is `head` (sentence pieces left from an
+        # oversized paragraph) followed by the whole paragraphs in
+        # text[run_start:run_end]; it is sliced and joined only when saved
+        head: List[str] = []
+        run_start = run_end = -1
+        current_len = 0
+
+        # Walk paragraph boundaries by index instead of splitting the text
+        pos = 0
+        text_len = len(text)
+        while True:
+            end = text.find('\n\n', pos)
+            if end == -1:
+                end = text_len
+            length = end - pos
 
-        for paragraph in paragraphs:
             # If adding this paragraph would exceed limit
-            if len(current_chunk) + len(paragraph) + 2 > max_length:
+            if current_len + length + 2 > max_length:
                 # Save current chunk
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = ""
+                if current_len:
+                    chunks.append(("".join(head) + text[run_start:run_end]).strip())
+                    head, run_start, run_end, current_len = [], -1, -1, 0
 
                 # If paragraph itself is too long, split it
-                if len(paragraph) > max_length:
-                    sentences = paragraph.split('. ')
+                if length > max_length:
+                    sentences = text[pos:end].split('. ')
                     for sentence in sentences:
-                        if len(current_chunk) + len(sentence) + 2 > max_length:
-                            if current_chunk:
-                                chunks.append(current_chunk.strip())
-                            current_chunk = sentence + '. '
+                        if current_len + len(sentence) + 2 > max_length:
+                            if current_len:
+                                chunks.append("".join(head).strip())
+                            head, current_len = [sentence, '. '], len(sentence) + 2
                         else:
-                            current_chunk += sentence + '. '
+                            head += (sentence, '. ')
+                            current_len += len(sentence) + 2
                 else:
-                    current_chunk = paragraph + '\n\n'
+                    run_start, run_end, current_len = pos, end, length + 2
             else:
-                current_chunk += paragraph + '\n\n'
+                if run_start == -1:
+                    run_start = pos
+                run_end = end
+                current_len += length + 2
+
+            if end == text_len:
+                break
+            pos = end + 2
 
         # Add remaining chunk
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        remaining = ("".join(head) + text[run_start:run_end]).strip()
+        if remaining:
+            chunks.append(remaining)
 
         return chunks
 
@@ -287,15 +372,7 @@ class SlackFormatter:
         Returns:
             List of code blocks with language and content
         """
-        # Pattern to match ```language\ncode\n```
-        pattern = r'```(\w+)?\n(.*?)```'
-        matches = re.findall(pattern, text, re.DOTALL)
-
-        code_blocks = []
-        for language, code in matches:
-            code_blocks.append({
-                'language': language or 'plaintext',
-                'code': code.strip()
-            })
-
-        return code_blocks
+        return [
+            {'language': match[1] or 'plaintext', 'code': match[2].strip()}
+            for match in _CODE_BLOCK.finditer(text)
+        ]
@@ -4,8 +4,10 @@ Asana monitor for checking tasks and project updates.
 Uses Asana API to fetch tasks assigned to the user and detect overdue items.
 """
 
+import asyncio
+import bisect
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import asana
 
 from .base_monitor import BaseMonitor, Alert
@@ -14,6 +16,19 @@ from ..utils.config import config
 
 logger = get_logger(__name__)
 
+# Number of earliest-due tasks returned in the check data
+TOP_TASKS = 20
+
+# Fixed due-date phrases; other offsets are formatted in _format_task_message
+_DUE_PHRASE = {0: "Due today", 1: "Due tomorrow"}
+
+# Task query fields shared by every workspace fetch
+_TASK_QUERY = {
+    'completed_since': 'now',  # Only incomplete
+    # Only the names of projects and tags are used
+    'opt_fields': 'name,due_on,due_at,completed,projects.name,tags.name,notes'
+}
+
 
 class AsanaMonitor(BaseMonitor):
     """
@@ -42,7 +57,7 @@ class AsanaMonitor(BaseMonitor):
             self.client = asana.Client.access_token(config.ASANA_ACCESS_TOKEN)
 
             # Get user info
-            user = self.client.users.get_user('me')
+            user = await asyncio.to_thread(self.client.users.get_user, 'me')
             self.user_gid = user['gid']
 
             logger.info(
@@ -72,50 +87,56 @@ class AsanaMonitor(BaseMonitor):
             raise RuntimeError("Asana monitor not initialized")
 
         alerts = []
-        tasks_data = []
+
+        # Earliest-due tasks so far, sorted as ((due date, position), task);
+        # other parsed tasks are only counted, not kept
+        top_tasks: List[tuple] = []
+        tasks_count = 0
+
+        # Local date for naive due dates, computed once per check
+        today = datetime.now().date()
 
         try:
             # Fetch tasks assigned to user
             logger.debug("Fetching Asana tasks...")
 
-            # Get tasks from user's workspaces
-            workspaces = list(self.client.workspaces.get_workspaces())
-
-            for workspace in workspaces:
-                workspace_gid = workspace['gid']
-
-                # Fetch incomplete tasks assigned to user
-                tasks = self.client.tasks.get_tasks(
-                    {
-                        'assignee': self.user_gid,
-                        'workspace': workspace_gid,
-                        'completed_since': 'now',  # Only incomplete
-                        'opt_fields': 'name,due_on,due_at,completed,projects,tags,notes'
-                    }
-                )
+            # Get tasks from user's workspaces. The SDK is blocking, so calls
+            # run in threads and the workspaces are fetched concurrently.
+            workspaces = await asyncio.to_thread(lambda: list(self.client.workspaces.get_workspaces()))
+            workspace_tasks = await asyncio.gather(*(
+                asyncio.to_thread(self._fetch_tasks, workspace['gid'])
+                for workspace in workspaces
+            ))
 
+            for tasks in workspace_tasks:
+                # Parse and classify each task in the same pass
                 for task in tasks:
                     task_data = self._parse_task(task)
-                    tasks_data.append(task_data)
+                    tasks_count += 1
 
-                    # Check if task needs alerts
-                    task_alerts = self._check_task_priority(task_data)
-                    alerts.extend([alert.to_dict() for alert in task_alerts])
+                    # Position breaks ties, so equal dates keep fetch order
+                    key = (task_data['due_date'] or datetime.max, tasks_count)
+                    if len(top_tasks) < TOP_TASKS or key < top_tasks[-1][0]:
+                        bisect.insort(top_tasks, (key, task_data))
+                        del top_tasks[TOP_TASKS:]
 
-            # Sort tasks by due date
-            tasks_data.sort(key=lambda t: t['due_date'] or datetime.max)
+                    # Check if task needs alerts
+                    if task_data['due_date']:
+                        alert = self._check_task_priority(task_data, today)
+                        if alert:
+                            alerts.append(alert.to_dict())
 
             logger.info(
                 "Asana check completed",
-                tasks_count=len(tasks_data),
+                tasks_count=tasks_count,
                 alerts_count=len(alerts)
             )
 
             return {
                 "alerts": alerts,
                 "data": {
-                    "tasks_count": len(tasks_data),
-                    "tasks": tasks_data[:20]  # Return top 20
+                    "tasks_count": tasks_count,
+                    "tasks": [task_data for _, task_data in top_tasks]
                 },
                 "metadata": {
                     "user_gid": self.user_gid,
@@ -127,6 +148,23 @@ class AsanaMonitor(BaseMonitor):
             logger.error("Asana check failed", error=str(e), exc_info=True)
             raise
 
+    def _fetch_tasks(self, workspace_gid: str) -> List[Dict[str, Any]]:
+        """
+        Fetch incomplete tasks assigned to the user in one workspace.
+
+        Blocking; reads every page of results.
+
+        Args:
+            workspace_gid: Asana workspace GID
+
+        Returns:
+            Asana API task objects
+        """
+        # A fresh dict per call: workspaces are fetched concurrently
+        return list(self.client.tasks.get_tasks(
+            {**_TASK_QUERY, 'assignee': self.user_gid, 'workspace': workspace_gid}
+        ))
+
     def _parse_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse Asana task into structured data.
@@ -140,9 +178,11 @@ class AsanaMonitor(BaseMonitor):
         # Parse due date
         due_date = None
         if task.get('due_on'):
-            due_date = datetime.strptime(task['due_on'], '%Y-%m-%d')
+            # YYYY-MM-DD; fromisoformat is much cheaper than strptime
+            due_date = datetime.fromisoformat(task['due_on'])
         elif task.get('due_at'):
-            due_date = datetime.fromisoformat(task['due_at'].replace('Z', '+00:00'))
+            # Python 3.11+ parses the trailing 'Z' itself
+            due_date = datetime.fromisoformat(task['due_at'])
 
         # Get project names
         projects = task.get('projects', [])
@@ -162,27 +202,32 @@ class AsanaMonitor(BaseMonitor):
             "notes": task.get('notes', '')
         }
 
-    def _check_task_priority(self, task: Dict[str, Any]) -> List[Alert]:
+    def _check_task_priority(self, task: Dict[str, Any], today: Optional[date] = None) -> Optional[Alert]:
         """
         Check if task needs alerts.
 
         Args:
             task: Parsed task data
+            today: Local date, passed in by check() so it is computed once
+                (defaults to now)
 
         Returns:
-            List of alerts for this task
+            Alert for this task, or None if it needs none
         """
-        alerts = []
-
-        if not task['due_date']:
-            return alerts  # Skip tasks without due dates
-
-        now = datetime.now(task['due_date'].tzinfo) if task['due_date'].tzinfo else datetime.now()
-        days_until_due = (task['due_date'].date() - now.date()).days
-
-        # Overdue tasks
+        due_date = task['due_date']
+        if not due_date:
+            return None  # Skip tasks without due dates
+
+        if due_date.tzinfo:
+            # Compare in the due time's own timezone
+            today = datetime.now(due_date.tzinfo).date()
+        elif today is None:
+            today = datetime.now().date()
+        days_until_due = (due_date.date() - today).days
+
+        # At most one alert per task; overdue tasks first
         if days_until_due < 0:
-            alerts.append(self.create_alert(
+            return self.create_alert(
                 title=f"Overdue Task: {task['name']}",
                 message=self._format_task_message(task, days_until_due),
                 priority="urgent",
@@ -191,11 +236,11 @@ class AsanaMonitor(BaseMonitor):
                     "days_overdue": abs(days_until_due),
                     "status": "overdue"
                 }
-            ))
+            )
 
         # Due today
         elif days_until_due == 0:
-            alerts.append(self.create_alert(
+            return self.create_alert(
                 title=f"Due Today: {task['name']}",
                 message=self._format_task_message(task, days_until_due),
                 priority="urgent",
@@ -203,11 +248,11 @@ class AsanaMonitor(BaseMonitor):
                     "task_gid": task['gid'],
                     "status": "due_today"
                 }
-            ))
+            )
 
         # Due tomorrow
         elif days_until_due == 1:
-            alerts.append(self.create_alert(
+            return self.create_alert(
                 title=f"Due Tomorrow: {task['name']}",
                 message=self._format_task_message(task, days_until_due),
                 priority="normal",
@@ -215,11 +260,11 @@ class AsanaMonitor(BaseMonitor):
                     "task_gid": task['gid'],
                     "status": "due_tomorrow"
                 }
-            ))
+            )
 
         # Due this week (2-7 days)
         elif 2 <= days_until_due <= 7:
-            alerts.append(self.create_alert(
+            return self.create_alert(
                 title=f"Due This Week: {task['name']}",
                 message=self._format_task_message(task, days_until_due),
                 priority="low",
@@ -228,9 +273,9 @@ class AsanaMonitor(BaseMonitor):
                     "days_until_due": days_until_due,
                     "status": "due_this_week"
                 }
-            ))
+            )
 
-        return alerts
+        return None
 
     def _format_task_message(self, task: Dict[str, Any], days_until_due: int) -> str:
         """
@@ -243,17 +288,13 @@ class AsanaMonitor(BaseMonitor):
         Returns:
             Formatted message
         """
-        lines = []
-
         # Due date info
-        if days_until_due < 0:
-            lines.append(f"Overdue by {abs(days_until_due)} day{'s' if abs(days_until_due) > 1 else ''}")
-        elif days_until_due == 0:
-            lines.append("Due today")
-        elif days_until_due == 1:
-            lines.append("Due tomorrow")
-        else:
-            lines.append(f"Due in {days_until_due} days")
+        phrase = _DUE_PHRASE.get(days_until_due)
+        if phrase is None:
+            days = abs(days_until_due)
+            unit = "day" + "s" * (days != 1)
+            phrase = f"Overdue by {days} {unit}" if days_until_due < 0 else f"Due in {days} {unit}"
+        lines = [phrase]
 
         due_str = task['due_date'].strftime("%A, %B %d")
         lines.append(f"Date: {due_str}")
@@ -5,8 +5,9 @@ Provides a common interface that all monitors (Gmail, Calendar, Asana, Slack)
 must implement for consistency and reliability.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from ..utils.logging_config import get_logger
@@ -17,6 +18,8 @@ logger = get_logger(__name__)
 class Alert:
     """Represents a single alert from a monitor."""
 
+    __slots__ = ("title", "message", "priority", "source", "metadata", "timestamp", "_dict")
+
     def __init__(
         self,
         title: str,
@@ -41,17 +44,25 @@ class Alert:
         self.source = source
         self.metadata = metadata or {}
         self.timestamp = datetime.now()
+        self._dict: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert alert to dictionary."""
-        return {
-            "title": self.title,
-            "message": self.message,
-            "priority": self.priority,
-            "source": self.source,
-            "metadata": self.metadata,
-            "timestamp": self.timestamp.isoformat()
-        }
+        """
+        Convert alert to dictionary.
+
+        Alerts are not changed after creation, so the dictionary is built
+        once; later calls return the same object.
+        """
+        if self._dict is None:
+            self._dict = {
+                "title": self.title,
+                "message": self.message,
+                "priority": self.priority,
+                "source": self.source,
+                "metadata": self.metadata,
+                "timestamp": self.timestamp.isoformat()
+            }
+        return self._dict
 
 
 class BaseMonitor(ABC):
@@ -179,7 +190,9 @@ class BaseMonitor(ABC):
                 "metadata": {"status": "disabled"}
             }
 
+        # Wall-clock start for last_check; durations use the monotonic clock
         start_time = datetime.now()
+        start_perf = time.perf_counter()
 
         try:
             logger.debug("Running check", monitor=self.name)
@@ -188,7 +201,7 @@ class BaseMonitor(ABC):
             self.last_check = start_time
             self.last_result = result
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_perf
 
             logger.info(
                 "Check completed",
@@ -200,7 +213,7 @@ class BaseMonitor(ABC):
             return result
 
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_perf
 
             logger.error(
                 "Check failed",
@@ -4,22 +4,23 @@ Google Calendar monitor for checking upcoming meetings and events.
 Uses Calendar API to fetch events and detect meetings that need preparation.
 """
 
-import os
+import asyncio
+import heapq
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
 from .base_monitor import BaseMonitor, Alert
+from .google_auth import get_google_credentials
 from ..utils.logging_config import get_logger
 from ..utils.config import config
 
 logger = get_logger(__name__)
 
-# Calendar API scopes
-SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
+# Partial response: only the event fields read by _parse_event
+# (plus updated, which keys the parsed-event cache)
+EVENT_FIELDS = 'items(id,updated,summary,description,location,htmlLink,start,end,attendees/email)'
 
 
 class CalendarMonitor(BaseMonitor):
@@ -33,11 +34,20 @@ class CalendarMonitor(BaseMonitor):
     - Calendar conflicts
     """
 
-    def __init__(self):
-        """Initialize Calendar monitor."""
+    def __init__(self, credentials: Optional[Credentials] = None):
+        """
+        Initialize Calendar monitor.
+
+        Args:
+            credentials: Google credentials to share with other monitors
+                (loaded from the token file on initialize if omitted)
+        """
         super().__init__("calendar")
         self.service = None
-        self.credentials = None
+        self.credentials = credentials
+
+        # Parsed events from the last check, keyed by (id, updated)
+        self._event_cache: Dict[tuple, Dict[str, Any]] = {}
 
         # Preparation time threshold (minutes before meeting)
         self.prep_warning_minutes = config.CALENDAR_PREP_WARNING_MINUTES or 60
@@ -47,35 +57,12 @@ class CalendarMonitor(BaseMonitor):
         logger.info("Initializing Calendar monitor...")
 
         try:
-            # Get credentials (reuse Gmail token if available)
-            creds = None
-            token_path = config.GOOGLE_TOKEN_PATH
-            credentials_path = config.GOOGLE_CREDENTIALS_PATH
-
-            # Load saved credentials
-            if os.path.exists(token_path):
-                creds = Credentials.from_authorized_user_file(token_path, SCOPES)
-
-            # Refresh or get new credentials
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    logger.info("Refreshing Calendar credentials...")
-                    creds.refresh(Request())
-                else:
-                    logger.info("Starting Calendar OAuth flow...")
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        credentials_path, SCOPES
-                    )
-                    creds = flow.run_local_server(port=0)
-
-                # Save credentials
-                with open(token_path, 'w') as token:
-                    token.write(creds.to_json())
-
-            self.credentials = creds
+            # Load the shared credentials unless they were passed in
+            if not self.credentials:
+                self.credentials = await asyncio.to_thread(get_google_credentials)
 
             # Build Calendar service
-            self.service = build('calendar', 'v3', credentials=creds)
+            self.service = build('calendar', 'v3', credentials=self.credentials)
 
             logger.info("Calendar monitor initialized")
 
@@ -88,6 +75,7 @@ class CalendarMonitor(BaseMonitor):
         logger.info("Cleaning up Calendar monitor...")
         self.service = None
         self.credentials = None
+        self._event_cache = {}
 
     async def check(self) -> Dict[str, Any]:
         """
@@ -99,7 +87,7 @@ class CalendarMonitor(BaseMonitor):
         if not self.service:
             raise RuntimeError("Calendar monitor not initialized")
 
-        alerts = []
+        alerts: List[Alert] = []
         events_data = []
 
         try:
@@ -109,32 +97,40 @@ class CalendarMonitor(BaseMonitor):
 
             logger.debug("Fetching calendar events...")
 
-            events_result = self.service.events().list(
+            # The API client is blocking, so requests run in a thread
+            events_result = await asyncio.to_thread(self.service.events().list(
                 calendarId='primary',
                 timeMin=now.isoformat() + 'Z',
                 timeMax=end_time.isoformat() + 'Z',
                 maxResults=20,
                 singleEvents=True,
-                orderBy='startTime'
-            ).execute()
+                orderBy='startTime',
+                fields=EVENT_FIELDS
+            ).execute)
 
             events = events_result.get('items', [])
 
             logger.debug("Calendar events found", count=len(events))
 
-            # Process each event
+            # Process each event, reusing the parse of unchanged events.
+            # Only events from this fetch are kept for the next check.
+            event_cache = {}
             for event in events:
-                event_data = self._parse_event(event)
+                key = (event.get('id'), event.get('updated'))
+                event_data = self._event_cache.get(key)
+                if event_data is None:
+                    event_data = self._parse_event(event)
+                if key[1]:
+                    event_cache[key] = event_data
                 events_data.append(event_data)
 
                 # Check if event needs alerts
-                event_alerts = self._check_event_priority(event_data)
-                alerts.extend([alert.to_dict() for alert in event_alerts])
+                alerts.extend(self._check_event_priority(event_data))
+
+            self._event_cache = event_cache
 
             # Check for conflicts
-            conflicts = self._detect_conflicts(events_data)
-            for conflict in conflicts:
-                alerts.append(conflict.to_dict())
+            alerts.extend(self._detect_conflicts(events_data))
 
             logger.info(
                 "Calendar check completed",
@@ -143,7 +139,7 @@ class CalendarMonitor(BaseMonitor):
             )
 
             return {
-                "alerts": alerts,
+                "alerts": [alert.to_dict() for alert in alerts],
                 "data": {
                     "events_count": len(events),
                     "events": events_data
@@ -170,13 +166,13 @@ class CalendarMonitor(BaseMonitor):
         Returns:
             Parsed event data
         """
-        # Get start/end times
-        start = event['start'].get('dateTime', event['start'].get('date'))
-        end = event['end'].get('dateTime', event['end'].get('date'))
+        # Timed events have a dateTime, all-day events only a date
+        start = event['start']
+        end = event['end']
 
-        # Parse datetime
-        start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-        end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
+        # fromisoformat accepts the API's trailing 'Z' (Python 3.11+)
+        start_dt = datetime.fromisoformat(start.get('dateTime') or start['date'])
+        end_dt = datetime.fromisoformat(end.get('dateTime') or end['date'])
 
         # Get attendees
         attendees = event.get('attendees', [])
@@ -288,31 +284,48 @@ class CalendarMonitor(BaseMonitor):
         Returns:
             List of conflict alerts
         """
+        # Sweep in start order, keeping a heap of events still running
+        # (keyed on end) so each event is only compared with those
+        order = sorted(range(len(events)), key=lambda i: events[i]['start'])
+        active: List[tuple] = []
+        pairs = []
+
+        for j in order:
+            event = events[j]
+
+            # Events ending by this start can't overlap it or any later one
+            while active and active[0][0] <= event['start']:
+                heapq.heappop(active)
+
+            for _, i in active:
+                if events[i]['start'] < event['end']:
+                    pairs.append((i, j) if i < j else (j, i))
+
+            heapq.heappush(active, (event['end'], j))
+
+        # Report pairs in the events' original order
+        pairs.sort()
+
         conflicts = []
 
-        for i in range(len(events)):
-            for j in range(i + 1, len(events)):
-                event1 = events[i]
-                event2 = events[j]
-
-                # Check for overlap
-                if (event1['start'] < event2['end'] and
-                    event2['start'] < event1['end']):
-
-                    conflict_alert = self.create_alert(
-                        title="Calendar Conflict Detected",
-                        message=(
-                            f"Overlapping meetings:\n"
-                            f"1. {event1['summary']} ({event1['start'].strftime('%I:%M %p')})\n"
-                            f"2. {event2['summary']} ({event2['start'].strftime('%I:%M %p')})"
-                        ),
-                        priority="urgent",
-                        metadata={
-                            "event1_id": event1['id'],
-                            "event2_id": event2['id'],
-                            "conflict_type": "overlap"
-                        }
-                    )
-                    conflicts.append(conflict_alert)
+        for i, j in pairs:
+            event1 = events[i]
+            event2 = events[j]
+
+            conflict_alert = self.create_alert(
+                title="Calendar Conflict Detected",
+                message=(
+                    f"Overlapping meetings:\n"
+                    f"1. {event1['summary']} ({event1['start'].strftime('%I:%M %p')})\n"
+                    f"2. {event2['summary']} ({event2['start'].strftime('%I:%M %p')})"
+                ),
+                priority="urgent",
+                metadata={
+                    "event1_id": event1['id'],
+                    "event2_id": event2['id'],
+                    "conflict_type": "overlap"
+                }
+            )
+            conflicts.append(conflict_alert)
 
         return conflicts
@@ -4,22 +4,32 @@ Gmail monitor for checking unread and priority emails.
 Uses Gmail API to fetch unread emails and identify urgent/important messages.
 """
 
-import os
+import asyncio
+import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
 from .base_monitor import BaseMonitor, Alert
+from .google_auth import get_google_credentials
 from ..utils.logging_config import get_logger
 from ..utils.config import config
 
 logger = get_logger(__name__)
 
-# Gmail API scopes
-SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
+# Headers read by _parse_email
+EMAIL_HEADERS = ['Subject', 'From', 'Date']
+
+# Partial response: only the message fields read by _parse_email
+MESSAGE_FIELDS = 'id,threadId,snippet,payload/headers'
+
+
+def _any_of(terms: List[str]) -> Optional[re.Pattern]:
+    """Compile a pattern matching any of terms in lowercased text (None if empty)."""
+    if not terms:
+        return None
+    return re.compile('|'.join(re.escape(term.lower()) for term in terms))
 
 
 class GmailMonitor(BaseMonitor):
@@ -32,11 +42,17 @@ class GmailMonitor(BaseMonitor):
     - Emails with urgent keywords in subject
     """
 
-    def __init__(self):
-        """Initialize Gmail monitor."""
+    def __init__(self, credentials: Optional[Credentials] = None):
+        """
+        Initialize Gmail monitor.
+
+        Args:
+            credentials: Google credentials to share with other monitors
+                (loaded from the token file on initialize if omitted)
+        """
         super().__init__("gmail")
         self.service = None
-        self.credentials = None
+        self.credentials = credentials
         self.user_email = None
 
         # Priority detection configuration
@@ -46,43 +62,24 @@ class GmailMonitor(BaseMonitor):
         ]
         self.important_senders = config.GMAIL_IMPORTANT_SENDERS or []
 
+        # Each list is matched with one regex search per email
+        self._urgent_re = _any_of(self.urgent_keywords)
+        self._sender_re = _any_of(self.important_senders)
+
     async def initialize(self) -> None:
         """Initialize Gmail API connection."""
         logger.info("Initializing Gmail monitor...")
 
         try:
-            # Get credentials
-            creds = None
-            token_path = config.GOOGLE_TOKEN_PATH
-            credentials_path = config.GOOGLE_CREDENTIALS_PATH
-
-            # Load saved credentials if they exist
-            if os.path.exists(token_path):
-                creds = Credentials.from_authorized_user_file(token_path, SCOPES)
-
-            # If no valid credentials, get new ones
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    logger.info("Refreshing Gmail credentials...")
-                    creds.refresh(Request())
-                else:
-                    logger.info("Starting Gmail OAuth flow...")
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        credentials_path, SCOPES
-                    )
-                    creds = flow.run_local_server(port=0)
-
-                # Save credentials for next run
-                with open(token_path, 'w') as token:
-                    token.write(creds.to_json())
-
-            self.credentials = creds
+            # Load the shared credentials unless they were passed in
+            if not self.credentials:
+                self.credentials = await asyncio.to_thread(get_google_credentials)
 
             # Build Gmail service
-            self.service = build('gmail', 'v1', credentials=creds)
+            self.service = build('gmail', 'v1', credentials=self.credentials)
 
-            # Get user email
-            profile = self.service.users().getProfile(userId='me').execute()
+            # Get user email (blocking request, so run in a thread)
+            profile = await asyncio.to_thread(self.service.users().getProfile(userId='me').execute)
             self.user_email = profile.get('emailAddress')
 
             logger.info(
@@ -117,26 +114,22 @@ class GmailMonitor(BaseMonitor):
             # Fetch unread messages
             logger.debug("Fetching unread emails...")
 
-            results = self.service.users().messages().list(
+            # The API client is blocking, so requests run in a thread
+            results = await asyncio.to_thread(self.service.users().messages().list(
                 userId='me',
                 labelIds=['UNREAD'],
-                maxResults=50  # Check last 50 unread
-            ).execute()
+                maxResults=50,  # Check last 50 unread
+                fields='messages/id'
+            ).execute)
 
             messages = results.get('messages', [])
 
             logger.debug("Unread emails found", count=len(messages))
 
             # Process each message
-            for msg in messages:
+            fetched = await asyncio.to_thread(self._fetch_messages, messages)
+            for message in fetched:
                 try:
-                    # Get full message details
-                    message = self.service.users().messages().get(
-                        userId='me',
-                        id=msg['id'],
-                        format='full'
-                    ).execute()
-
                     email_data = self._parse_email(message)
                     emails_data.append(email_data)
 
@@ -148,7 +141,7 @@ class GmailMonitor(BaseMonitor):
                 except Exception as e:
                     logger.warning(
                         "Failed to process email",
-                        email_id=msg['id'],
+                        email_id=message.get('id'),
                         error=str(e)
                     )
                     continue
@@ -185,6 +178,50 @@ class GmailMonitor(BaseMonitor):
             logger.error("Gmail check failed", error=str(e), exc_info=True)
             raise
 
+    def _fetch_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fetch message headers and snippets in one batch request.
+
+        Blocking. Messages that fail to fetch are logged and skipped.
+
+        Args:
+            messages: Message stubs from messages().list()
+
+        Returns:
+            Gmail API message objects, in the order given
+        """
+        fetched = []
+
+        def on_message(request_id: str, response: Dict[str, Any], exception: Exception) -> None:
+            if exception is not None:
+                logger.warning(
+                    "Failed to process email",
+                    email_id=request_id,
+                    error=str(exception)
+                )
+            else:
+                fetched.append(response)
+
+        if not messages:
+            return fetched
+
+        batch = self.service.new_batch_http_request(callback=on_message)
+        for msg in messages:
+            # Only the headers and snippet are used, so skip the body
+            batch.add(
+                self.service.users().messages().get(
+                    userId='me',
+                    id=msg['id'],
+                    format='metadata',
+                    metadataHeaders=EMAIL_HEADERS,
+                    fields=MESSAGE_FIELDS
+                ),
+                request_id=msg['id']
+            )
+        batch.execute()
+
+        return fetched
+
     def _parse_email(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse Gmail API message into structured data.
@@ -236,34 +273,32 @@ class GmailMonitor(BaseMonitor):
             Alert if priority, None otherwise
         """
         subject = email.get('subject', '').lower()
-        sender = email.get('sender', '').lower()
 
         # Check for urgent keywords in subject
-        for keyword in self.urgent_keywords:
-            if keyword in subject:
-                return self.create_alert(
-                    title=f"Urgent Email: {email['subject'][:50]}",
-                    message=f"From: {email['sender']}\n\n{email['snippet'][:200]}...",
-                    priority="urgent",
-                    metadata={
-                        "email_id": email['id'],
-                        "sender": email['sender'],
-                        "detected_keyword": keyword
-                    }
-                )
+        match = self._urgent_re.search(subject) if self._urgent_re else None
+        if match:
+            return self.create_alert(
+                title=f"Urgent Email: {email['subject'][:50]}",
+                message=f"From: {email['sender']}\n\n{email['snippet'][:200]}...",
+                priority="urgent",
+                metadata={
+                    "email_id": email['id'],
+                    "sender": email['sender'],
+                    "detected_keyword": match.group()
+                }
+            )
 
-        # Check for important senders
-        for important_sender in self.important_senders:
-            if important_sender.lower() in sender:
-                return self.create_alert(
-                    title=f"Email from {email['sender']}",
-                    message=f"Subject: {email['subject']}\n\n{email['snippet'][:200]}...",
-                    priority="normal",
-                    metadata={
-                        "email_id": email['id'],
-                        "sender": email['sender'],
-                        "reason": "important_sender"
-                    }
-                )
+        # Check for important senders (only lowercasing the sender if any are set)
+        if self._sender_re and self._sender_re.search(email.get('sender', '').lower()):
+            return self.create_alert(
+                title=f"Email from {email['sender']}",
+                message=f"Subject: {email['subject']}\n\n{email['snippet'][:200]}...",
+                priority="normal",
+                metadata={
+                    "email_id": email['id'],
+                    "sender": email['sender'],
+                    "reason": "important_sender"
+                }
+            )
 
         return None
@@ -0,0 +1,71 @@
+"""
+Shared Google OAuth credentials for the Gmail and Calendar monitors.
+
+Both monitors read the same token file. Loading it once with the scopes of
+both APIs means one token refresh (or one OAuth consent) per process instead
+of one per monitor, and the saved token covers both monitors.
+"""
+
+import os
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+from google.oauth2.credentials import Credentials
+from google.auth.transport.requests import Request
+from google_auth_oauthlib.flow import InstalledAppFlow
+
+from ..utils.logging_config import get_logger
+from ..utils.config import config
+
+logger = get_logger(__name__)
+
+# Scopes requested for the shared token (Gmail and Calendar, read-only)
+GOOGLE_SCOPES = (
+    'https://www.googleapis.com/auth/gmail.readonly',
+    'https://www.googleapis.com/auth/calendar.readonly',
+)
+
+
+def get_google_credentials(scopes: Sequence[str] = GOOGLE_SCOPES) -> Credentials:
+    """
+    Get Google credentials, loading them on first use.
+
+    Blocking: may refresh the token or run the OAuth flow in a browser.
+
+    Args:
+        scopes: OAuth scopes the credentials must cover
+
+    Returns:
+        Valid credentials, shared by every caller asking for the same scopes
+    """
+    return _load_credentials(tuple(scopes))
+
+
+@lru_cache(maxsize=None)
+def _load_credentials(scopes: Tuple[str, ...]) -> Credentials:
+    """Load, refresh or create credentials and save them to the token file."""
+    creds = None
+    token_path = config.GOOGLE_TOKEN_PATH
+    credentials_path = config.GOOGLE_CREDENTIALS_PATH
+
+    # Load saved credentials
+    if os.path.exists(token_path):
+        creds = Credentials.from_authorized_user_file(token_path, scopes)
+
+    # Refresh or get new credentials
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            logger.info("Refreshing Google credentials...")
+            creds.refresh(Request())
+        else:
+            logger.info("Starting Google OAuth flow...")
+            flow = InstalledAppFlow.from_client_secrets_file(
+                credentials_path, scopes
+            )
+            creds = flow.run_local_server(port=0)
+
+        # Save credentials for next run
+        with open(token_path, 'w') as token:
+            token.write(creds.to_json())
+
+    return creds
@@ -6,7 +6,7 @@ reasoning engine, and notification delivery.
 """
 
 import asyncio
-from typing import Optional
+from typing import Dict, Optional
 from slack_sdk.web.async_client import AsyncWebClient
 
 from .scheduler import HeartbeatScheduler
@@ -14,9 +14,11 @@ from .orchestrator import HeartbeatOrchestrator
 from .gmail_monitor import GmailMonitor
 from .calendar_monitor import CalendarMonitor
 from .asana_monitor import AsanaMonitor
+from .google_auth import get_google_credentials
 from .notifier import Notifier
 from .reasoning_engine import ReasoningEngine
 
+from ..adapters.http_pool import close_pools, get_session
 from ..memory.session_logger import SessionLogger
 from ..utils.logging_config import get_logger
 from ..utils.config import config
@@ -65,43 +67,51 @@ class HeartbeatApp:
 
         # Initialize Slack client if token available
         if config.SLACK_BOT_TOKEN:
-            self.slack_client = AsyncWebClient(token=config.SLACK_BOT_TOKEN)
+            self.slack_client = AsyncWebClient(
+                token=config.SLACK_BOT_TOKEN,
+                session=await get_session()
+            )
             self.notifier = Notifier(slack_client=self.slack_client)
             logger.info("Slack notifications enabled")
         else:
             logger.warning("No Slack token - notifications disabled")
 
         # Initialize monitors based on configuration
+        google_credentials = None
         if config.GOOGLE_CREDENTIALS_PATH:
+            # One token load (and refresh) for both Google monitors. Blocking,
+            # and may run the OAuth flow, so it runs in a thread.
             try:
-                self.gmail_monitor = GmailMonitor()
-                await self.gmail_monitor.initialize()
-                self.orchestrator.register_monitor("gmail", self.gmail_monitor)
-                logger.info("Gmail monitor enabled")
+                google_credentials = await asyncio.to_thread(get_google_credentials)
             except Exception as e:
-                logger.warning("Failed to initialize Gmail monitor", error=str(e))
-
-            try:
-                self.calendar_monitor = CalendarMonitor()
-                await self.calendar_monitor.initialize()
-                self.orchestrator.register_monitor("calendar", self.calendar_monitor)
-                logger.info("Calendar monitor enabled")
-            except Exception as e:
-                logger.warning("Failed to initialize Calendar monitor", error=str(e))
+                logger.warning("Failed to load Google credentials", error=str(e))
         else:
             logger.warning("No Google credentials - Gmail/Calendar disabled")
 
+        monitors = {}
+        if google_credentials:
+            self.gmail_monitor = monitors["gmail"] = GmailMonitor(google_credentials)
+            self.calendar_monitor = monitors["calendar"] = CalendarMonitor(google_credentials)
+
         if config.ASANA_ACCESS_TOKEN:
-            try:
-                self.asana_monitor = AsanaMonitor()
-                await self.asana_monitor.initialize()
-                self.orchestrator.register_monitor("asana", self.asana_monitor)
-                logger.info("Asana monitor enabled")
-            except Exception as e:
-                logger.warning("Failed to initialize Asana monitor", error=str(e))
+            self.asana_monitor = monitors["asana"] = AsanaMonitor()
         else:
             logger.warning("No Asana token - Asana monitor disabled")
 
+        # Each monitor connects to its own service, so connect them concurrently
+        results = await asyncio.gather(
+            *(monitor.initialize() for monitor in monitors.values()),
+            return_exceptions=True
+        )
+
+        for (name, monitor), result in zip(monitors.items(), results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to initialize {name.capitalize()} monitor", error=str(result))
+                continue
+
+            self.orchestrator.register_monitor(name, monitor)
+            logger.info(f"{name.capitalize()} monitor enabled")
+
         # Create scheduler
         self.scheduler = HeartbeatScheduler(self._on_heartbeat)
 
@@ -153,8 +163,9 @@ class HeartbeatApp:
         if self.asana_monitor:
             await self.asana_monitor.cleanup()
 
-        # Close session logger
+        # Close session logger and pooled Slack/Claude connections
         await self.session_logger.close()
+        await close_pools()
 
         logger.info("Heartbeat app stopped")
 
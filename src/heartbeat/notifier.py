@@ -187,7 +187,7 @@ class Notifier:
 
         # Urgent alerts
         if urgent:
-            blocks.append({"type": "divider"})
+            blocks.append(self.formatter.create_divider())
             blocks.append({
                 "type": "section",
                 "text": {
@@ -201,7 +201,7 @@ class Notifier:
 
         # Normal alerts
         if normal:
-            blocks.append({"type": "divider"})
+            blocks.append(self.formatter.create_divider())
             blocks.append({
                 "type": "section",
                 "text": {
@@ -215,7 +215,7 @@ class Notifier:
 
         # Low priority (just count)
         if low:
-            blocks.append({"type": "divider"})
+            blocks.append(self.formatter.create_divider())
             blocks.append({
                 "type": "section",
                 "text": {
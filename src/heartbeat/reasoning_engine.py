@@ -8,6 +8,7 @@ contextual insights, recommendations, and prioritization.
 from typing import Dict, Any, List, Optional
 from anthropic import AsyncAnthropic
 
+from ..adapters.http_pool import get_anthropic_http_client
 from ..utils.logging_config import get_logger
 from ..utils.config import config
 
@@ -27,7 +28,10 @@ class ReasoningEngine:
 
     def __init__(self):
         """Initialize reasoning engine."""
-        self.claude = AsyncAnthropic(api_key=config.ANTHROPIC_API_KEY)
+        self.claude = AsyncAnthropic(
+            api_key=config.ANTHROPIC_API_KEY,
+            http_client=get_anthropic_http_client()
+        )
         logger.info("Reasoning engine initialized")
 
     async def analyze_heartbeat(
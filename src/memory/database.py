@@ -5,6 +5,7 @@ Provides async SQLite operations with connection pooling and schema management.
 """
 
 import aiosqlite
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional, Any
 import json
@@ -29,6 +30,7 @@ class Database:
         self.db_path = db_path or config.SQLITE_DB_PATH
         self.connection: Optional[aiosqlite.Connection] = None
         self._initialized = False
+        self._transaction_depth = 0
 
     async def connect(self) -> None:
         """Establish database connection."""
@@ -139,7 +141,7 @@ class Database:
             await self.connect()
 
         await self.connection.executemany(query, params_list)
-        await self.connection.commit()
+        await self.commit()
 
     async def fetch_one(self, query: str, params: Optional[tuple] = None) -> Optional[dict]:
         """
@@ -190,7 +192,7 @@ class Database:
         query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
 
         cursor = await self.connection.execute(query, tuple(data.values()))
-        await self.connection.commit()
+        await self.commit()
 
         return cursor.lastrowid
 
@@ -215,7 +217,7 @@ class Database:
 
         all_params = tuple(data.values()) + params
         cursor = await self.connection.execute(query, all_params)
-        await self.connection.commit()
+        await self.commit()
 
         return cursor.rowcount
 
@@ -236,15 +238,37 @@ class Database:
 
         query = f"DELETE FROM {table} WHERE {where}"
         cursor = await self.connection.execute(query, params)
-        await self.connection.commit()
+        await self.commit()
 
         return cursor.rowcount
 
     async def commit(self) -> None:
-        """Commit current transaction."""
-        if self.connection:
+        """Commit current transaction (deferred while inside transaction())."""
+        if self.connection and not self._transaction_depth:
             await self.connection.commit()
 
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Group the writes made inside the block into a single commit.
+
+        Commits issued inside the block (by insert, update, etc.) are
+        deferred to its end. Writes made before an error are still
+        committed, as they would have been without the block. Blocks may
+        nest or overlap; the outermost one to finish commits.
+
+        Example:
+            async with db.transaction():
+                await db.insert('messages', message_data)
+                await db.update('sessions', session_data, 'id = ?', (session_id,))
+        """
+        self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            self._transaction_depth -= 1
+            await self.commit()
+
     async def rollback(self) -> None:
         """Rollback current transaction."""
         if self.connection:
@@ -154,17 +154,20 @@ def index_all_memory_files(memory_dir: Path, indexer: SemanticIndexer):
     print(f"\n📚 Found {len(md_files)} markdown files in {memory_dir}")
     print("=" * 70)
 
-    total_chunks = 0
-    for file_path in md_files:
-        # Skip hidden files
-        if file_path.name.startswith("."):
-            continue
-
-        try:
-            chunks = indexer.index_file(file_path)
-            total_chunks += chunks
-        except Exception as e:
-            print(f"❌ Error indexing {file_path.name}: {e}")
+    # Skip hidden files
+    visible_files = [f for f in md_files if not f.name.startswith(".")]
+
+    # Read and chunk in parallel, then embed all changed files in one batch
+    # (files that fail are reported and skipped by index_files)
+    try:
+        total_chunks = indexer.index_files(visible_files)
+    except Exception as e:
+        print(f"❌ Error indexing {memory_dir}: {e}")
+        total_chunks = 0
+
+    # Compact the BM25 index once after the bulk pass
+    if total_chunks:
+        indexer.optimize_fts()
 
     print("=" * 70)
     print(f"✅ Indexed {len(md_files)} files, {total_chunks} total chunks\n")
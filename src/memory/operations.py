@@ -177,6 +177,51 @@ class MemoryOperations:
         logger.debug("Message created", message_id=message.id, session_id=message.session_id, role=message.role)
         return message.id
 
+    async def create_messages(self, messages: list[Message]) -> None:
+        """
+        Create several messages with one INSERT and one UPDATE statement.
+
+        Args:
+            messages: Message models, in the order they were sent
+        """
+        if not messages:
+            return
+
+        await self.db.execute_many(
+            """INSERT INTO messages
+               (id, session_id, role, content, timestamp, token_count, metadata)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    message.id,
+                    message.session_id,
+                    message.role,
+                    message.content,
+                    message.timestamp.isoformat(),
+                    message.token_count,
+                    json_serialize(message.metadata) if message.metadata else None,
+                )
+                for message in messages
+            ]
+        )
+
+        # One count/last-activity update per session
+        counts: dict[str, list] = {}
+        for message in messages:
+            entry = counts.setdefault(message.session_id, [0, None])
+            entry[0] += 1
+            entry[1] = message.timestamp.isoformat()
+
+        await self.db.execute_many(
+            """UPDATE sessions
+               SET message_count = message_count + ?,
+                   last_activity = ?
+               WHERE id = ?""",
+            [(count, last_activity, session_id) for session_id, (count, last_activity) in counts.items()]
+        )
+
+        logger.debug("Messages created", count=len(messages), sessions=len(counts))
+
     async def get_session_messages(
         self,
         session_id: str,
@@ -11,6 +11,7 @@ Provides:
 import hashlib
 import sqlite3
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -20,6 +21,43 @@ import json
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+
+# Default connection settings: WAL lets searches read while the janitor
+# writes and, with synchronous=NORMAL, commits without an fsync per
+# transaction; a larger cache/mmap avoids read() calls.
+PERFORMANCE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -65536,  # 64 MB
+    "mmap_size": 268435456,  # 256 MB
+    "temp_store": "MEMORY",
+}
+
+# Storage types for the numpy fallback table. Cosine similarity ignores
+# vector length, so int8 rows are stored without a scale factor.
+EMBEDDING_DTYPES = {"float32": np.float32, "int8": np.int8}
+
+
+# HNSW index over the numpy fallback table (used when hnswlib is installed).
+# Below ANN_MIN_CHUNKS the exact scan is already fast, so it is kept.
+ANN_MIN_CHUNKS = 2000
+ANN_M = 16
+ANN_EF_CONSTRUCTION = 200
+ANN_EF_SEARCH = 64
+
+
+def quantize_int8(embedding: np.ndarray) -> np.ndarray:
+    """Scale an embedding to the int8 range, keeping its direction."""
+    peak = np.abs(embedding).max()
+    if peak == 0:
+        return np.zeros(embedding.shape, dtype=np.int8)
+    return np.round(embedding * (127.0 / peak)).astype(np.int8)
+
 
 @dataclass
 class Chunk:
@@ -61,7 +99,12 @@ class SemanticIndexer:
         db_path: str = "sentinel_memory.db",
         model_name: str = "all-MiniLM-L6-v2",
         chunk_size: int = 400,
-        chunk_overlap: int = 80
+        chunk_overlap: int = 80,
+        pragmas: Optional[Dict[str, Any]] = None,
+        embedding_dtype: str = "float32",
+        backend: str = "torch",
+        model_file: Optional[str] = None,
+        use_ann: bool = True
     ):
         """
         Initialize semantic indexer.
@@ -71,23 +114,52 @@ class SemanticIndexer:
             model_name: Sentence-transformers model name
             chunk_size: Chunk size in tokens
             chunk_overlap: Overlap between chunks in tokens
+            pragmas: SQLite PRAGMAs applied to every connection
+                (default: PERFORMANCE_PRAGMAS; pass {} for SQLite defaults)
+            embedding_dtype: Storage type for embeddings in the numpy
+                fallback table: "float32" or "int8" (4x smaller)
+            backend: Inference backend for sentence-transformers: "torch",
+                "onnx" or "openvino" (the latter two need optimum installed)
+            model_file: Model file to load with the onnx/openvino backend,
+                e.g. "onnx/model_qint8_avx512_vnni.onnx" for the int8 export
+            use_ann: Search the numpy fallback table through an HNSW index
+                (saved next to the database) when hnswlib is installed
         """
+        if embedding_dtype not in EMBEDDING_DTYPES:
+            raise ValueError(
+                f"embedding_dtype must be one of {sorted(EMBEDDING_DTYPES)}, got {embedding_dtype!r}"
+            )
+
         self.db_path = db_path
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.pragmas = PERFORMANCE_PRAGMAS if pragmas is None else pragmas
+        self.embedding_dtype = embedding_dtype
+        self.use_ann = use_ann and hnswlib is not None
+        self.ann_path = Path(db_path).with_suffix(".hnsw")
+        self._ann = None
+        self._ann_state = None
 
         # Initialize database
         self._init_db()
 
         # Load embedding model
-        print(f"Loading embedding model: {model_name}...")
-        self.model = SentenceTransformer(model_name)
+        print(f"Loading embedding model: {model_name} ({backend})...")
+        model_kwargs = {"file_name": model_file} if model_file else None
+        self.model = SentenceTransformer(model_name, backend=backend, model_kwargs=model_kwargs)
         self.embedding_dim = self.model.get_sentence_embedding_dimension()
         print(f"✅ Model loaded (embedding dim: {self.embedding_dim})")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a database connection with the configured PRAGMAs."""
+        conn = sqlite3.connect(self.db_path)
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
     def _init_db(self):
         """Initialize database with schema."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
 
         # Load sqlite-vec extension
         try:
@@ -220,7 +292,7 @@ class SemanticIndexer:
         # Check if file has changed
         file_hash = self._get_file_hash(file_path)
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         # Check if already indexed
@@ -235,9 +307,157 @@ class SemanticIndexer:
             conn.close()
             return 0
 
-        # Delete old chunks if re-indexing
         if result:
             print(f"🔄 Re-indexing {file_path.name}...")
+
+        # Read and chunk file content
+        chunks = self._read_chunks(file_path)
+
+        # Generate embeddings for all chunks
+        print(f"📝 Chunking {file_path.name}: {len(chunks)} chunks")
+        print(f"🧠 Generating embeddings...")
+        embeddings = self.model.encode(chunks, show_progress_bar=False)
+
+        self._store_file(cursor, file_path, file_hash, chunks, embeddings, reindex=bool(result))
+
+        conn.commit()
+        conn.close()
+
+        print(f"✅ Indexed {file_path.name}: {len(chunks)} chunks")
+        return len(chunks)
+
+    def index_files(self, file_paths: List[Path], batch_size: int = 64) -> int:
+        """
+        Index several markdown files with one batched embedding pass.
+
+        Files are hashed, read and chunked in a thread pool, the chunks of
+        all changed files are embedded together, and the results are
+        written in a single transaction. A file that fails is reported and
+        skipped; the others are still indexed.
+
+        Args:
+            file_paths: Paths to files
+            batch_size: Embedding batch size
+
+        Returns:
+            Total number of chunks created
+        """
+        conn = self._connect()
+        try:
+            return self._index_files(conn, file_paths, batch_size)
+        finally:
+            conn.close()
+
+    def _index_files(self, conn: sqlite3.Connection, file_paths: List[Path], batch_size: int) -> int:
+        """Index files on an open connection (see index_files)."""
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT file_path, file_hash FROM indexed_files")
+        indexed_hashes = dict(cursor.fetchall())
+
+        def prepare(file_path: Path):
+            file_hash = self._get_file_hash(file_path)
+            if indexed_hashes.get(str(file_path)) == file_hash:
+                return file_hash, None
+            return file_hash, self._read_chunks(file_path)
+
+        with ThreadPoolExecutor() as executor:
+            futures = [(file_path, executor.submit(prepare, file_path)) for file_path in file_paths]
+
+        pending = []
+        for file_path, future in futures:
+            try:
+                file_hash, chunks = future.result()
+            except Exception as e:
+                print(f"❌ Error indexing {file_path.name}: {e}")
+                continue
+
+            if chunks is None:
+                print(f"⏭️  Skipping {file_path.name} (unchanged)")
+                continue
+
+            if str(file_path) in indexed_hashes:
+                print(f"🔄 Re-indexing {file_path.name}...")
+            print(f"📝 Chunking {file_path.name}: {len(chunks)} chunks")
+            pending.append((file_path, file_hash, chunks))
+
+        all_chunks = [chunk for _, _, chunks in pending for chunk in chunks]
+        if not all_chunks:
+            return 0
+
+        # Generate embeddings for every chunk in one pass; if that fails,
+        # embed file by file below so only the failing files are skipped
+        print(f"🧠 Generating embeddings for {len(all_chunks)} chunks...")
+        try:
+            embeddings = self.model.encode(all_chunks, batch_size=batch_size, show_progress_bar=False)
+        except Exception as e:
+            print(f"⚠️  Batch embedding failed ({e}), embedding files one at a time")
+            embeddings = None
+
+        # One transaction for the pass, with a savepoint per file so a
+        # failed write only rolls back that file
+        cursor.execute("BEGIN")
+        total_chunks = 0
+        offset = 0
+        for file_path, file_hash, chunks in pending:
+            try:
+                if embeddings is None:
+                    file_embeddings = self.model.encode(chunks, batch_size=batch_size, show_progress_bar=False)
+                else:
+                    file_embeddings = embeddings[offset:offset + len(chunks)]
+
+                cursor.execute("SAVEPOINT index_file")
+                try:
+                    self._store_file(
+                        cursor, file_path, file_hash, chunks, file_embeddings,
+                        reindex=str(file_path) in indexed_hashes
+                    )
+                except Exception:
+                    cursor.execute("ROLLBACK TO index_file")
+                    raise
+                finally:
+                    cursor.execute("RELEASE index_file")
+            except Exception as e:
+                print(f"❌ Error indexing {file_path.name}: {e}")
+                continue
+            finally:
+                offset += len(chunks)
+
+            total_chunks += len(chunks)
+            print(f"✅ Indexed {file_path.name}: {len(chunks)} chunks")
+
+        conn.commit()
+
+        return total_chunks
+
+    def _read_chunks(self, file_path: Path) -> List[str]:
+        """Read a file and split it into chunks."""
+        with open(file_path) as f:
+            content = f.read()
+        return self.chunk_text(content)
+
+    def _store_file(
+        self,
+        cursor: sqlite3.Cursor,
+        file_path: Path,
+        file_hash: str,
+        chunks: List[str],
+        embeddings: np.ndarray,
+        reindex: bool
+    ):
+        """
+        Write a file's chunks and embeddings, replacing any previous index.
+
+        Args:
+            cursor: Cursor on an open connection (caller commits)
+            file_path: Path to file
+            file_hash: SHA256 of the file content
+            chunks: Chunk texts
+            embeddings: One embedding per chunk
+            reindex: Whether the file was indexed before
+        """
+        # Delete old chunks if re-indexing
+        if reindex:
             cursor.execute("DELETE FROM memory_chunks WHERE file_path = ?", (str(file_path),))
             # Also delete from vec table if it exists
             try:
@@ -245,30 +465,18 @@ class SemanticIndexer:
             except sqlite3.OperationalError:
                 pass  # vec table might not exist
 
-        # Read file content
-        with open(file_path) as f:
-            content = f.read()
-
-        # Chunk text
-        chunks = self.chunk_text(content)
         file_type = self._get_file_type(file_path)
         now = datetime.now().isoformat()
-
-        # Generate embeddings for all chunks
-        print(f"📝 Chunking {file_path.name}: {len(chunks)} chunks")
-        print(f"🧠 Generating embeddings...")
-        embeddings = self.model.encode(chunks, show_progress_bar=False)
+        chunk_ids = [str(uuid.uuid4()) for _ in chunks]
+        empty_metadata = json.dumps({})
 
         # Insert chunks
-        for idx, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            chunk_id = str(uuid.uuid4())
-
-            # Insert chunk
-            cursor.execute("""
-                INSERT INTO memory_chunks
-                (chunk_id, file_path, file_type, chunk_text, chunk_index, token_count, created_at, updated_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        cursor.executemany("""
+            INSERT INTO memory_chunks
+            (chunk_id, file_path, file_type, chunk_text, chunk_index, token_count, created_at, updated_at, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
                 chunk_id,
                 str(file_path),
                 file_type,
@@ -277,27 +485,32 @@ class SemanticIndexer:
                 len(chunk.split()),  # Approximation
                 now,
                 now,
-                json.dumps({})
-            ))
+                empty_metadata
+            )
+            for idx, (chunk_id, chunk) in enumerate(zip(chunk_ids, chunks))
+        ])
 
-            # Insert embedding (if vec table exists)
-            try:
-                cursor.execute("""
-                    INSERT INTO vec_memory_chunks (chunk_id, embedding)
-                    VALUES (?, ?)
-                """, (chunk_id, embedding.tobytes()))
-            except sqlite3.OperationalError:
-                # Store embeddings in separate fallback table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS embeddings_fallback (
-                        chunk_id TEXT PRIMARY KEY,
-                        embedding BLOB NOT NULL
-                    )
-                """)
-                cursor.execute("""
-                    INSERT INTO embeddings_fallback (chunk_id, embedding)
-                    VALUES (?, ?)
-                """, (chunk_id, np.array(embedding, dtype=np.float32).tobytes()))
+        # Insert embeddings (if vec table exists)
+        try:
+            cursor.executemany("""
+                INSERT INTO vec_memory_chunks (chunk_id, embedding)
+                VALUES (?, ?)
+            """, [(chunk_id, embedding.tobytes()) for chunk_id, embedding in zip(chunk_ids, embeddings)])
+        except sqlite3.OperationalError:
+            # Store embeddings in separate fallback table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings_fallback (
+                    chunk_id TEXT PRIMARY KEY,
+                    embedding BLOB NOT NULL
+                )
+            """)
+            cursor.executemany("""
+                INSERT INTO embeddings_fallback (chunk_id, embedding)
+                VALUES (?, ?)
+            """, [
+                (chunk_id, self._encode_embedding(embedding))
+                for chunk_id, embedding in zip(chunk_ids, embeddings)
+            ])
 
         # Update indexed_files
         cursor.execute("""
@@ -306,11 +519,30 @@ class SemanticIndexer:
             VALUES (?, ?, ?, ?)
         """, (str(file_path), file_hash, now, len(chunks)))
 
+    def optimize_fts(self):
+        """
+        Merge the BM25 full-text index into a single segment.
+
+        FTS5 appends a new index segment for every batch of inserts, and
+        each query has to consult all of them. Call after bulk indexing.
+        """
+        conn = self._connect()
+        conn.execute("INSERT INTO fts_memory_chunks(fts_memory_chunks) VALUES('optimize')")
         conn.commit()
         conn.close()
 
-        print(f"✅ Indexed {file_path.name}: {len(chunks)} chunks")
-        return len(chunks)
+    def _encode_embedding(self, embedding: np.ndarray) -> bytes:
+        """Serialize an embedding for the fallback table."""
+        embedding = np.asarray(embedding, dtype=np.float32)
+        if self.embedding_dtype == "int8":
+            return quantize_int8(embedding).tobytes()
+        return embedding.tobytes()
+
+    def _decode_embedding(self, embedding_bytes: bytes) -> np.ndarray:
+        """Deserialize a fallback-table embedding stored as float32 or int8."""
+        if len(embedding_bytes) == self.embedding_dim:
+            return np.frombuffer(embedding_bytes, dtype=np.int8).astype(np.float32)
+        return np.frombuffer(embedding_bytes, dtype=np.float32)
 
     def search_bm25(self, query: str, top_k: int = 10) -> List[SearchResult]:
         """
@@ -323,7 +555,7 @@ class SemanticIndexer:
         Returns:
             List of search results
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -354,21 +586,45 @@ class SemanticIndexer:
         conn.close()
         return results
 
-    def search_vector(self, query: str, top_k: int = 10) -> List[SearchResult]:
+    def embed_batch(self, queries: List[str]) -> np.ndarray:
+        """
+        Embed several queries in one forward pass.
+
+        Args:
+            queries: Query strings
+
+        Returns:
+            Array of shape (len(queries), embedding_dim)
+        """
+        return self.model.encode(
+            queries,
+            batch_size=max(len(queries), 1),
+            show_progress_bar=False
+        )
+
+    def search_vector(
+        self,
+        query: str,
+        top_k: int = 10,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[SearchResult]:
         """
         Vector similarity search.
 
         Args:
             query: Search query
             top_k: Number of results
+            query_embedding: Precomputed embedding of the query
+                (e.g. a row of embed_batch); computed if omitted
 
         Returns:
             List of search results
         """
         # Generate query embedding
-        query_embedding = self.model.encode([query])[0]
+        if query_embedding is None:
+            query_embedding = self.model.encode([query])[0]
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         # Try vec0 search first
@@ -402,20 +658,10 @@ class SemanticIndexer:
 
         except sqlite3.OperationalError:
             # Fallback to numpy-based search
-            cursor.execute("SELECT chunk_id, embedding FROM embeddings_fallback")
-            rows = cursor.fetchall()
-
-            # Compute similarities
-            similarities = []
-            for chunk_id, embedding_bytes in rows:
-                embedding = np.frombuffer(embedding_bytes, dtype=np.float32)
-                similarity = np.dot(query_embedding, embedding) / (
-                    np.linalg.norm(query_embedding) * np.linalg.norm(embedding)
-                )
-                similarities.append((chunk_id, similarity))
+            similarities = self._search_ann(cursor, query_embedding, top_k)
+            if similarities is None:
+                similarities = self._search_exact(cursor, query_embedding)
 
-            # Sort by similarity
-            similarities.sort(key=lambda x: x[1], reverse=True)
             top_chunk_ids = [x[0] for x in similarities[:top_k]]
 
             # Fetch chunk details
@@ -445,12 +691,117 @@ class SemanticIndexer:
             conn.close()
             return results
 
+    def _search_exact(
+        self,
+        cursor: sqlite3.Cursor,
+        query_embedding: np.ndarray
+    ) -> List[Tuple[str, float]]:
+        """Score every fallback-table embedding, best first."""
+        cursor.execute("SELECT chunk_id, embedding FROM embeddings_fallback")
+        rows = cursor.fetchall()
+        if not rows:
+            return []
+
+        # Compute similarities against all stored embeddings at once
+        matrix = np.stack([self._decode_embedding(embedding_bytes) for _, embedding_bytes in rows])
+        scores = (matrix @ query_embedding) / (
+            np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_embedding)
+        )
+
+        # Sort by similarity
+        order = np.argsort(-scores, kind="stable")
+        return [(rows[i][0], scores[i]) for i in order]
+
+    def _search_ann(
+        self,
+        cursor: sqlite3.Cursor,
+        query_embedding: np.ndarray,
+        top_k: int
+    ) -> Optional[List[Tuple[str, float]]]:
+        """
+        Approximate nearest neighbours from the HNSW index.
+
+        Returns:
+            Top (chunk_id, similarity) pairs, or None when the index is not
+            in use (hnswlib missing or too few chunks for it to pay off)
+        """
+        if not self.use_ann:
+            return None
+
+        state = cursor.execute("SELECT COUNT(*), MAX(updated_at) FROM memory_chunks").fetchone()
+        if state[0] < ANN_MIN_CHUNKS:
+            return None
+
+        index = self._load_ann(cursor, list(state))
+        k = min(top_k, index.get_current_count())
+        if k == 0:
+            return []
+
+        index.set_ef(max(ANN_EF_SEARCH, k))
+        labels, distances = index.knn_query(query_embedding, k=k)
+        labels = [int(label) for label in labels[0]]
+
+        # Labels are embeddings_fallback rowids
+        placeholders = ",".join(["?"] * len(labels))
+        cursor.execute(f"""
+            SELECT rowid, chunk_id FROM embeddings_fallback
+            WHERE rowid IN ({placeholders})
+        """, labels)
+        chunk_ids = dict(cursor.fetchall())
+
+        return [
+            (chunk_ids[label], 1 - float(distance))  # Convert distance to similarity
+            for label, distance in zip(labels, distances[0])
+            if label in chunk_ids
+        ]
+
+    def _load_ann(self, cursor: sqlite3.Cursor, state: List[Any]):
+        """
+        Return an HNSW index matching the database, rebuilding it if stale.
+
+        The index is reused from memory or from ann_path as long as the
+        chunk count and last update time it was built at still match.
+        """
+        if self._ann is not None and self._ann_state == state:
+            return self._ann
+
+        index = hnswlib.Index(space="cosine", dim=self.embedding_dim)
+        state_path = self.ann_path.with_suffix(".hnsw.json")
+
+        try:
+            if json.loads(state_path.read_text()) == state:
+                index.load_index(str(self.ann_path))
+                self._ann, self._ann_state = index, state
+                return index
+        except (OSError, ValueError, RuntimeError):
+            pass
+
+        cursor.execute("SELECT rowid, embedding FROM embeddings_fallback")
+        rows = cursor.fetchall()
+        index.init_index(max_elements=max(len(rows), 1), ef_construction=ANN_EF_CONSTRUCTION, M=ANN_M)
+        if rows:
+            index.add_items(
+                np.stack([self._decode_embedding(embedding_bytes) for _, embedding_bytes in rows]),
+                [rowid for rowid, _ in rows]
+            )
+
+        try:
+            index.save_index(str(self.ann_path))
+            state_path.write_text(json.dumps(state))
+        except (OSError, RuntimeError):
+            # Saving is best-effort; the in-memory index is still valid
+            pass
+
+        self._ann, self._ann_state = index, state
+        return index
+
     def search_hybrid(
         self,
         query: str,
         top_k: int = 10,
         bm25_weight: float = 0.3,
-        vector_weight: float = 0.7
+        vector_weight: float = 0.7,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[SearchResult]:
         """
         Hybrid BM25 + Vector search with score fusion.
@@ -460,14 +811,48 @@ class SemanticIndexer:
             top_k: Number of results
             bm25_weight: Weight for BM25 scores (0-1)
             vector_weight: Weight for vector scores (0-1)
+            query_embedding: Precomputed embedding of the query; computed
+                if omitted
 
         Returns:
             List of search results sorted by combined score
         """
         # Get both sets of results
         bm25_results = self.search_bm25(query, top_k * 2)
-        vector_results = self.search_vector(query, top_k * 2)
+        vector_results = self.search_vector(query, top_k * 2, query_embedding=query_embedding)
+
+        return self.search_hybrid_from(
+            bm25_results,
+            vector_results,
+            top_k=top_k,
+            bm25_weight=bm25_weight,
+            vector_weight=vector_weight
+        )
+
+    def search_hybrid_from(
+        self,
+        bm25_results: List[SearchResult],
+        vector_results: List[SearchResult],
+        top_k: int = 10,
+        bm25_weight: float = 0.3,
+        vector_weight: float = 0.7
+    ) -> List[SearchResult]:
+        """
+        Fuse existing BM25 and vector results into hybrid results.
 
+        Lets callers that already ran both searches (search_hybrid uses
+        top_k * 2 of each) get the hybrid ranking without searching again.
+
+        Args:
+            bm25_results: Results from search_bm25
+            vector_results: Results from search_vector
+            top_k: Number of results
+            bm25_weight: Weight for BM25 scores (0-1)
+            vector_weight: Weight for vector scores (0-1)
+
+        Returns:
+            List of search results sorted by combined score
+        """
         # Normalize scores to 0-1 range
         def normalize_scores(results: List[SearchResult]) -> Dict[str, float]:
             if not results:
@@ -509,7 +894,7 @@ class SemanticIndexer:
         )[:top_k]
 
         # Fetch chunk details
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         placeholders = ",".join(["?"] * len(sorted_chunk_ids))
@@ -548,7 +933,7 @@ class SemanticIndexer:
         Returns:
             List of recent chunks
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute("""
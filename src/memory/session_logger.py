@@ -5,8 +5,11 @@ Manages conversation sessions, logs messages to both SQLite and Markdown,
 and handles session lifecycle.
 """
 
-from datetime import datetime
-from typing import Optional, Any
+import re
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Optional, Any, Hashable, Union
 from pathlib import Path
 
 from .database import Database, get_database
@@ -18,6 +21,10 @@ from ..utils.config import config
 
 logger = get_logger(__name__)
 
+# Sessions kept in the in-memory lookup before the least recently used one
+# is dropped (it is found again in the database if still active)
+ACTIVE_SESSIONS_MAX = 1024
+
 
 class SessionLogger:
     """Manages conversation sessions and message logging."""
@@ -39,6 +46,24 @@ class SessionLogger:
         self.markdown = markdown_manager or MarkdownManager()
         self._current_session: Optional[Session] = None
 
+        # Active sessions by (adapter, channel key, user), least recently
+        # used first; filled by get_or_create_session, cleared when
+        # sessions end and bounded by ACTIVE_SESSIONS_MAX
+        self._active: OrderedDict[tuple, Session] = OrderedDict()
+
+    @asynccontextmanager
+    async def pipeline(self):
+        """
+        Batch the logger's database writes into one transaction.
+
+        Example:
+            async with session_logger.pipeline():
+                await session_logger.log_user_message(text, session_id=sid)
+                context = await session_logger.get_context_window(sid)
+        """
+        async with self.db.transaction():
+            yield self
+
     # ========== Session Management ==========
 
     async def start_session(
@@ -97,31 +122,61 @@ class SessionLogger:
     async def get_or_create_session(
         self,
         adapter: str,
-        channel_id: Optional[str] = None,
+        channel_id: Optional[Union[str, tuple[str, ...]]] = None,
         user_id: Optional[str] = None
     ) -> Session:
         """
         Get existing active session or create new one.
 
+        Sessions found or created here are remembered in memory (up to
+        ACTIVE_SESSIONS_MAX), so later calls for the same channel skip
+        the database.
+
         Args:
             adapter: Adapter type
-            channel_id: Optional channel/thread ID
+            channel_id: Optional channel/thread ID, or a tuple of parts
+                (e.g. (channel, thread_ts)) stored joined with ':'
             user_id: Optional user identifier
 
         Returns:
             Session (existing or new)
         """
+        key = (adapter, channel_id, user_id)
+        session = self._active.get(key)
+        if session is not None:
+            self._active.move_to_end(key)
+            self._current_session = session
+            return session
+
+        channel = self._format_channel_key(channel_id)
+
         # Try to find existing active session
         active_sessions = await self.ops.get_active_sessions(adapter=adapter)
 
         for session in active_sessions:
-            if session.channel_id == channel_id and session.user_id == user_id:
+            if session.channel_id == channel and session.user_id == user_id:
                 self._current_session = session
+                self._remember_session(key, session)
                 logger.debug("Using existing session", session_id=session.id)
                 return session
 
         # No existing session, create new one
-        return await self.start_session(adapter, channel_id, user_id)
+        session = await self.start_session(adapter, channel, user_id)
+        self._remember_session(key, session)
+        return session
+
+    def _remember_session(self, key: tuple, session: Session) -> None:
+        """Add a session to the in-memory lookup, evicting the least recently used."""
+        self._active[key] = session
+        if len(self._active) > ACTIVE_SESSIONS_MAX:
+            self._active.popitem(last=False)
+
+    @staticmethod
+    def _format_channel_key(channel_id: Optional[Hashable]) -> Optional[str]:
+        """Return the stored form of a channel key (tuples joined with ':')."""
+        if isinstance(channel_id, tuple):
+            return ":".join(str(part) for part in channel_id)
+        return channel_id
 
     async def end_session(self, session_id: Optional[str] = None) -> None:
         """
@@ -152,8 +207,15 @@ class SessionLogger:
         if self._current_session and self._current_session.id == session_id:
             self._current_session = None
 
+        self._forget_session(session_id)
+
         logger.info("Session ended", session_id=session_id)
 
+    def _forget_session(self, session_id: str) -> None:
+        """Drop a session that is no longer active from the in-memory lookup."""
+        for key in [key for key, session in self._active.items() if session.id == session_id]:
+            del self._active[key]
+
     async def archive_old_sessions(self, days_old: int = 7) -> int:
         """
         Archive sessions older than specified days.
@@ -164,8 +226,6 @@ class SessionLogger:
         Returns:
             Number of sessions archived
         """
-        from datetime import timedelta
-
         cutoff = datetime.now() - timedelta(days=days_old)
         cutoff_str = cutoff.isoformat()
 
@@ -179,6 +239,7 @@ class SessionLogger:
         count = 0
         for row in rows:
             await self.ops.update_session(row['id'], status='archived')
+            self._forget_session(row['id'])
             count += 1
 
         logger.info("Sessions archived", count=count, days_old=days_old)
@@ -222,16 +283,18 @@ class SessionLogger:
             metadata=metadata
         )
 
-        await self.ops.create_message(message)
+        # Message insert, session update and rotation commit together
+        async with self.pipeline():
+            await self.ops.create_message(message)
 
-        # Log to daily markdown
-        await self._append_message_to_daily_log(message, session_id)
+            # Log to daily markdown
+            await self._append_message_to_daily_log(message, session_id)
 
-        # Check if session should be rotated
-        session = await self.ops.get_session(session_id)
-        if session and session.message_count >= config.MEMORY_MAX_SESSION_LENGTH:
-            logger.info("Session reached max length, ending", session_id=session_id)
-            await self.end_session(session_id)
+            # Check if session should be rotated
+            session = await self.ops.get_session(session_id)
+            if session and session.message_count >= config.MEMORY_MAX_SESSION_LENGTH:
+                logger.info("Session reached max length, ending", session_id=session_id)
+                await self.end_session(session_id)
 
         logger.debug("Message logged", message_id=message.id, role=role, session_id=session_id)
 
@@ -283,6 +346,34 @@ class SessionLogger:
             metadata=metadata
         )
 
+    async def log_messages_bulk(self, messages: list[Message]) -> None:
+        """
+        Log several already-built messages in one transaction.
+
+        Rows are inserted with executemany; the daily log and session
+        rotation are handled as in log_message.
+
+        Args:
+            messages: Messages to log, oldest first
+        """
+        if not messages:
+            return
+
+        async with self.pipeline():
+            await self.ops.create_messages(messages)
+
+            for message in messages:
+                await self._append_message_to_daily_log(message, message.session_id)
+
+            # Check if any session should be rotated
+            for session_id in dict.fromkeys(message.session_id for message in messages):
+                session = await self.ops.get_session(session_id)
+                if session and session.message_count >= config.MEMORY_MAX_SESSION_LENGTH:
+                    logger.info("Session reached max length, ending", session_id=session_id)
+                    await self.end_session(session_id)
+
+        logger.debug("Messages logged", count=len(messages))
+
     async def get_conversation_history(
         self,
         session_id: Optional[str] = None,
@@ -319,7 +410,8 @@ class SessionLogger:
             max_messages: Maximum number of recent messages
 
         Returns:
-            List of message dicts with 'role' and 'content'
+            New list of message dicts with 'role' and 'content', owned by
+            the caller (safe to modify)
         """
         messages = await self.get_conversation_history(session_id, limit=max_messages)
 
@@ -371,7 +463,6 @@ class SessionLogger:
             else:
                 # Append to existing session
                 pattern = rf"({session_header}.*?)(?=\n### |(?=\n## )|(?=\Z))"
-                import re
                 match = re.search(pattern, current, flags=re.DOTALL)
                 if match:
                     session_section = match.group(1)
@@ -397,10 +488,12 @@ class SessionLogger:
         return self._current_session
 
     async def initialize(self) -> None:
-        """Initialize session logger (connect to database)."""
-        if not self.db.connection:
-            await self.db.connect()
-            await self.db.initialize_schema()
+        """Initialize session logger (connect to database); a no-op once connected."""
+        if self.db.connection:
+            return
+
+        await self.db.connect()
+        await self.db.initialize_schema()
         logger.info("Session logger initialized")
 
     async def close(self) -> None:
@@ -0,0 +1,98 @@
+"""
+Persistent daemon for memory skills.
+
+Loading the embedding model dominates the runtime of the memory skills, so a
+skill can be started once with ``--daemon`` to keep its SemanticIndexer
+alive and serve later ``--client`` invocations over a Unix socket.
+
+Protocol: one request per connection. The client sends the JSON-encoded
+parameters dict and shuts down its write side; the daemon replies with the
+skill's stdout and closes the connection.
+"""
+
+import io
+import json
+import os
+import socket
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable, Dict
+
+
+SOCKET_DIR = Path.home() / ".cache" / "sentinel"
+
+
+def get_socket_path(skill_name: str) -> Path:
+    """Return the Unix socket path for a skill's daemon."""
+    return SOCKET_DIR / f"{skill_name}.sock"
+
+
+def _read_all(conn: socket.socket) -> bytes:
+    """Read from a socket until the peer closes its write side."""
+    parts = []
+    while True:
+        data = conn.recv(65536)
+        if not data:
+            break
+        parts.append(data)
+    return b"".join(parts)
+
+
+def serve(handler: Callable[[Dict[str, str]], None], socket_path: Path):
+    """
+    Serve skill requests forever.
+
+    Args:
+        handler: Skill entry point; called with the parameters dict and
+            expected to write its JSON result to stdout
+        socket_path: Unix socket to bind
+    """
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+    server.listen()
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                output = io.StringIO()
+                try:
+                    params = json.loads(_read_all(conn) or b"{}")
+                    with redirect_stdout(output):
+                        handler(params)
+                except SystemExit:
+                    # Skills exit non-zero after printing their error JSON
+                    pass
+                except Exception as e:
+                    output.write(json.dumps({"success": False, "error": str(e)}))
+                conn.sendall(output.getvalue().encode())
+    finally:
+        server.close()
+        if socket_path.exists():
+            socket_path.unlink()
+
+
+def request(params: Dict[str, str], socket_path: Path) -> str:
+    """
+    Send parameters to a running daemon.
+
+    Args:
+        params: Skill parameters
+        socket_path: Unix socket of the daemon
+
+    Returns:
+        The skill's output
+
+    Raises:
+        OSError: If no daemon is listening on socket_path
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(str(socket_path))
+        conn.sendall(json.dumps(params).encode())
+        conn.shutdown(socket.SHUT_WR)
+        return _read_all(conn).decode()
@@ -0,0 +1,5 @@
+"""
+Music Module
+
+Algorithmic music generation and Ableton Live control over OSC.
+"""
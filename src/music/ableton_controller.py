@@ -10,19 +10,94 @@ Requirements:
 - python-osc package installed
 """
 
-from typing import List, Optional, Tuple
-from pythonosc import udp_client, osc_server, dispatcher
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+from pythonosc import osc_server, dispatcher
+from pythonosc.parsing import osc_types
+from pythonosc.osc_bundle_builder import IMMEDIATELY
 from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder
+from pythonosc.osc_packet import OscPacket, ParseError
+import socket
+import struct
 import threading
 import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bundle header with the "immediately" time tag
+BUNDLE_HEADER = b"#bundle\x00" + osc_types.write_date(IMMEDIATELY)
+
+
+def _pad(data: bytes) -> bytes:
+    """Null-terminate data and pad it to a multiple of 4 bytes (OSC string)."""
+    return data + b"\x00" * (4 - len(data) % 4)
+
+
+@lru_cache(maxsize=None)
+def _encode_address(address: str) -> bytes:
+    """OSC-encode an address; the controller uses a small fixed set of them."""
+    return _pad(address.encode())
+
+
+def encode_message(address: str, args: list) -> bytes:
+    """
+    Encode an OSC message to its wire format.
+
+    Produces the same bytes as pythonosc's OscMessageBuilder, but with the
+    address encoded once and all numeric arguments packed in one call.
+    Argument types other than int, float, str and bool go through the
+    builder.
+
+    Args:
+        address: OSC address
+        args: Message arguments
+
+    Returns:
+        Datagram bytes
+    """
+    tags = [","]
+    fmt = [">"]
+    values = []
+    for arg in args:
+        if isinstance(arg, str):
+            data = _pad(arg.encode())
+            tags.append("s")
+            fmt.append(f"{len(data)}s")
+            values.append(data)
+        elif arg is True:
+            tags.append("T")
+        elif arg is False:
+            tags.append("F")
+        elif isinstance(arg, int) and arg.bit_length() <= 31:
+            tags.append("i")
+            fmt.append("i")
+            values.append(arg)
+        elif isinstance(arg, float):
+            tags.append("f")
+            fmt.append("f")
+            values.append(arg)
+        else:
+            builder = OscMessageBuilder(address=address)
+            for value in args:
+                builder.add_arg(value)
+            return builder.build().dgram
+
+    return (
+        _encode_address(address)
+        + _pad("".join(tags).encode())
+        + struct.pack("".join(fmt), *values)
+    )
+
 
 class AbletonController:
     """Control Ableton Live via OSC messages."""
 
+    # Notes per /live/clip/add/notes message; keeps datagrams well under the UDP limit
+    NOTES_PER_MESSAGE = 256
+
     def __init__(
         self,
         host: str = '127.0.0.1',
@@ -41,8 +116,9 @@ class AbletonController:
         self.send_port = send_port
         self.receive_port = receive_port
 
-        # OSC client (send to Ableton)
-        self.client = udp_client.SimpleUDPClient(host, send_port)
+        # One UDP socket for every message sent to Ableton
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._addr = socket.getaddrinfo(host, send_port, socket.AF_INET, socket.SOCK_DGRAM)[0][4]
 
         # OSC server (receive from Ableton) - optional
         self.server = None
@@ -50,6 +126,80 @@ class AbletonController:
 
         self._connected = False
 
+        # Encoded messages collected while inside bundle()
+        self._bundle: Optional[List[bytes]] = None
+
+    def _send(self, address: str, args: list):
+        """Send an OSC message, or queue it when a bundle is open."""
+        dgram = encode_message(address, args)
+        if self._bundle is not None:
+            self._bundle.append(dgram)
+        else:
+            self._sock.sendto(dgram, self._addr)
+
+    @contextmanager
+    def bundle(self):
+        """
+        Collect the messages sent inside the block into one OSC bundle.
+
+        AbletonOSC handles the bundled messages in order, so dependent calls
+        (e.g. create a track, then name it) need no pacing between them.
+
+        Example:
+            with ableton.bundle():
+                ableton.create_midi_track(0)
+                ableton.set_track_name(0, "Drums")
+        """
+        self._bundle = []
+        try:
+            yield
+            parts = [BUNDLE_HEADER]
+            for dgram in self._bundle:
+                parts.append(struct.pack(">i", len(dgram)))
+                parts.append(dgram)
+            self._sock.sendto(b"".join(parts), self._addr)
+        finally:
+            self._bundle = None
+
+    def query(self, address: str, args: Optional[list] = None, timeout: float = 1.0) -> Optional[Tuple[Any, ...]]:
+        """
+        Send a request and wait for AbletonOSC's reply on the receive port.
+
+        Args:
+            address: OSC address (e.g. '/live/song/get/num_tracks')
+            args: Message arguments
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            Reply arguments, or None if no reply arrived in time
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            try:
+                sock.bind(('', self.receive_port))
+            except OSError as e:
+                logger.error(f"Cannot listen on port {self.receive_port}: {e}")
+                return None
+
+            self._sock.sendto(encode_message(address, args or []), self._addr)
+
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                sock.settimeout(remaining)
+                try:
+                    data = sock.recv(65536)
+                    messages = OscPacket(data).messages
+                except socket.timeout:
+                    return None
+                except ParseError:
+                    continue
+
+                for packet in messages:
+                    if packet.message.address == address:
+                        return tuple(packet.message.params)
+
     def connect(self) -> bool:
         """
         Test connection to Ableton.
@@ -59,7 +209,7 @@ class AbletonController:
         """
         try:
             # Send test message
-            self.client.send_message('/live/test', [])
+            self._send('/live/test', [])
             self._connected = True
             logger.info(f"Connected to Ableton on port {self.send_port}")
             return True
@@ -82,11 +232,11 @@ class AbletonController:
 
     def play(self):
         """Start playback."""
-        self.client.send_message('/live/song/start_playing', [])
+        self._send('/live/song/start_playing', [])
 
     def stop(self):
         """Stop playback."""
-        self.client.send_message('/live/song/stop_playing', [])
+        self._send('/live/song/stop_playing', [])
 
     def set_tempo(self, bpm: float):
         """
@@ -95,7 +245,7 @@ class AbletonController:
         Args:
             bpm: Tempo in beats per minute (20-999)
         """
-        self.client.send_message('/live/song/set/tempo', [bpm])
+        self._send('/live/song/set/tempo', [bpm])
 
     def get_tempo(self) -> Optional[float]:
         """Get current tempo (requires OSC server setup)."""
@@ -110,8 +260,8 @@ class AbletonController:
             numerator: Top number (e.g., 4 in 4/4)
             denominator: Bottom number (e.g., 4 in 4/4)
         """
-        self.client.send_message('/live/song/set/signature_numerator', [numerator])
-        self.client.send_message('/live/song/set/signature_denominator', [denominator])
+        self._send('/live/song/set/signature_numerator', [numerator])
+        self._send('/live/song/set/signature_denominator', [denominator])
 
     # ============================================================================
     # TRACK OPERATIONS
@@ -127,11 +277,27 @@ class AbletonController:
         Returns:
             Track index
         """
-        self.client.send_message('/live/song/create_midi_track', [index])
+        self._send('/live/song/create_midi_track', [index])
         # If index is -1, we'd need to query the track count
         # For now, return the index
         return index
 
+    def get_num_tracks(self, timeout: float = 1.0) -> Optional[int]:
+        """
+        Get the number of tracks in the set.
+
+        Also useful as a barrier: the reply is sent only after AbletonOSC has
+        handled every message sent before the query.
+
+        Args:
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            Track count, or None if Ableton did not reply
+        """
+        reply = self.query('/live/song/get/num_tracks', timeout=timeout)
+        return reply[0] if reply else None
+
     def create_audio_track(self, index: int = -1) -> int:
         """
         Create an audio track.
@@ -142,7 +308,7 @@ class AbletonController:
         Returns:
             Track index
         """
-        self.client.send_message('/live/song/create_audio_track', [index])
+        self._send('/live/song/create_audio_track', [index])
         return index
 
     def set_track_name(self, track_id: int, name: str):
@@ -153,7 +319,7 @@ class AbletonController:
             track_id: Track index (0-based)
             name: Track name
         """
-        self.client.send_message('/live/track/set/name', [track_id, name])
+        self._send('/live/track/set/name', [track_id, name])
 
     def set_track_volume(self, track_id: int, volume_db: float):
         """
@@ -163,7 +329,7 @@ class AbletonController:
             track_id: Track index
             volume_db: Volume in dB (-inf to 6.0, 0 = unity)
         """
-        self.client.send_message('/live/track/set/volume', [track_id, volume_db])
+        self._send('/live/track/set/volume', [track_id, volume_db])
 
     def set_track_pan(self, track_id: int, pan: float):
         """
@@ -173,7 +339,7 @@ class AbletonController:
             track_id: Track index
             pan: Pan position (-1.0 = left, 0 = center, 1.0 = right)
         """
-        self.client.send_message('/live/track/set/panning', [track_id, pan])
+        self._send('/live/track/set/panning', [track_id, pan])
 
     def mute_track(self, track_id: int, muted: bool = True):
         """
@@ -183,7 +349,7 @@ class AbletonController:
             track_id: Track index
             muted: True to mute, False to unmute
         """
-        self.client.send_message('/live/track/set/mute', [track_id, 1 if muted else 0])
+        self._send('/live/track/set/mute', [track_id, 1 if muted else 0])
 
     def solo_track(self, track_id: int, solo: bool = True):
         """
@@ -193,7 +359,7 @@ class AbletonController:
             track_id: Track index
             solo: True to solo, False to unsolo
         """
-        self.client.send_message('/live/track/set/solo', [track_id, 1 if solo else 0])
+        self._send('/live/track/set/solo', [track_id, 1 if solo else 0])
 
     def arm_track(self, track_id: int, armed: bool = True):
         """
@@ -203,7 +369,7 @@ class AbletonController:
             track_id: Track index
             armed: True to arm, False to disarm
         """
-        self.client.send_message('/live/track/set/arm', [track_id, 1 if armed else 0])
+        self._send('/live/track/set/arm', [track_id, 1 if armed else 0])
 
     # ============================================================================
     # CLIP OPERATIONS
@@ -226,7 +392,7 @@ class AbletonController:
         Returns:
             (track_id, clip_slot) tuple
         """
-        self.client.send_message(
+        self._send(
             '/live/clip_slot/create_clip',
             [track_id, clip_slot, length_bars]
         )
@@ -240,7 +406,7 @@ class AbletonController:
             track_id: Track index
             clip_slot: Clip slot index
         """
-        self.client.send_message('/live/clip_slot/fire', [track_id, clip_slot])
+        self._send('/live/clip_slot/fire', [track_id, clip_slot])
 
     def stop_clip(self, track_id: int, clip_slot: int):
         """
@@ -250,7 +416,7 @@ class AbletonController:
             track_id: Track index
             clip_slot: Clip slot index
         """
-        self.client.send_message('/live/clip_slot/stop', [track_id, clip_slot])
+        self._send('/live/clip_slot/stop', [track_id, clip_slot])
 
     def add_note(
         self,
@@ -274,7 +440,7 @@ class AbletonController:
             velocity: Note velocity (0-127)
             muted: Whether note is muted
         """
-        self.client.send_message(
+        self._send(
             '/live/clip/add/notes',
             [track_id, clip_slot, pitch, start_time, duration, velocity, 1 if muted else 0]
         )
@@ -288,13 +454,20 @@ class AbletonController:
         """
         Add multiple MIDI notes to clip.
 
+        AbletonOSC accepts any number of notes in one /live/clip/add/notes
+        message, so notes are sent in a few large messages rather than one
+        packet per note.
+
         Args:
             track_id: Track index
             clip_slot: Clip slot index
             notes: List of (pitch, start_time, duration, velocity) tuples
         """
-        for pitch, start_time, duration, velocity in notes:
-            self.add_note(track_id, clip_slot, pitch, start_time, duration, velocity)
+        for i in range(0, len(notes), self.NOTES_PER_MESSAGE):
+            args = [track_id, clip_slot]
+            for pitch, start_time, duration, velocity in notes[i:i + self.NOTES_PER_MESSAGE]:
+                args.extend((pitch, start_time, duration, velocity, 0))
+            self._send('/live/clip/add/notes', args)
 
     def clear_clip(self, track_id: int, clip_slot: int):
         """
@@ -304,7 +477,7 @@ class AbletonController:
             track_id: Track index
             clip_slot: Clip slot index
         """
-        self.client.send_message('/live/clip/clear_all_notes', [track_id, clip_slot])
+        self._send('/live/clip/clear_all_notes', [track_id, clip_slot])
 
     def set_clip_name(self, track_id: int, clip_slot: int, name: str):
         """
@@ -315,7 +488,7 @@ class AbletonController:
             clip_slot: Clip slot index
             name: Clip name
         """
-        self.client.send_message('/live/clip/set/name', [track_id, clip_slot, name])
+        self._send('/live/clip/set/name', [track_id, clip_slot, name])
 
     # ============================================================================
     # DEVICE OPERATIONS
@@ -337,7 +510,7 @@ class AbletonController:
         """
         # Note: AbletonOSC may have limited device loading support
         # Check API documentation for available device names
-        self.client.send_message(
+        self._send(
             '/live/track/load_device',
             [track_id, device_name, device_index]
         )
@@ -358,7 +531,7 @@ class AbletonController:
             parameter_index: Parameter index (0-based)
             value: Parameter value (range depends on parameter)
         """
-        self.client.send_message(
+        self._send(
             '/live/device/set/parameter/value',
             [track_id, device_index, parameter_index, value]
         )
@@ -374,7 +547,7 @@ class AbletonController:
         Args:
             scene_index: Scene index (0-based)
         """
-        self.client.send_message('/live/scene/fire', [scene_index])
+        self._send('/live/scene/fire', [scene_index])
 
     def create_scene(self, index: int = -1) -> int:
         """
@@ -386,7 +559,7 @@ class AbletonController:
         Returns:
             Scene index
         """
-        self.client.send_message('/live/song/create_scene', [index])
+        self._send('/live/song/create_scene', [index])
         return index
 
     # ============================================================================
@@ -400,7 +573,7 @@ class AbletonController:
         Args:
             level: Log level ('debug', 'info', 'warning', 'error')
         """
-        self.client.send_message('/live/api/set/log_level', [level])
+        self._send('/live/api/set/log_level', [level])
 
     def is_connected(self) -> bool:
         """Check if connected to Ableton."""
@@ -0,0 +1,38 @@
+"""
+Music generators for melody, chords, bass, and drums.
+
+The generator classes are also available from this package directly
+(e.g. ``from music.generators import ChordGenerator``); each submodule is
+imported on first access.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'MelodyGenerator': 'melody_generator',
+    'Note': 'melody_generator',
+    'NoteLength': 'melody_generator',
+    'Scale': 'melody_generator',
+    'ChordGenerator': 'chord_generator',
+    'Chord': 'chord_generator',
+    'ChordType': 'chord_generator',
+    'BassGenerator': 'bass_generator',
+    'DrumGenerator': 'drum_generator',
+    'DrumHit': 'drum_generator',
+    'DrumSound': 'drum_generator',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{_EXPORTS[name]}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
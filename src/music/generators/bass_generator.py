@@ -9,7 +9,7 @@ Generates bass lines that:
 """
 
 import random
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass
 
 from .chord_generator import Chord, ChordType
@@ -19,17 +19,19 @@ from .melody_generator import Scale, Note
 class BassGenerator:
     """Generate bass lines that follow chord progressions."""
 
-    def __init__(self, key_root: int = 60, scale: List[int] = None):
+    def __init__(self, key_root: int = 60, scale: List[int] = None, seed: Optional[int] = None):
         """
         Initialize bass generator.
 
         Args:
             key_root: Root note of key (default: C4 = 60)
             scale: Scale intervals (default: minor pentatonic)
+            seed: Random seed for reproducible output (default: unseeded)
         """
         self.key_root = key_root
         self.scale = scale or Scale.MINOR_PENTATONIC
         self.scale_notes = self._get_scale_notes()
+        self.rng = random.Random(seed)
 
     def _get_scale_notes(self) -> List[int]:
         """Get notes in the scale across 2 octaves (for bass range)."""
@@ -113,9 +115,9 @@ class BassGenerator:
                     note_pitch = next_root - 1
                 else:
                     # Middle beats: use chord tones or scale notes
-                    if random.random() < 0.7:
+                    if self.rng.random() < 0.7:
                         # Use chord tone
-                        note_pitch = random.choice(chord_notes)
+                        note_pitch = self.rng.choice(chord_notes)
                     else:
                         # Use scale note
                         note_pitch = self._find_nearest_scale_note(chord_root)
@@ -124,7 +126,7 @@ class BassGenerator:
                     pitch=note_pitch,
                     start=beat_time,
                     duration=1.0,  # Quarter note
-                    velocity=velocity + random.randint(-5, 5)  # Slight variation
+                    velocity=velocity + self.rng.randint(-5, 5)  # Slight variation
                 ))
 
         return bass_notes
@@ -251,7 +253,7 @@ class BassGenerator:
                     else:
                         # Use chord tones
                         if len(chord_notes) >= 2:
-                            note_pitch = random.choice(chord_notes[1:])  # Not root
+                            note_pitch = self.rng.choice(chord_notes[1:])  # Not root
                         else:
                             note_pitch = chord_root
                         vel = velocity - 20
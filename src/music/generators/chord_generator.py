@@ -9,7 +9,7 @@ Generates chord progressions for different musical contexts:
 """
 
 import random
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -27,7 +27,7 @@ class ChordType(Enum):
     AUGMENTED = "aug"
 
 
-@dataclass
+@dataclass(slots=True)
 class Chord:
     """Chord representation."""
     root: int  # MIDI note number
@@ -41,6 +41,11 @@ class Chord:
         intervals = CHORD_INTERVALS[self.chord_type]
         return [self.root + interval for interval in intervals]
 
+    @property
+    def num_notes(self) -> int:
+        """Number of notes in this chord."""
+        return len(CHORD_INTERVALS[self.chord_type])
+
 
 # Chord intervals (semitones from root)
 CHORD_INTERVALS = {
@@ -84,17 +89,19 @@ PROGRESSIONS = {
 class ChordGenerator:
     """Generate chord progressions for different styles."""
 
-    def __init__(self, key_root: int = 60, scale: List[int] = None):
+    def __init__(self, key_root: int = 60, scale: List[int] = None, seed: Optional[int] = None):
         """
         Initialize chord generator.
 
         Args:
             key_root: Root note of key (default: C4 = 60)
             scale: Scale intervals (default: major scale)
+            seed: Random seed for reproducible output (default: unseeded)
         """
         self.key_root = key_root
         self.scale = scale or Scale.MAJOR
         self.scale_notes = self._get_scale_notes()
+        self.rng = random.Random(seed)
 
     def _get_scale_notes(self) -> List[int]:
         """Get notes in the scale (one octave)."""
@@ -277,7 +284,7 @@ class ChordGenerator:
         for chord in chords:
             if variation_type == "rhythm":
                 # Randomly split chords into shorter durations
-                if random.random() < 0.3 and chord.duration >= 2.0:
+                if self.rng.random() < 0.3 and chord.duration >= 2.0:
                     # Split into two chords
                     half_duration = chord.duration / 2
                     varied.append(Chord(
@@ -294,7 +301,7 @@ class ChordGenerator:
 
             elif variation_type == "substitution":
                 # Randomly substitute chords with similar ones
-                if random.random() < 0.2:
+                if self.rng.random() < 0.2:
                     # Substitute major with major7, minor with minor7
                     if chord.chord_type == ChordType.MAJOR:
                         new_chord = Chord(
@@ -9,7 +9,7 @@ Generates realistic drum patterns with:
 """
 
 import random
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -29,7 +29,7 @@ class DrumSound(Enum):
     RIM = 37            # Side Stick/Rimshot
 
 
-@dataclass
+@dataclass(slots=True)
 class DrumHit:
     """Single drum hit."""
     sound: DrumSound
@@ -40,16 +40,18 @@ class DrumHit:
 class DrumGenerator:
     """Generate drum patterns for different genres."""
 
-    def __init__(self, bpm: int = 90, swing: float = 0.0):
+    def __init__(self, bpm: int = 90, swing: float = 0.0, seed: Optional[int] = None):
         """
         Initialize drum generator.
 
         Args:
             bpm: Tempo in beats per minute
             swing: Swing amount (0.0 = straight, 0.5 = triplet swing, 1.0 = heavy swing)
+            seed: Random seed for reproducible output (default: unseeded)
         """
         self.bpm = bpm
         self.swing = swing
+        self.rng = random.Random(seed)
 
     def _apply_swing(self, beat: float) -> float:
         """
@@ -106,7 +108,7 @@ class DrumGenerator:
             # Kick pattern (lo-fi: kick on 1, sometimes 3.5)
             pattern.append(DrumHit(DrumSound.KICK, bar_start + 0.0, 100))
 
-            if random.random() < 0.7:  # 70% chance
+            if self.rng.random() < 0.7:  # 70% chance
                 pattern.append(DrumHit(DrumSound.KICK, bar_start + 2.5, 85))
 
             # Snare on 2 and 4 (classic backbeat)
@@ -119,14 +121,14 @@ class DrumGenerator:
                 beat_swung = self._apply_swing(beat)
 
                 # Not every hat hit (lo-fi is sparse)
-                if random.random() < (0.6 + complexity * 0.3):
+                if self.rng.random() < (0.6 + complexity * 0.3):
                     # Alternate closed/open
                     if i % 4 == 0:
                         hat_sound = DrumSound.CLOSED_HAT
                         velocity = 65
                     else:
                         hat_sound = DrumSound.CLOSED_HAT
-                        velocity = 45 + int(random.random() * 15)  # Variation
+                        velocity = 45 + int(self.rng.random() * 15)  # Variation
 
                     pattern.append(DrumHit(hat_sound, beat_swung, velocity))
 
@@ -134,11 +136,11 @@ class DrumGenerator:
             if complexity > 0.5:
                 ghost_positions = [0.75, 1.75, 2.75]
                 for pos in ghost_positions:
-                    if random.random() < 0.4:
+                    if self.rng.random() < 0.4:
                         pattern.append(DrumHit(
                             DrumSound.SNARE,
                             bar_start + pos,
-                            30 + int(random.random() * 15)
+                            30 + int(self.rng.random() * 15)
                         ))
 
         # Apply humanization
@@ -178,7 +180,7 @@ class DrumGenerator:
                 pattern.append(DrumHit(
                     DrumSound.KICK,
                     bar_start + i,
-                    110 + int(random.random() * 10)
+                    110 + int(self.rng.random() * 10)
                 ))
 
             # Clap/snare on 2 and 4
@@ -198,7 +200,7 @@ class DrumGenerator:
             # Open hat on off-beats (house signature)
             if complexity > 0.4:
                 for i in [0.5, 1.5, 2.5, 3.5]:
-                    if random.random() < 0.7:
+                    if self.rng.random() < 0.7:
                         pattern.append(DrumHit(DrumSound.OPEN_HAT, bar_start + i, 60))
 
         return pattern
@@ -235,7 +237,7 @@ class DrumGenerator:
                 pattern.append(DrumHit(DrumSound.KICK, bar_start + pos, 110))
 
             # Kick rolls (32nd notes)
-            if complexity > 0.6 and random.random() < 0.5:
+            if complexity > 0.6 and self.rng.random() < 0.5:
                 roll_start = bar_start + 3.75
                 for i in range(2):
                     pattern.append(DrumHit(
@@ -328,11 +330,11 @@ class DrumGenerator:
 
         for hit in pattern:
             # Timing variation (±amount * 0.03 beats)
-            timing_var = random.uniform(-amount * 0.03, amount * 0.03)
+            timing_var = self.rng.uniform(-amount * 0.03, amount * 0.03)
             new_start = max(0, hit.start + timing_var)
 
             # Velocity variation (±amount * 15)
-            velocity_var = int(random.uniform(-amount * 15, amount * 15))
+            velocity_var = int(self.rng.uniform(-amount * 15, amount * 15))
             new_velocity = max(20, min(127, hit.velocity + velocity_var))
 
             humanized.append(DrumHit(
@@ -8,7 +8,7 @@ Demonstrates different levels of musical creativity:
 """
 
 import random
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -22,7 +22,7 @@ class NoteLength(Enum):
     SIXTEENTH = 0.25
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     """Musical note representation."""
     pitch: int  # MIDI note number (0-127)
@@ -70,17 +70,19 @@ class Scale:
 class MelodyGenerator:
     """Generate melodies with different creativity levels."""
 
-    def __init__(self, key_root: int = 60, scale: List[int] = None):
+    def __init__(self, key_root: int = 60, scale: List[int] = None, seed: Optional[int] = None):
         """
         Initialize melody generator.
 
         Args:
             key_root: Root note of key (default: C4 = 60)
             scale: Scale intervals (default: minor pentatonic)
+            seed: Random seed for reproducible output (default: unseeded)
         """
         self.key_root = key_root
         self.scale = scale or Scale.MINOR_PENTATONIC
         self.scale_notes = Scale.get_notes(key_root, self.scale, octaves=2)
+        self.rng = random.Random(seed)
 
     def generate_basic(self, bars: int = 4) -> List[Note]:
         """
@@ -165,8 +167,8 @@ class MelodyGenerator:
 
         while current_beat < total_beats:
             # Choose rhythm (more variation with higher creativity)
-            if random.random() < creativity:
-                duration = random.choices(
+            if self.rng.random() < creativity:
+                duration = self.rng.choices(
                     [r[0] for r in rhythms],
                     weights=[r[1] for r in rhythms]
                 )[0]
@@ -174,12 +176,12 @@ class MelodyGenerator:
                 duration = NoteLength.QUARTER.value
 
             # Melodic movement (prefer steps, occasional leaps)
-            if random.random() < creativity:
+            if self.rng.random() < creativity:
                 # Occasional leap (3-5 scale degrees)
-                movement = random.choice([-5, -4, -3, 3, 4, 5])
+                movement = self.rng.choice([-5, -4, -3, 3, 4, 5])
             else:
                 # Stepwise motion (-2 to +2 scale degrees)
-                movement = random.choice([-2, -1, 0, 1, 2])
+                movement = self.rng.choice([-2, -1, 0, 1, 2])
 
             next_pitch_idx = previous_pitch_idx + movement
             next_pitch_idx = max(0, min(next_pitch_idx, len(self.scale_notes) - 1))
@@ -189,7 +191,7 @@ class MelodyGenerator:
             # Dynamic velocity (with variation)
             base_velocity = 80
             velocity_variation = int(creativity * 30)
-            velocity = base_velocity + random.randint(-velocity_variation, velocity_variation)
+            velocity = base_velocity + self.rng.randint(-velocity_variation, velocity_variation)
             velocity = max(40, min(velocity, 120))
 
             melody.append(Note(pitch, current_beat, duration, velocity))
@@ -234,12 +236,12 @@ class MelodyGenerator:
         bar_num = 0
         while current_beat < total_beats:
             # Choose variation type
-            if bar_num == 0 or random.random() > creativity:
+            if bar_num == 0 or self.rng.random() > creativity:
                 # Original motif
                 variation = motif
             else:
                 # Apply variation
-                var_type = random.choice(variation_types)
+                var_type = self.rng.choice(variation_types)
                 variation = self._vary_motif(motif, var_type, creativity)
 
             # Add variation to melody (offset by current_beat)
@@ -287,7 +289,7 @@ class MelodyGenerator:
         for note in motif:
             if variation_type == 'transposed':
                 # Transpose up/down by scale degrees
-                transpose = random.choice([-3, -2, 2, 3]) if random.random() < intensity else 0
+                transpose = self.rng.choice([-3, -2, 2, 3]) if self.rng.random() < intensity else 0
                 # Find pitch in scale and transpose
                 try:
                     idx = self.scale_notes.index(note.pitch)
@@ -300,8 +302,8 @@ class MelodyGenerator:
 
             elif variation_type == 'rhythmic':
                 # Vary rhythm
-                if random.random() < intensity:
-                    new_duration = random.choice([0.5, 1.0, 2.0])
+                if self.rng.random() < intensity:
+                    new_duration = self.rng.choice([0.5, 1.0, 2.0])
                 else:
                     new_duration = note.duration
 
@@ -339,15 +341,15 @@ class MelodyGenerator:
 
         for note in melody:
             # Timing variation (±amount * 0.05 beats)
-            timing_var = random.uniform(-amount * 0.05, amount * 0.05)
+            timing_var = self.rng.uniform(-amount * 0.05, amount * 0.05)
             new_start = max(0, note.start + timing_var)
 
             # Velocity variation (±amount * 20)
-            velocity_var = int(random.uniform(-amount * 20, amount * 20))
+            velocity_var = int(self.rng.uniform(-amount * 20, amount * 20))
             new_velocity = max(40, min(120, note.velocity + velocity_var))
 
             # Slight duration variation
-            duration_var = random.uniform(-amount * 0.05, amount * 0.05)
+            duration_var = self.rng.uniform(-amount * 0.05, amount * 0.05)
             new_duration = max(0.1, note.duration + duration_var)
 
             humanized.append(Note(
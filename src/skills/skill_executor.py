@@ -13,6 +13,7 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass
 import json
 import signal
+import time
 
 import structlog
 
@@ -77,7 +78,6 @@ class SkillExecutor:
         Returns:
             ExecutionResult
         """
-        import time
         start_time = time.time()
 
         logger.info("executing_skill",
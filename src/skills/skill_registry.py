@@ -8,12 +8,18 @@ import os
 import re
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
 import structlog
 
+# libyaml's C loader parses SKILL.md metadata several times faster
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 logger = structlog.get_logger(__name__)
 
 
@@ -53,6 +59,10 @@ class SkillRegistry:
         self.skills_dir = Path(skills_dir)
         self.skills: Dict[str, SkillMetadata] = {}
 
+        # Memoized validate_skill/search_skills results, reset on discovery
+        self._validation_cache: Dict[str, Tuple[bool, List[str]]] = {}
+        self._search_cache: Dict[str, List[SkillMetadata]] = {}
+
         logger.info("skill_registry_initialized", skills_dir=str(self.skills_dir))
 
     def discover_skills(self) -> int:
@@ -64,6 +74,9 @@ class SkillRegistry:
         """
         logger.info("discovering_skills", skills_dir=str(self.skills_dir))
 
+        self._validation_cache.clear()
+        self._search_cache.clear()
+
         if not self.skills_dir.exists():
             logger.warning("skills_directory_not_found", path=str(self.skills_dir))
             return 0
@@ -123,7 +136,7 @@ class SkillRegistry:
             raise ValueError(f"No YAML metadata found in {skill_file}")
 
         yaml_content = yaml_match.group(1)
-        metadata_dict = yaml.safe_load(yaml_content)
+        metadata_dict = yaml.load(yaml_content, Loader=_SafeLoader)
 
         # Extract parameters from markdown table
         parameters = self._parse_parameters_table(content)
@@ -260,6 +273,11 @@ class SkillRegistry:
             List of matching SkillMetadata objects
         """
         query_lower = query.lower()
+
+        cached = self._search_cache.get(query_lower)
+        if cached is not None:
+            return list(cached)
+
         results = []
 
         for skill in self.skills.values():
@@ -269,12 +287,17 @@ class SkillRegistry:
                 any(query_lower in tag.lower() for tag in skill.tags)):
                 results.append(skill)
 
-        return sorted(results, key=lambda s: s.name)
+        results.sort(key=lambda s: s.name)
+        self._search_cache[query_lower] = results
+        return list(results)
 
     def validate_skill(self, name: str) -> tuple[bool, List[str]]:
         """
         Validate a skill's structure and requirements.
 
+        The result is computed once per skill and reused until the next
+        discovery, since validation stats several files on disk.
+
         Args:
             name: Skill name
 
@@ -285,6 +308,22 @@ class SkillRegistry:
         if not skill:
             return False, [f"Skill '{name}' not found"]
 
+        if name not in self._validation_cache:
+            self._validation_cache[name] = self._validate(skill)
+
+        is_valid, issues = self._validation_cache[name]
+        return is_valid, list(issues)
+
+    def _validate(self, skill: SkillMetadata) -> Tuple[bool, List[str]]:
+        """
+        Check a skill's files and metadata.
+
+        Args:
+            skill: Skill metadata
+
+        Returns:
+            Tuple of (is_valid, list_of_issues)
+        """
         issues = []
 
         # Check skill directory exists
@@ -6,12 +6,13 @@ Tests the core components without requiring real API credentials.
 
 import asyncio
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch
 
 from src.heartbeat.scheduler import HeartbeatScheduler
 from src.heartbeat.orchestrator import HeartbeatOrchestrator
 from src.heartbeat.base_monitor import BaseMonitor, Alert
+from src.heartbeat.calendar_monitor import CalendarMonitor
 from src.heartbeat.notifier import Notifier
 from src.heartbeat.reasoning_engine import ReasoningEngine
 from src.memory.session_logger import SessionLogger
@@ -283,6 +284,45 @@ async def test_reasoning_engine_mock():
     print("✅ Reasoning engine mock test passed")
 
 
+def test_calendar_conflict_detection():
+    """Test calendar conflict detection edge cases and alert order."""
+    monitor = CalendarMonitor()
+    day = datetime(2026, 1, 5)
+
+    def event(event_id, start, end):
+        return {
+            "id": event_id,
+            "summary": event_id.upper(),
+            "start": day + timedelta(hours=start),
+            "end": day + timedelta(hours=end)
+        }
+
+    # Deliberately not in start order
+    events = [
+        event("b", 10, 11),        # Starts when "a" ends: no conflict
+        event("a", 9, 10),
+        event("c", 9, 9.25),       # Shares its start with "a"
+        event("z", 9.5, 9.5),      # Zero-length, inside "a"
+        event("edge", 10, 10),     # Zero-length, on the a/b boundary but inside "d"
+        event("d", 9.75, 10.5),    # Overlaps both "a" and "b"
+    ]
+
+    conflicts = monitor._detect_conflicts(events)
+
+    # One alert per overlapping pair, ordered by the events' input
+    # positions, with the earlier event first
+    pairs = [(c.metadata["event1_id"], c.metadata["event2_id"]) for c in conflicts]
+    assert pairs == [("b", "d"), ("a", "c"), ("a", "z"), ("a", "d"), ("edge", "d")]
+    assert all(c.priority == "urgent" for c in conflicts)
+
+    # Back-to-back and zero-length events on a boundary never conflict
+    assert monitor._detect_conflicts([event("a", 9, 10), event("b", 10, 11)]) == []
+    assert monitor._detect_conflicts([event("a", 9, 10), event("z", 9, 9)]) == []
+    assert monitor._detect_conflicts([]) == []
+
+    print("✅ Calendar conflict detection test passed")
+
+
 async def main():
     """Run all tests."""
     print("=" * 60)
@@ -299,6 +339,7 @@ async def main():
         await test_scheduler_callback()
         await test_monitor_enable_disable()
         await test_reasoning_engine_mock()
+        test_calendar_conflict_detection()
 
         print()
         print("=" * 60)
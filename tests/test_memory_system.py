@@ -7,6 +7,9 @@ Run this to validate the memory system implementation.
 import asyncio
 import sys
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -291,6 +294,194 @@ async def test_full_workflow():
             return False
 
 
+@pytest.fixture
+def temp_db_path(tmp_path):
+    """Path for a throwaway database."""
+    return tmp_path / "sentinel.db"
+
+
+@pytest.fixture
+def temp_session_logger(tmp_path, temp_db_path):
+    """Session logger writing to a throwaway database and memory directory."""
+    return SessionLogger(
+        db=Database(temp_db_path),
+        markdown_manager=MarkdownManager(tmp_path / "memory")
+    )
+
+
+async def _committed_values(reader: Database) -> list[str]:
+    """Values visible to another connection, i.e. committed ones."""
+    rows = await reader.fetch_all("SELECT value FROM tx_test ORDER BY rowid")
+    return [row["value"] for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_database_transaction(temp_db_path):
+    """Test that transaction() defers commits across nested and overlapping blocks."""
+    async with Database(temp_db_path) as db, Database(temp_db_path) as reader:
+        await db.execute("CREATE TABLE tx_test (value TEXT)")
+        await db.commit()
+
+        # Nested blocks: only the outermost one commits
+        async with db.transaction():
+            await db.insert("tx_test", {"value": "a"})
+            async with db.transaction():
+                await db.insert("tx_test", {"value": "b"})
+            assert await _committed_values(reader) == []
+        assert await _committed_values(reader) == ["a", "b"]
+
+        # Overlapping blocks from two coroutines: the last to finish commits
+        second_entered = asyncio.Event()
+        first_done = asyncio.Event()
+
+        async def first():
+            async with db.transaction():
+                await db.insert("tx_test", {"value": "c"})
+                await second_entered.wait()
+            first_done.set()
+
+        async def second():
+            async with db.transaction():
+                second_entered.set()
+                await db.insert("tx_test", {"value": "d"})
+                await first_done.wait()
+                assert await _committed_values(reader) == ["a", "b"]
+
+        await asyncio.gather(first(), second())
+        assert await _committed_values(reader) == ["a", "b", "c", "d"]
+
+        # Writes made before an error are still committed
+        with pytest.raises(RuntimeError):
+            async with db.transaction():
+                await db.insert("tx_test", {"value": "e"})
+                raise RuntimeError("failed inside the block")
+
+        assert await _committed_values(reader) == ["a", "b", "c", "d", "e"]
+        assert db._transaction_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_session_logger_pipeline(temp_session_logger, temp_db_path):
+    """Test that log_message commits on its own and defers inside pipeline()."""
+    async with temp_session_logger as session_logger, Database(temp_db_path) as reader:
+        session = await session_logger.start_session(adapter="cli", user_id="test_user")
+
+        async def committed_count() -> int:
+            row = await reader.fetch_one(
+                "SELECT message_count FROM sessions WHERE id = ?", (session.id,)
+            )
+            return row["message_count"]
+
+        # A single message and its session update are committed together
+        await session_logger.log_user_message("first", session_id=session.id)
+        assert await committed_count() == 1
+
+        # Inside a pipeline nothing is committed until the block ends
+        async with session_logger.pipeline():
+            await session_logger.log_user_message("second", session_id=session.id)
+            await session_logger.log_assistant_message("third", session_id=session.id)
+            assert await committed_count() == 1
+
+        assert await committed_count() == 3
+
+
+@pytest.mark.asyncio
+async def test_log_messages_bulk(temp_session_logger):
+    """Test bulk logging across sessions: order, counts and rotation."""
+    async with temp_session_logger as session_logger:
+        first = await session_logger.start_session(adapter="slack", channel_id="C1", user_id="U1")
+        second = await session_logger.start_session(adapter="slack", channel_id="C2", user_id="U2")
+
+        def message(session, content):
+            return Message(session_id=session.id, role="user", content=content)
+
+        with patch.object(config, "MEMORY_MAX_SESSION_LENGTH", 4):
+            # Interleaved messages for two sessions, under the rotation limit
+            batch = [
+                message(first, "1"),
+                message(second, "2"),
+                message(first, "3"),
+                message(first, "4"),
+                message(second, "5"),
+            ]
+            await session_logger.log_messages_bulk(batch)
+
+            rows = await session_logger.db.fetch_all("SELECT id FROM messages ORDER BY rowid")
+            assert [row["id"] for row in rows] == [m.id for m in batch]
+
+            stored_first = await session_logger.get_session(first.id)
+            stored_second = await session_logger.get_session(second.id)
+            assert stored_first.message_count == 3
+            assert stored_second.message_count == 2
+            assert stored_first.last_activity == batch[3].timestamp
+            assert stored_second.last_activity == batch[4].timestamp
+            assert stored_first.status == stored_second.status == "active"
+
+            # The first session reaches the limit and is rotated
+            await session_logger.log_messages_bulk([message(first, "6"), message(second, "7")])
+
+            stored_first = await session_logger.get_session(first.id)
+            stored_second = await session_logger.get_session(second.id)
+            assert stored_first.message_count == 4
+            assert stored_first.status == "completed"
+            assert stored_second.message_count == 3
+            assert stored_second.status == "active"
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_session_lookup(temp_session_logger):
+    """Test tuple channel keys and the in-memory active-session lookup."""
+    async with temp_session_logger as session_logger:
+        # A (channel, thread_ts) key is stored joined with ':'
+        session = await session_logger.get_or_create_session(
+            adapter="slack", channel_id=("C1", "111.1"), user_id="U1"
+        )
+        assert (await session_logger.get_session(session.id)).channel_id == "C1:111.1"
+        again = await session_logger.get_or_create_session(
+            adapter="slack", channel_id=("C1", "111.1"), user_id="U1"
+        )
+        assert again.id == session.id
+
+        # A tuple key finds a session created with the joined string
+        existing = await session_logger.start_session(adapter="slack", channel_id="C2:222.2", user_id="U2")
+        found = await session_logger.get_or_create_session(
+            adapter="slack", channel_id=("C2", "222.2"), user_id="U2"
+        )
+        assert found.id == existing.id
+
+        # Ending a session evicts it, so the next call starts a new one
+        await session_logger.end_session(session.id)
+        assert session.id not in [s.id for s in session_logger._active.values()]
+        renewed = await session_logger.get_or_create_session(
+            adapter="slack", channel_id=("C1", "111.1"), user_id="U1"
+        )
+        assert renewed.id != session.id
+
+        # So does rotation at the maximum session length
+        with patch.object(config, "MEMORY_MAX_SESSION_LENGTH", 1):
+            await session_logger.log_user_message("hello", session_id=renewed.id)
+        assert renewed.id not in [s.id for s in session_logger._active.values()]
+        rotated = await session_logger.get_or_create_session(
+            adapter="slack", channel_id=("C1", "111.1"), user_id="U1"
+        )
+        assert rotated.id != renewed.id
+
+        # The lookup is bounded; evicted sessions are found in the database again
+        with patch("src.memory.session_logger.ACTIVE_SESSIONS_MAX", 2):
+            threads = [("C3", f"{i}.0") for i in range(3)]
+            sessions = [
+                await session_logger.get_or_create_session(adapter="slack", channel_id=thread, user_id="U3")
+                for thread in threads
+            ]
+            assert len(session_logger._active) == 2
+            assert ("slack", threads[0], "U3") not in session_logger._active
+
+            found = await session_logger.get_or_create_session(
+                adapter="slack", channel_id=threads[0], user_id="U3"
+            )
+            assert found.id == sessions[0].id
+
+
 async def main():
     """Run all tests."""
     logger.info("=" * 60)
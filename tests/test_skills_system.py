@@ -103,6 +103,19 @@ class TestSkillRegistry:
         assert is_valid, f"Validation failed: {issues}"
         assert len(issues) == 0
 
+    def test_validate_skill_cached(self):
+        """Test validation results are reused until rediscovery."""
+        registry = SkillRegistry()
+        registry.discover_skills()
+
+        is_valid, issues = registry.validate_skill('task-creator')
+        issues.append('caller mutation')
+        assert registry.validate_skill('task-creator') == (is_valid, [])
+        assert 'task-creator' in registry._validation_cache
+
+        registry.refresh()
+        assert registry._validation_cache == {}
+
     def test_get_stats(self):
         """Test registry statistics."""
         registry = SkillRegistry()
@@ -274,6 +287,25 @@ class TestDateParser:
 
         assert result == expected
 
+    def test_parse_weekday(self):
+        """Test parsing 'next <weekday>' and its short form."""
+        sys.path.insert(0, str(Path(__file__).parent.parent / '.claude' / 'skills' / 'task-creator'))
+        from date_parser import parse_due_date
+        from datetime import date
+
+        for text in ("Ship it next friday", "Ship it next fri"):
+            result = date.fromisoformat(parse_due_date(text))
+            assert result.weekday() == 4
+            assert 1 <= (result - date.today()).days <= 7
+
+    def test_parse_without_relative_date(self):
+        """Test text with no relative date falls through to ISO parsing."""
+        sys.path.insert(0, str(Path(__file__).parent.parent / '.claude' / 'skills' / 'task-creator'))
+        from date_parser import parse_due_date
+
+        assert parse_due_date("Call client") is None
+        assert parse_due_date("Submit report 2026-03-15") == '2026-03-15'
+
     def test_extract_task_parts(self):
         """Test extracting task components."""
         sys.path.insert(0, str(Path(__file__).parent.parent / '.claude' / 'skills' / 'task-creator'))
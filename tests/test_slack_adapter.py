@@ -0,0 +1,239 @@
+"""
+Test suite for the Slack adapter.
+
+Tests the Slack client without a real Slack connection: the socket
+handler and Web API calls are replaced with mocks.
+"""
+
+import asyncio
+import gc
+import pytest
+from contextlib import suppress
+from unittest.mock import AsyncMock, patch
+
+from slack_sdk.errors import SlackApiError
+
+from src.adapters.slack_client import SlackClient
+from src.adapters.slack_formatter import SlackFormatter
+from src.utils.config import config
+
+
+@pytest.fixture
+def session_logger():
+    """Session logger stub recording what the client writes."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def slack_client(session_logger):
+    """Slack client with fake tokens and a stubbed socket handler."""
+    with patch.object(config, "SLACK_BOT_TOKEN", "xoxb-test"), \
+         patch.object(config, "SLACK_SIGNING_SECRET", "test-secret"), \
+         patch.object(config, "SLACK_APP_TOKEN", "xapp-test"), \
+         patch("src.adapters.slack_client.AsyncSocketModeHandler") as handler_cls, \
+         patch("src.adapters.slack_client.get_session", AsyncMock(return_value=None)):
+        handler_cls.return_value.connect_async = AsyncMock()
+        handler_cls.return_value.close_async = AsyncMock()
+
+        client = SlackClient(session_logger=session_logger)
+        client.client.auth_test = AsyncMock(return_value={"user_id": "UBOT"})
+        yield client
+
+
+async def _wait_until_running(client: SlackClient) -> asyncio.Task:
+    """Start the client in the background and wait for it to connect."""
+    start_task = asyncio.create_task(client.start())
+    for _ in range(100):
+        if client.is_running:
+            return start_task
+        await asyncio.sleep(0.01)
+    raise AssertionError("Slack client did not start")
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_logs_and_inflight(slack_client, session_logger):
+    """Test that stop() finishes handlers and writes queued messages before closing."""
+    start_task = await _wait_until_running(slack_client)
+    assert slack_client.is_connected
+
+    # A handler still running at shutdown, which logs its reply when done
+    async def handler():
+        await asyncio.sleep(0.05)
+        slack_client._queue_log("assistant", "late reply", "s1", {})
+
+    handler_task = slack_client._spawn(handler())
+    slack_client._queue_log("user", "hello", "s1", {})
+
+    # Shut down the way SlackBot does: the blocking start() is cancelled first
+    start_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await start_task
+    await slack_client.stop()
+
+    assert handler_task.done()
+    assert not slack_client._inflight
+    assert slack_client._log_worker is None
+    assert not slack_client.is_running
+
+    logged = [
+        message.content
+        for call in session_logger.log_messages_bulk.await_args_list
+        for message in call.args[0]
+    ]
+    assert logged == ["hello", "late reply"]
+
+    # The logger is closed only after the last write
+    calls = [name for name, _, _ in session_logger.mock_calls]
+    assert calls.index("close") > max(i for i, name in enumerate(calls) if name == "log_messages_bulk")
+
+    print("✅ Slack client shutdown test passed")
+
+
+@pytest.mark.asyncio
+async def test_send_batching(slack_client):
+    """Test that text replies to the same thread are joined into as few posts as fit."""
+    posts = []
+
+    async def chat_post_message(**kwargs):
+        posts.append(kwargs)
+        return {"ok": True, "ts": str(len(posts)), "text": kwargs["text"]}
+
+    slack_client.client.chat_postMessage = AsyncMock(side_effect=chat_post_message)
+
+    long_text = "x" * 2000
+    fits_exactly = "y" * 999   # 2000 + "\n" + 999 == MAX_MESSAGE_LENGTH
+    responses = await asyncio.gather(
+        slack_client._send_message("C1", "first", "t1"),
+        slack_client._send_message("C1", long_text, "t2"),
+        slack_client._send_message("C1", "second", "t1"),
+        slack_client._send_message("C1", fits_exactly, "t2"),
+        slack_client._send_message("C1", "z", "t2"),
+        slack_client._send_message("C1", "card", "t1", blocks=[{"type": "divider"}]),
+    )
+
+    # Messages with blocks skip the buffer and are posted right away
+    assert posts[0]["text"] == "card"
+    assert posts[0]["blocks"] == [{"type": "divider"}]
+
+    # One buffer per thread, joined with newlines in send order
+    t1 = [post["text"] for post in posts if post["thread_ts"] == "t1" and post["blocks"] is None]
+    t2 = [post["text"] for post in posts if post["thread_ts"] == "t2"]
+    assert t1 == ["first\nsecond"]
+
+    # A text filling the limit exactly stays whole; one more character splits
+    assert t2 == [f"{long_text}\n{fits_exactly}", "z"]
+    assert len(t2[0]) == 3000
+    assert len(posts) == 4
+
+    # Each sender gets the response of the post carrying its text
+    assert [response["text"] for response in responses] == [
+        "first\nsecond", t2[0], "first\nsecond", t2[0], "z", "card"
+    ]
+    assert not slack_client._pending
+
+    print("✅ Slack send batching test passed")
+
+
+@pytest.mark.asyncio
+async def test_send_batching_error(slack_client):
+    """Test that a failed post raises only in senders whose texts were not posted."""
+    error = SlackApiError("channel_not_found", {"ok": False, "error": "channel_not_found"})
+    slack_client.client.chat_postMessage = AsyncMock(side_effect=error)
+
+    results = await asyncio.gather(
+        slack_client._send_message("C1", "first", "t1"),
+        slack_client._send_message("C1", "second", "t1"),
+        return_exceptions=True
+    )
+
+    assert results == [error, error]
+    assert slack_client.client.chat_postMessage.await_count == 1
+    assert not slack_client._pending
+
+    # When a batch takes several posts, the texts posted before the failure
+    # succeed and only the failed and unsent ones raise
+    slack_client.client.chat_postMessage = AsyncMock(side_effect=[{"ok": True}, error])
+    results = await asyncio.gather(
+        *(slack_client._send_message("C1", letter * 2000, "t1") for letter in "xyz"),
+        return_exceptions=True
+    )
+
+    assert results == [{"ok": True}, error, error]
+    assert slack_client.client.chat_postMessage.await_count == 2
+
+    # The next message opens a new batch instead of reusing the failed one
+    slack_client.client.chat_postMessage = AsyncMock(return_value={"ok": True})
+    assert await slack_client._send_message("C1", "retry", "t1") == {"ok": True}
+
+    print("✅ Slack send batching error test passed")
+
+
+@pytest.mark.asyncio
+async def test_send_batching_cancelled_sender(slack_client):
+    """Test that a failed post for a cancelled sender is not reported as unretrieved."""
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+
+    # A new error per call, so nothing outside the flush keeps it alive
+    async def chat_post_message(**kwargs):
+        raise SlackApiError("channel_not_found", {"ok": False, "error": "channel_not_found"})
+
+    slack_client.client.chat_postMessage = AsyncMock(side_effect=chat_post_message)
+    sender = asyncio.create_task(slack_client._send_message("C1", "hello", "t1"))
+    await asyncio.sleep(0)
+    sender.cancel()
+
+    await asyncio.gather(*slack_client._inflight)
+    del sender
+    gc.collect()
+
+    assert slack_client.client.chat_postMessage.await_count == 1
+    assert unhandled == []
+
+    print("✅ Slack cancelled sender test passed")
+
+
+def test_duplicate_events(slack_client):
+    """Test that redelivered events are dropped and old ones are forgotten."""
+    event = {"type": "message", "channel": "C1", "ts": "111.1"}
+
+    # Keyed by event_id when present
+    assert not slack_client._is_duplicate({"event_id": "Ev1"}, event)
+    assert slack_client._is_duplicate({"event_id": "Ev1"}, event)
+
+    # Falls back to type, channel and ts without an event_id
+    assert not slack_client._is_duplicate({}, event)
+    assert slack_client._is_duplicate({}, event)
+    assert not slack_client._is_duplicate({}, {**event, "ts": "111.2"})
+
+    # Only the most recent keys are kept; the oldest is forgotten first
+    with patch("src.adapters.slack_client._SEEN_MAX", 3):
+        slack_client._is_duplicate({"event_id": "Ev2"}, event)
+        assert len(slack_client._seen) == 3
+        assert not slack_client._is_duplicate({"event_id": "Ev1"}, event)
+        assert slack_client._is_duplicate({"event_id": "Ev2"}, event)
+
+    print("✅ Slack duplicate event test passed")
+
+
+def test_split_long_message():
+    """Test splitting around oversized paragraphs and at exact length limits."""
+    split = SlackFormatter.split_long_message
+
+    # An oversized paragraph is split by sentence; the paragraphs after it
+    # continue the chunk holding its last sentence while they fit
+    text = "First one. Second one. Third one\n\nNext\n\nLast para"
+    assert split(text, 20) == ["First one.", "Second one.", "Third one. Next", "Last para"]
+    assert split(text, 25) == ["First one. Second one.", "Third one. Next", "Last para"]
+
+    # Text at the limit is returned as is
+    assert split("a" * 20, 20) == ["a" * 20]
+
+    # Each paragraph counts with its two-character separator, so three
+    # paragraphs of 6 fit exactly in 24 characters but not in 23
+    text = "\n\n".join(letter * 6 for letter in "abcd")
+    assert split(text, 24) == ["aaaaaa\n\nbbbbbb\n\ncccccc", "dddddd"]
+    assert split(text, 23) == ["aaaaaa\n\nbbbbbb", "cccccc\n\ndddddd"]
+
+    print("✅ Slack message splitting test passed")